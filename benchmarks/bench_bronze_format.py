@@ -0,0 +1,70 @@
+"""Bronze format comparison: bronze bytes, write time and silver build time per BRONZE_FORMAT."""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+import duckdb
+
+from payments_pipeline.config.settings import Settings
+from payments_pipeline.load.writer import BronzeWriter
+from payments_pipeline.transform.models import SILVER_MODELS
+
+
+def _records(count: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "data": {
+                "id": f"ch_{i:08d}",
+                "object": "charge",
+                "created": 1_700_000_000 + i,
+                "amount": 1000 + i,
+                "currency": "usd",
+                "status": "succeeded",
+                "customer": f"cus_{i % 500:06d}",
+                "payment_intent": f"pi_{i:08d}",
+                "invoice": None,
+                "metadata": {"order_id": f"ord_{i}", "channel": "web"},
+            }
+        }
+        for i in range(count)
+    ]
+
+
+def _bench(fmt: str, records: list[dict[str, Any]], root: Path) -> tuple[int, float, float]:
+    settings = Settings(local_data_dir=root, bronze_format=fmt)
+    started = time.perf_counter()
+    BronzeWriter(settings).write_bronze_jsonl(
+        "charges", records, {"run_id": "bench", "dt": "2024-01-01"}
+    )
+    write_seconds = time.perf_counter() - started
+    bronze_bytes = sum(p.stat().st_size for p in (root / "bronze").rglob("part-*"))
+
+    spec = next(s for s in SILVER_MODELS if s.name == "charges")
+    conn = duckdb.connect()
+    started = time.perf_counter()
+    sql = spec.build_sql(conn, root).replace("{{LOCAL_DATA_DIR}}", root.as_posix())
+    conn.execute(sql)
+    silver_seconds = time.perf_counter() - started
+    return bronze_bytes, write_seconds, silver_seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=200_000)
+    args = parser.parse_args()
+
+    records = _records(args.records)
+    print(f"{'format':<8} {'bronze MiB':>11} {'write s':>8} {'silver s':>9}")
+    for fmt in ("jsonl", "parquet", "arrow"):
+        with tempfile.TemporaryDirectory() as tmp:
+            size, write_s, silver_s = _bench(fmt, records, Path(tmp))
+        print(f"{fmt:<8} {size / 2**20:>11.2f} {write_s:>8.3f} {silver_s:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
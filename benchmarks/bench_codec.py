@@ -0,0 +1,70 @@
+"""Per-record bronze serialization cost: stdlib json vs the pipeline codec."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from typing import Any
+
+from payments_pipeline.utils import codec
+
+
+def _records(count: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "data": {
+                "id": f"ch_{i:08d}",
+                "object": "charge",
+                "amount": 1000 + i,
+                "currency": "usd",
+                "customer": f"cus_{i % 500:06d}",
+                "status": "succeeded",
+                "created": 1_700_000_000 + i,
+                "metadata": {"order_id": f"ord_{i}", "note": "café"},
+            },
+            "meta": {"entity": "charges", "run_id": "bench", "ingested_at": "2024-01-01T00:00:00Z"},
+        }
+        for i in range(count)
+    ]
+
+
+def _stdlib_lines(rows: list[dict[str, Any]]) -> bytes:
+    body = "\n".join(json.dumps(row, default=str, sort_keys=True) for row in rows) + "\n"
+    return body.encode("utf-8")
+
+
+def _codec_lines(rows: list[dict[str, Any]]) -> bytes:
+    return codec.dumps_lines(rows, sort_keys=True, default=str)
+
+
+def _per_record_us(func: Any, rows: list[dict[str, Any]], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func(rows)
+        best = min(best, time.perf_counter() - started)
+    return best / len(rows) * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = _records(args.records)
+    before = _per_record_us(_stdlib_lines, rows, args.repeat)
+    after = _per_record_us(_codec_lines, rows, args.repeat)
+    encoded = _codec_lines(rows)
+    decode_before = _per_record_us(lambda r: [json.loads(x) for x in encoded.splitlines()], rows, 3)
+    decode_after = _per_record_us(lambda r: [codec.loads(x) for x in encoded.splitlines()], rows, 3)
+    print(f"backend={codec.BACKEND} records={args.records}")
+    print(f"encode stdlib json: {before:.2f} us/record")
+    print(f"encode codec:       {after:.2f} us/record ({before / after:.1f}x)")
+    print(f"decode stdlib json: {decode_before:.2f} us/record")
+    print(f"decode codec:       {decode_after:.2f} us/record ({decode_before / decode_after:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Local bronze part writes: legacy direct writes vs atomic FilesystemAdapter writes per fsync
+policy."""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from payments_pipeline.load.filesystem_adapter import FilesystemAdapter
+
+Items = list[tuple[str, bytes]]
+
+
+def _legacy(root: Path, items: Items) -> None:
+    # The pre-atomic write path: resolve, mkdir and write in place for every part.
+    for key, data in items:
+        target = (root / key).resolve()
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(data)
+
+
+def _sequential(policy: str) -> Callable[[Path, Items], None]:
+    def run(root: Path, items: Items) -> None:
+        fs = FilesystemAdapter(root, fsync=policy)
+        for key, data in items:
+            fs.put_bytes(key, data)
+        fs.sync()
+
+    return run
+
+
+def _batched(policy: str) -> Callable[[Path, Items], None]:
+    def run(root: Path, items: Items) -> None:
+        FilesystemAdapter(root, fsync=policy).put_many(items)
+
+    return run
+
+
+def _best_seconds(func: Callable[[Path, Items], None], items: Items, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory() as tmp:
+            started = time.perf_counter()
+            func(Path(tmp), items)
+            best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--parts", type=int, default=2_000)
+    parser.add_argument("--part-bytes", type=int, default=64 * 1024)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    body = b"x" * (args.part_bytes - 1) + b"\n"
+    items = [
+        (f"bronze/source=stripe/entity=charges/dt=2024-01-01/run_id=r1/part-{i:05d}.jsonl", body)
+        for i in range(args.parts)
+    ]
+    cases: list[tuple[str, Callable[[Path, Items], None]]] = [("legacy (non-atomic)", _legacy)]
+    for policy in ("none", "batch", "file"):
+        cases.append((f"put_bytes fsync={policy}", _sequential(policy)))
+        cases.append((f"put_many fsync={policy}", _batched(policy)))
+
+    print(f"{'mode':<22} {'seconds':>8} {'parts/s':>9}")
+    for label, func in cases:
+        elapsed = _best_seconds(func, items, args.repeat)
+        print(f"{label:<22} {elapsed:>8.3f} {args.parts / elapsed:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
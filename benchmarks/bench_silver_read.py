@@ -0,0 +1,81 @@
+"""Silver read time over a multi-day JSONL bronze history: typed read_json vs read_json_auto."""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+import duckdb
+
+from payments_pipeline.config.settings import Settings
+from payments_pipeline.extract.registry import ENTITY_REGISTRY
+from payments_pipeline.load.writer import BronzeWriter
+
+
+def _records(day: int, count: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "data": {
+                "id": f"ch_{day:04d}_{i:08d}",
+                "object": "charge",
+                "created": 1_700_000_000 + day * 86_400 + i,
+                "amount": 1000 + i,
+                "currency": "usd",
+                "status": "succeeded",
+                "customer": f"cus_{i % 500:06d}",
+                "payment_intent": f"pi_{day:04d}_{i:08d}",
+                # Invoices only appear on some days, which is what makes inference expensive.
+                "invoice": f"in_{i:08d}" if day % 7 == 0 else None,
+                "metadata": {"order_id": f"ord_{i}", "channel": "web"},
+            }
+        }
+        for i in range(count)
+    ]
+
+
+def _best_seconds(sql: str, root: Path, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        conn = duckdb.connect()
+        started = time.perf_counter()
+        conn.execute(sql.replace("{{LOCAL_DATA_DIR}}", root.as_posix()))
+        best = min(best, time.perf_counter() - started)
+        conn.close()
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--days", type=int, default=60)
+    parser.add_argument("--records-per-day", type=int, default=5_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    spec = ENTITY_REGISTRY["charges"]
+    typed = spec.silver_sql()
+    # The pre-registry-schema reader: sample every file and infer the union of types.
+    inferred = typed.replace("read_json(", "read_json_auto(").replace(
+        f"columns = {spec.bronze_json_columns}", "union_by_name = true"
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        writer = BronzeWriter(Settings(local_data_dir=root))
+        for day in range(args.days):
+            dt = f"2024-{1 + day // 28:02d}-{1 + day % 28:02d}"
+            writer.write_bronze_jsonl(
+                "charges", _records(day, args.records_per_day), {"run_id": "bench", "dt": dt}
+            )
+
+        rows = args.days * args.records_per_day
+        print(f"{'reader':<16} {'seconds':>8} {'rows/s':>11}")
+        for label, sql in (("read_json_auto", inferred), ("typed read_json", typed)):
+            elapsed = _best_seconds(sql, root, args.repeat)
+            print(f"{label:<16} {elapsed:>8.3f} {rows / elapsed:>11.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,26 +3,30 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import os
 import sys
-from dataclasses import asdict, dataclass
-from datetime import UTC, datetime
+from dataclasses import asdict, dataclass, replace
+from datetime import UTC, date, datetime
 from typing import Any
 
-from payments_pipeline.clients.mock_stripe import MockStripeClient
+from payments_pipeline.clients.async_stripe import AsyncMockStripeClient
+from payments_pipeline.clients.mock_stripe import ApiMetrics, MockStripeClient
 from payments_pipeline.config.logging import configure_logging, get_logger, set_run_context
 from payments_pipeline.config.settings import Settings, get_settings
-from payments_pipeline.extract.charges import ChargesExtractor
-from payments_pipeline.extract.customers import CustomersExtractor
-from payments_pipeline.extract.invoices import InvoicesExtractor
-from payments_pipeline.extract.payment_intents import PaymentIntentsExtractor
+from payments_pipeline.extract.async_driver import extract_entities_async
+from payments_pipeline.extract.backfill import BackfillCheckpoint, BackfillResult, run_backfill
+from payments_pipeline.extract.base import BaseExtractor, ExtractResult
+from payments_pipeline.extract.registry import ENTITY_ORDER, ENTITY_REGISTRY
+from payments_pipeline.extract.runner import ExtractRunOutcome, run_extractors
 from payments_pipeline.load.writer import BronzeWriter
 from payments_pipeline.quality.freshness import run_freshness_checks
 from payments_pipeline.quality.reconciliation import run_reconciliation
-from payments_pipeline.quality.schema import run_schema_checks
+from payments_pipeline.quality.schema import run_schema_checks, run_schema_drift
 from payments_pipeline.state.manifests import ManifestStore, write_run_manifest
-from payments_pipeline.transform.duckdb_runner import run_transforms
+from payments_pipeline.transform.duckdb_runner import FAILED_STATUSES, run_transforms
 from payments_pipeline.utils.ids import new_run_id
+from payments_pipeline.utils.retry import RetryBudget
 
 
 @dataclass(slots=True)
@@ -42,85 +46,180 @@ class RunContext:
         }
 
 
-def _build_extractors(settings: Settings) -> dict[str, Any]:
-    client = MockStripeClient(settings.mock_api_base_url)
-    writer = BronzeWriter(settings)
+def _new_retry_budget(settings: Settings) -> RetryBudget:
+    return RetryBudget(
+        ratio=settings.retry_budget_ratio, min_retries=settings.retry_budget_min_retries
+    )
+
+
+def _build_extractors(client: Any, writer: BronzeWriter) -> dict[str, Any]:
+    return {
+        name: BaseExtractor(client, writer, spec=ENTITY_REGISTRY[name]) for name in ENTITY_ORDER
+    }
+
+
+def _extract_summary(result: ExtractResult) -> dict[str, Any]:
     return {
-        "payment_intents": PaymentIntentsExtractor(client, writer),
-        "charges": ChargesExtractor(client, writer),
-        "invoices": InvoicesExtractor(client, writer),
-        "customers": CustomersExtractor(client, writer),
+        "entity": result.entity,
+        "records": result.records,
+        "pages": result.pages,
+        "api_calls": result.api_calls,
+        "cache_hits": result.cache_hits,
+        "retries": result.retries,
+        "failures": result.failures,
+        "throttle_seconds": result.throttle_seconds,
+        "overlap_ratio": result.overlap_ratio,
+        "producer_stalls": result.producer_stalls,
+        "consumer_stalls": result.consumer_stalls,
+        "bronze_paths": result.bronze_paths,
     }
 
 
 def cmd_run_batch(args: argparse.Namespace, run_context: RunContext) -> int:
     logger = get_logger(__name__)
-    extractors = _build_extractors(run_context.settings)
-    if args.entity not in extractors:
-        logger.error("invalid_entity", extra={"entity": args.entity})
-        return 2
-
-    result = extractors[args.entity].run(run_context.as_dict(), days=args.days)
+    budget = _new_retry_budget(run_context.settings)
+    with (
+        BronzeWriter(run_context.settings, retry_budget=budget) as writer,
+        MockStripeClient.from_settings(run_context.settings, retry_budget=budget) as client,
+    ):
+        extractors = _build_extractors(client, writer)
+        if args.entity not in extractors:
+            logger.error("invalid_entity", extra={"entity": args.entity})
+            return 2
+
+        result = extractors[args.entity].run(run_context.as_dict(), days=args.days)
     manifest = ManifestStore(run_context.settings.manifests_root)
     write_run_manifest(
         manifest,
         run_context.run_id,
         {
-            "extract": {
-                "entity": result.entity,
-                "records": result.records,
-                "pages": result.pages,
-                "api_calls": result.api_calls,
-                "retries": result.retries,
-                "failures": result.failures,
-                "bronze_paths": result.bronze_paths,
-            }
+            "extract": _extract_summary(result),
+            "api": asdict(client.metrics),
+            "uploads": writer.store.metrics.snapshot(),
+            "retry_budget": budget.snapshot(),
         },
     )
     return 0
 
 
+async def _run_all_async(
+    args: argparse.Namespace, run_context: RunContext, budget: RetryBudget, writer: BronzeWriter
+) -> tuple[ExtractRunOutcome, ApiMetrics]:
+    async with AsyncMockStripeClient.from_settings(
+        run_context.settings, retry_budget=budget
+    ) as client:
+        extractors = _build_extractors(client, writer)
+        outcome = await extract_entities_async(
+            extractors, ENTITY_ORDER, client, run_context.as_dict(), days=args.days
+        )
+    return outcome, client.metrics
+
+
 def cmd_run_all(args: argparse.Namespace, run_context: RunContext) -> int:
-    extractors = _build_extractors(run_context.settings)
-    results = []
-    for name in ["payment_intents", "charges", "invoices", "customers"]:
-        results.append(extractors[name].run(run_context.as_dict(), days=args.days))
+    budget = _new_retry_budget(run_context.settings)
+    with BronzeWriter(run_context.settings, retry_budget=budget) as writer:
+        if getattr(args, "use_async", False):
+            outcome, api_metrics = asyncio.run(_run_all_async(args, run_context, budget, writer))
+        else:
+            with MockStripeClient.from_settings(
+                run_context.settings, retry_budget=budget
+            ) as client:
+                extractors = _build_extractors(client, writer)
+                outcome = run_extractors(
+                    extractors,
+                    ENTITY_ORDER,
+                    run_context.as_dict(),
+                    days=args.days,
+                    parallel=getattr(args, "parallel", 1),
+                )
+            api_metrics = client.metrics
 
     manifest = ManifestStore(run_context.settings.manifests_root)
     write_run_manifest(
         manifest,
         run_context.run_id,
         {
-            "extract": [
-                {
-                    "entity": r.entity,
-                    "records": r.records,
-                    "pages": r.pages,
-                    "api_calls": r.api_calls,
-                    "retries": r.retries,
-                    "failures": r.failures,
-                    "bronze_paths": r.bronze_paths,
-                }
-                for r in results
-            ]
+            "extract": [_extract_summary(r) for r in outcome.results],
+            "extract_errors": outcome.errors,
+            "extract_wall_seconds": outcome.wall_seconds,
+            "api": asdict(api_metrics),
+            "uploads": writer.store.metrics.snapshot(),
+            "retry_budget": budget.snapshot(),
         },
     )
-    return 0
+    return 0 if outcome.ok else 1
+
+
+def cmd_backfill(args: argparse.Namespace, run_context: RunContext) -> int:
+    logger = get_logger(__name__)
+    settings = run_context.settings
+    start, end = date.fromisoformat(args.start), date.fromisoformat(args.end)
+    if end < start:
+        logger.error("invalid_backfill_range", extra={"start": args.start, "end": args.end})
+        return 2
+
+    # A restart reuses the checkpoint's run_id so resumed days append to the same partitions.
+    checkpoint = BackfillCheckpoint.load(settings.backfills_root, args.entity, start, end)
+    if checkpoint is None:
+        checkpoint = BackfillCheckpoint.create(
+            settings.backfills_root, args.entity, start, end, run_context.run_id
+        )
+    elif checkpoint.run_id != run_context.run_id:
+        logger.info(
+            "backfill_resumed",
+            extra={"entity": args.entity, "checkpoint_run_id": checkpoint.run_id},
+        )
+        run_context = replace(run_context, run_id=checkpoint.run_id)
+        set_run_context(run_id=run_context.run_id)
 
+    manifest = ManifestStore(settings.manifests_root)
+    budget = _new_retry_budget(settings)
+    with (
+        BronzeWriter(settings, retry_budget=budget) as writer,
+        MockStripeClient.from_settings(settings, retry_budget=budget) as client,
+    ):
+        extractor = _build_extractors(client, writer)[args.entity]
+
+        def _progress(progress: BackfillResult) -> None:
+            write_run_manifest(manifest, run_context.run_id, {"backfill": asdict(progress)})
+
+        result = run_backfill(
+            extractor,
+            run_context.as_dict(),
+            start=start,
+            end=end,
+            checkpoint=checkpoint,
+            workers=args.workers,
+            on_progress=_progress,
+        )
+    write_run_manifest(
+        manifest,
+        run_context.run_id,
+        {
+            "backfill": asdict(result),
+            "api": asdict(client.metrics),
+            "uploads": writer.store.metrics.snapshot(),
+            "retry_budget": budget.snapshot(),
+        },
+    )
+    return 0 if result.ok else 1
 
-def cmd_run_transforms(run_context: RunContext) -> int:
-    metrics = run_transforms(run_context.as_dict())
+
+def cmd_run_transforms(run_context: RunContext, *, full_refresh: bool = False) -> int:
+    metrics = run_transforms(run_context.as_dict(), full_refresh=full_refresh)
     manifest = ManifestStore(run_context.settings.manifests_root)
     write_run_manifest(
         manifest,
         run_context.run_id,
         {"transforms": [asdict(m) for m in metrics]},
     )
-    return 0
+    return 1 if any(m.status in FAILED_STATUSES for m in metrics) else 0
 
 
-def cmd_run_quality(run_context: RunContext) -> int:
+def cmd_run_quality(run_context: RunContext, *, drift_run_id: str | None = None) -> int:
+    # Drift is reported for one run's bronze partitions when given, otherwise for all of them.
     schema_results = run_schema_checks(run_context.settings.local_data_dir)
+    drift_results = run_schema_drift(run_context.settings.local_data_dir, run_id=drift_run_id)
     freshness_results = run_freshness_checks(ManifestStore(run_context.settings.manifests_root))
     recon_result = run_reconciliation(
         run_context.settings.local_data_dir, ManifestStore(run_context.settings.manifests_root)
@@ -139,6 +238,7 @@ def cmd_run_quality(run_context: RunContext) -> int:
         {
             "quality": {
                 "schema": [asdict(r) for r in schema_results],
+                "schema_drift": [asdict(r) for r in drift_results],
                 "freshness": [asdict(r) for r in freshness_results],
                 "reconciliation": asdict(recon_result),
             }
@@ -168,7 +268,21 @@ def cmd_run_pipeline(args: argparse.Namespace, run_context: RunContext) -> int:
     transform_exit = cmd_run_transforms(run_context)
     if transform_exit != 0:
         return transform_exit
-    return cmd_run_quality(run_context)
+    return cmd_run_quality(run_context, drift_run_id=run_context.run_id)
+
+
+def _add_extract_mode_args(parser: argparse.ArgumentParser) -> None:
+    # The async driver runs every entity on one event loop, so a thread count has no meaning.
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--parallel", type=int, default=1, help="Number of entities to extract concurrently"
+    )
+    mode.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="Extract all entities and slices on one asyncio event loop (excludes --parallel)",
+    )
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -179,18 +293,31 @@ def build_parser() -> argparse.ArgumentParser:
     sub = parser.add_subparsers(dest="command", required=True)
 
     p_batch = sub.add_parser("run-batch")
-    p_batch.add_argument(
-        "--entity", required=True, choices=["payment_intents", "charges", "invoices", "customers"]
-    )
+    p_batch.add_argument("--entity", required=True, choices=ENTITY_ORDER)
     p_batch.add_argument("--days", type=int, default=None)
 
     p_all = sub.add_parser("run-all")
     p_all.add_argument("--days", type=int, default=None)
+    _add_extract_mode_args(p_all)
+
+    p_backfill = sub.add_parser("backfill")
+    p_backfill.add_argument("--entity", required=True, choices=ENTITY_ORDER)
+    p_backfill.add_argument("--start", required=True, help="First day (YYYY-MM-DD, UTC)")
+    p_backfill.add_argument("--end", required=True, help="Last day, inclusive (YYYY-MM-DD, UTC)")
+    p_backfill.add_argument(
+        "--workers", type=int, default=4, help="Number of days to extract concurrently"
+    )
 
-    sub.add_parser("run-transforms")
+    p_transforms = sub.add_parser("run-transforms")
+    p_transforms.add_argument(
+        "--full-refresh",
+        action="store_true",
+        help="Rebuild silver from every bronze partition instead of only unconsumed ones",
+    )
     sub.add_parser("run-quality")
     p_pipeline = sub.add_parser("run-pipeline")
     p_pipeline.add_argument("--days", type=int, default=None)
+    _add_extract_mode_args(p_pipeline)
 
     p_wh = sub.add_parser("run-webhooks")
     p_wh.add_argument("--host", default="0.0.0.0")
@@ -221,10 +348,12 @@ def main(argv: list[str] | None = None) -> int:
         if args.command == "run-all":
             args.days = args.days or settings.default_days
             return cmd_run_all(args, run_context)
+        if args.command == "backfill":
+            return cmd_backfill(args, run_context)
         if args.command == "run-transforms":
-            return cmd_run_transforms(run_context)
+            return cmd_run_transforms(run_context, full_refresh=args.full_refresh)
         if args.command == "run-quality":
-            return cmd_run_quality(run_context)
+            return cmd_run_quality(run_context, drift_run_id=args.run_id or os.getenv("RUN_ID"))
         if args.command == "run-pipeline":
             return cmd_run_pipeline(args, run_context)
         if args.command == "run-webhooks":
@@ -0,0 +1,289 @@
+"""Asyncio HTTP client for the Stripe-like mock API."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from dataclasses import replace
+from typing import Any
+
+from payments_pipeline.clients.mock_stripe import (
+    ApiMetrics,
+    _is_overload,
+    _is_upstream_failure,
+    _retry_after_seconds,
+    is_transient_http_error,
+)
+from payments_pipeline.clients.page_cache import PageCache, page_cache_from_settings
+from payments_pipeline.clients.page_size import PageSizeController
+from payments_pipeline.clients.stripe_like_interface import (
+    ListPage,
+    add_page_metrics,
+    new_page_metrics,
+)
+from payments_pipeline.config.logging import get_logger
+from payments_pipeline.config.settings import Settings
+from payments_pipeline.utils import codec
+from payments_pipeline.utils.rate_limit import CircuitBreaker, TokenBucket
+from payments_pipeline.utils.retry import RetryBudget, RetryConfig, async_retry_call
+
+try:
+    import httpx
+except Exception:  # pragma: no cover
+    httpx = None  # type: ignore[assignment]
+
+
+class AsyncMockStripeClient:
+    def __init__(
+        self,
+        base_url: str,
+        timeout_seconds: int = 10,
+        *,
+        max_in_flight: int = 100,
+        transport: Any = None,
+        retry_budget: RetryBudget | None = None,
+        adaptive_page_size: bool = False,
+        min_page_size: int = 10,
+        max_page_size: int = 500,
+        page_latency_target_seconds: float = 1.0,
+        rate_limit_per_second: float = 0.0,
+        rate_limit_burst: int = 10,
+        circuit_failure_threshold: int = 0,
+        circuit_reset_seconds: float = 30.0,
+        retry_after_max_seconds: float = 60.0,
+        page_cache: PageCache | None = None,
+    ):
+        if httpx is None:
+            raise RuntimeError("httpx is required for the async client")
+        self.base_url = base_url.rstrip("/")
+        self.logger = get_logger(__name__)
+        self._metrics = ApiMetrics()
+        self.retry_budget = retry_budget
+        # The threaded client's rate limiter, circuit breaker, Retry-After handling, page cache
+        # and page-size controller. Hedging is not offered: a slow page here only holds one
+        # coroutine, and the other slices and entities keep the loop busy meanwhile.
+        self.rate_limiter = (
+            TokenBucket(rate_limit_per_second, rate_limit_burst)
+            if rate_limit_per_second > 0
+            else None
+        )
+        self.circuit = (
+            CircuitBreaker(circuit_failure_threshold, circuit_reset_seconds)
+            if circuit_failure_threshold > 0
+            else None
+        )
+        self.retry_after_max_seconds = retry_after_max_seconds
+        self.page_cache = page_cache
+        self.adaptive_page_size = adaptive_page_size
+        self._page_size_bounds = (min_page_size, max_page_size)
+        self._page_latency_target_seconds = page_latency_target_seconds
+        self._page_sizes: dict[str, PageSizeController] = {}
+        # One semaphore bounds page requests in flight across every entity and slice sharing
+        # this client; the connection pool is sized to match so permits never wait on sockets.
+        self._semaphore = asyncio.Semaphore(max_in_flight)
+        self._http = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=timeout_seconds,
+            transport=transport,
+            limits=httpx.Limits(
+                max_connections=max_in_flight, max_keepalive_connections=max_in_flight
+            ),
+        )
+
+    @classmethod
+    def from_settings(cls, settings: Settings, **kwargs: Any) -> AsyncMockStripeClient:
+        return cls(
+            settings.mock_api_base_url,
+            max_in_flight=settings.async_max_in_flight,
+            adaptive_page_size=settings.adaptive_page_size,
+            min_page_size=settings.adaptive_min_page_size,
+            max_page_size=settings.api_max_page_size,
+            page_latency_target_seconds=settings.page_latency_target_seconds,
+            rate_limit_per_second=settings.api_rate_limit_rps,
+            rate_limit_burst=settings.api_rate_limit_burst,
+            circuit_failure_threshold=settings.circuit_failure_threshold,
+            circuit_reset_seconds=settings.circuit_reset_seconds,
+            page_cache=page_cache_from_settings(settings),
+            **kwargs,
+        )
+
+    @property
+    def metrics(self) -> ApiMetrics:
+        snapshot = replace(self._metrics)
+        if self.circuit is not None:
+            snapshot.circuit_opened = self.circuit.open_count
+            snapshot.circuit_rejections = self.circuit.rejected
+        return snapshot
+
+    async def __aenter__(self) -> AsyncMockStripeClient:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
+
+    def page_size_controller(self, entity: str, initial: int) -> PageSizeController | None:
+        # As in the threaded client, a page cache pins the configured page size.
+        if not self.adaptive_page_size or self.page_cache is not None:
+            return None
+        controller = self._page_sizes.get(entity)
+        if controller is None:
+            minimum, maximum = self._page_size_bounds
+            controller = PageSizeController(
+                initial=initial,
+                minimum=minimum,
+                maximum=maximum,
+                target_latency_seconds=self._page_latency_target_seconds,
+            )
+            self._page_sizes[entity] = controller
+        return controller
+
+    async def list_entity(
+        self,
+        entity: str,
+        *,
+        created_gte: int | None,
+        created_lte: int | None,
+        starting_after: str | None,
+        limit: int,
+    ) -> ListPage:
+        params: dict[str, Any] = {
+            "created_gte": created_gte,
+            "created_lte": created_lte,
+            "starting_after": starting_after,
+            "limit": limit,
+        }
+        params = {k: v for k, v in params.items() if v is not None}
+        url = f"{self.base_url}/v1/{entity}"
+        cache_key: str | None = None
+        if self.page_cache is not None:
+            cache_key = self.page_cache.key(entity, created_gte, created_lte, starting_after, limit)
+            body = await asyncio.to_thread(self.page_cache.get, cache_key)
+            if body is None:
+                self._metrics.cache_misses += 1
+            else:
+                self._metrics.cache_hits += 1
+                self._metrics.cache_bytes_saved += len(body)
+                return ListPage.from_payload(
+                    entity,
+                    codec.loads(body),
+                    {"url": url, "status_code": 200, "cache": "hit", "limit": limit},
+                )
+        controller = self.page_size_controller(entity, limit)
+        timing = {"latency_seconds": 0.0, "throttle_seconds": 0.0}
+
+        async def _call() -> httpx.Response:
+            if self.circuit is not None:
+                self.circuit.before_call()
+            if self.rate_limiter is not None:
+                wait = self.rate_limiter.reserve()
+                timing["throttle_seconds"] += wait
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            started = time.perf_counter()
+            try:
+                async with self._semaphore:
+                    response = await self._http.get(f"/v1/{entity}", params=dict(params))
+                response.raise_for_status()
+            except httpx.HTTPError as exc:
+                if controller is not None and _is_overload(exc):
+                    params["limit"] = min(int(params["limit"]), controller.record_error())
+                if self.circuit is not None:
+                    if _is_upstream_failure(exc):
+                        self.circuit.record_failure()
+                    else:
+                        self.circuit.record_success()
+                raise
+            if self.circuit is not None:
+                self.circuit.record_success()
+            timing["latency_seconds"] = time.perf_counter() - started
+            return response
+
+        def _delay_hint(exc: Exception) -> float | None:
+            wait = _retry_after_seconds(exc, self.retry_after_max_seconds)
+            if wait is not None:
+                timing["throttle_seconds"] += wait
+            return wait
+
+        metrics: dict[str, int] = {}
+        try:
+            response = await async_retry_call(
+                _call,
+                retryable_exceptions=(httpx.HTTPError,),
+                config=RetryConfig(),
+                logger=self.logger,
+                metrics=metrics,
+                delay_hint=_delay_hint,
+                budget=self.retry_budget,
+                retry_if=is_transient_http_error,
+            )
+        finally:
+            self._metrics.throttle_seconds += timing["throttle_seconds"]
+            self._metrics.api_calls += 1
+            self._metrics.retries += metrics.get("retries", 0)
+            self._metrics.failures += metrics.get("failures", 0)
+        if controller is not None:
+            controller.observe(
+                latency_seconds=timing["latency_seconds"], retries=metrics.get("retries", 0)
+            )
+        if cache_key is not None and self.page_cache is not None:
+            await asyncio.to_thread(self.page_cache.put, cache_key, response.content)
+        request_meta = {
+            "url": str(response.url),
+            "status_code": response.status_code,
+            "retries": metrics.get("retries", 0),
+            "failures": metrics.get("failures", 0),
+            "limit": params["limit"],
+            "latency_seconds": round(timing["latency_seconds"], 4),
+            "throttle_seconds": round(timing["throttle_seconds"], 4),
+        }
+        if cache_key is not None:
+            request_meta["cache"] = "miss"
+        return ListPage.from_payload(entity, codec.loads(response.content), request_meta)
+
+    async def iter_pages(
+        self,
+        entity: str,
+        *,
+        created_gte: int | None,
+        created_lte: int | None,
+        limit: int,
+        starting_after: str | None = None,
+    ) -> AsyncIterator[ListPage]:
+        controller = self.page_size_controller(entity, limit)
+        while True:
+            if controller is not None:
+                limit = controller.next_limit()
+            page = await self.list_entity(
+                entity,
+                created_gte=created_gte,
+                created_lte=created_lte,
+                starting_after=starting_after,
+                limit=limit,
+            )
+            yield page
+            if not page.has_more or not page.next_cursor:
+                return
+            starting_after = page.next_cursor
+
+    async def iter_entity(
+        self,
+        entity: str,
+        *,
+        created_gte: int | None,
+        created_lte: int | None,
+        limit: int,
+    ) -> tuple[list[dict[str, Any]], dict[str, int]]:
+        all_records: list[dict[str, Any]] = []
+        metrics = new_page_metrics()
+
+        async for page in self.iter_pages(
+            entity, created_gte=created_gte, created_lte=created_lte, limit=limit
+        ):
+            add_page_metrics(metrics, page)
+            all_records.extend(page.data)
+
+        return all_records, metrics
@@ -2,14 +2,44 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from functools import partial
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
 
-from payments_pipeline.clients.stripe_like_interface import ListPage
+from payments_pipeline.clients.page_cache import PageCache, page_cache_from_settings
+from payments_pipeline.clients.page_size import PageSizeController
+from payments_pipeline.clients.stripe_like_interface import (
+    ListPage,
+    add_page_metrics,
+    new_page_metrics,
+)
 from payments_pipeline.config.logging import get_logger
-from payments_pipeline.utils.retry import RetryConfig, retry_call
+from payments_pipeline.config.settings import Settings
+from payments_pipeline.utils import codec
+from payments_pipeline.utils.rate_limit import CircuitBreaker, TokenBucket
+from payments_pipeline.utils.retry import (
+    LatencyTracker,
+    RetryBudget,
+    RetryConfig,
+    hedged_call,
+    retry_call,
+)
+
+try:
+    import httpx
+except Exception:  # pragma: no cover
+    httpx = None  # type: ignore[assignment]
 
 
 @dataclass(slots=True)
@@ -17,13 +47,290 @@ class ApiMetrics:
     api_calls: int = 0
     retries: int = 0
     failures: int = 0
+    connections_opened: int = 0
+    connections_reused: int = 0
+    throttle_seconds: float = 0.0
+    circuit_opened: int = 0
+    circuit_rejections: int = 0
+    hedges_sent: int = 0
+    hedge_wins: int = 0
+    # Hedges not sent because the rate limiter had no token to spare.
+    hedges_throttled: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    cache_bytes_saved: int = 0
+
+
+# The async client classifies httpx errors with the same helpers.
+_TIMEOUT_ERRORS: tuple[type[Exception], ...] = (requests.Timeout,)
+_CONNECT_ERRORS: tuple[type[Exception], ...] = (requests.ConnectionError,)
+if httpx is not None:
+    _TIMEOUT_ERRORS += (httpx.TimeoutException,)
+    _CONNECT_ERRORS += (httpx.ConnectError,)
+
+
+def _is_overload(exc: Exception) -> bool:
+    if isinstance(exc, _TIMEOUT_ERRORS):
+        return True
+    response = getattr(exc, "response", None)
+    return response is not None and response.status_code >= 500
+
+
+def _is_upstream_failure(exc: Exception) -> bool:
+    return isinstance(exc, _CONNECT_ERRORS) or _is_overload(exc)
+
+
+def is_transient_http_error(exc: Exception) -> bool:
+    # Transport errors, throttling and 5xx are transient; other 4xx responses will not change.
+    response = getattr(exc, "response", None)
+    return response is None or response.status_code == 429 or response.status_code >= 500
+
+
+def _retry_after_seconds(exc: Exception, cap: float) -> float | None:
+    response = getattr(exc, "response", None)
+    if response is None or response.status_code not in (429, 503):
+        return None
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = (parsedate_to_datetime(value) - datetime.now(tz=UTC)).total_seconds()
+        except (TypeError, ValueError):
+            return None
+    return min(max(0.0, seconds), cap)
+
+
+class _CountingHTTPConnection(HTTPConnection):
+    on_connect: Callable[[], None] | None = None
+
+    def connect(self) -> None:
+        if self.on_connect is not None:
+            self.on_connect()
+        super().connect()
+
+
+class _CountingHTTPSConnection(HTTPSConnection):
+    on_connect: Callable[[], None] | None = None
+
+    def connect(self) -> None:
+        if self.on_connect is not None:
+            self.on_connect()
+        super().connect()
+
+
+class _CountingPoolMixin:
+    # Hands the adapter's callback to every connection the pool creates.
+    def __init__(self, *args: Any, on_connect: Callable[[], None], **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.on_connect = on_connect
+
+    def _new_conn(self) -> Any:
+        conn = super()._new_conn()  # type: ignore[misc]
+        conn.on_connect = self.on_connect
+        return conn
+
+
+class _CountingHTTPPool(_CountingPoolMixin, HTTPConnectionPool):
+    ConnectionCls = _CountingHTTPConnection
+
+
+class _CountingHTTPSPool(_CountingPoolMixin, HTTPSConnectionPool):
+    ConnectionCls = _CountingHTTPSConnection
+
+
+class _PooledAdapter(HTTPAdapter):
+    # Swaps in pool classes whose connections report every TCP connect so reuse can be measured.
+    def __init__(self, on_connect: Callable[[], None], **kwargs: Any):
+        self._on_connect = on_connect
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": partial(_CountingHTTPPool, on_connect=self._on_connect),
+            "https": partial(_CountingHTTPSPool, on_connect=self._on_connect),
+        }
 
 
 class MockStripeClient:
-    def __init__(self, base_url: str, timeout_seconds: int = 10):
+    def __init__(
+        self,
+        base_url: str,
+        timeout_seconds: int = 10,
+        *,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        keep_alive: bool = True,
+        adaptive_page_size: bool = False,
+        min_page_size: int = 10,
+        max_page_size: int = 500,
+        page_latency_target_seconds: float = 1.0,
+        rate_limit_per_second: float = 0.0,
+        rate_limit_burst: int = 10,
+        circuit_failure_threshold: int = 0,
+        circuit_reset_seconds: float = 30.0,
+        retry_after_max_seconds: float = 60.0,
+        hedge_percentile: float = 0.0,
+        hedge_min_samples: int = 20,
+        retry_budget: RetryBudget | None = None,
+        page_cache: PageCache | None = None,
+    ):
         self.base_url = base_url.rstrip("/")
         self.timeout_seconds = timeout_seconds
         self.logger = get_logger(__name__)
+        self._lock = threading.Lock()
+        self._metrics = ApiMetrics()
+        self._requests_sent = 0
+        self.adaptive_page_size = adaptive_page_size
+        self._page_size_bounds = (min_page_size, max_page_size)
+        self._page_latency_target_seconds = page_latency_target_seconds
+        self._page_sizes: dict[str, PageSizeController] = {}
+        self.page_cache = page_cache
+        # Shared by every thread using this client, so the request budget and the failure
+        # count cover all entities and slices together.
+        self.rate_limiter = (
+            TokenBucket(rate_limit_per_second, rate_limit_burst)
+            if rate_limit_per_second > 0
+            else None
+        )
+        self.circuit = (
+            CircuitBreaker(circuit_failure_threshold, circuit_reset_seconds)
+            if circuit_failure_threshold > 0
+            else None
+        )
+        self.retry_after_max_seconds = retry_after_max_seconds
+        self.retry_budget = retry_budget
+        self.hedge_percentile = hedge_percentile
+        self._latency = LatencyTracker(min_samples=hedge_min_samples)
+        self._hedge_pool = (
+            ThreadPoolExecutor(max_workers=pool_maxsize * 2, thread_name_prefix="hedge")
+            if hedge_percentile > 0
+            else None
+        )
+
+        # A single Session is shared by all extractor threads: urllib3 pools are thread-safe and
+        # `pool_block` caps concurrent connections per host at `pool_maxsize`.
+        self.session = requests.Session()
+        adapter = _PooledAdapter(
+            self._record_new_connection,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=True,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
+
+    @classmethod
+    def from_settings(
+        cls, settings: Settings, *, retry_budget: RetryBudget | None = None
+    ) -> MockStripeClient:
+        return cls(
+            settings.mock_api_base_url,
+            pool_connections=settings.http_pool_connections,
+            pool_maxsize=settings.http_pool_maxsize,
+            keep_alive=settings.http_keep_alive,
+            adaptive_page_size=settings.adaptive_page_size,
+            min_page_size=settings.adaptive_min_page_size,
+            max_page_size=settings.api_max_page_size,
+            page_latency_target_seconds=settings.page_latency_target_seconds,
+            rate_limit_per_second=settings.api_rate_limit_rps,
+            rate_limit_burst=settings.api_rate_limit_burst,
+            circuit_failure_threshold=settings.circuit_failure_threshold,
+            circuit_reset_seconds=settings.circuit_reset_seconds,
+            hedge_percentile=settings.hedge_percentile,
+            hedge_min_samples=settings.hedge_min_samples,
+            retry_budget=retry_budget,
+            page_cache=page_cache_from_settings(settings),
+        )
+
+    def __enter__(self) -> MockStripeClient:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._hedge_pool is not None:
+            self._hedge_pool.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
+
+    @property
+    def metrics(self) -> ApiMetrics:
+        with self._lock:
+            snapshot = replace(self._metrics)
+            snapshot.connections_reused = max(
+                0, self._requests_sent - self._metrics.connections_opened
+            )
+        if self.circuit is not None:
+            snapshot.circuit_opened = self.circuit.open_count
+            snapshot.circuit_rejections = self.circuit.rejected
+        return snapshot
+
+    def _record_new_connection(self) -> None:
+        with self._lock:
+            self._metrics.connections_opened += 1
+
+    def page_size_controller(self, entity: str, initial: int) -> PageSizeController | None:
+        # Cached pages are keyed on the requested limit, so a latency-driven limit would make
+        # recordings unreplayable; the cache pins the configured page size.
+        if not self.adaptive_page_size or self.page_cache is not None:
+            return None
+        with self._lock:
+            controller = self._page_sizes.get(entity)
+            if controller is None:
+                minimum, maximum = self._page_size_bounds
+                controller = PageSizeController(
+                    initial=initial,
+                    minimum=minimum,
+                    maximum=maximum,
+                    target_latency_seconds=self._page_latency_target_seconds,
+                )
+                self._page_sizes[entity] = controller
+            return controller
+
+    def _record_hedge(self) -> None:
+        with self._lock:
+            self._metrics.hedges_sent += 1
+
+    def _acquire_hedge(self) -> bool:
+        # A hedge is an extra request, so it needs its own rate-limit token; rather than wait
+        # for one (which would defeat the point of hedging) it is skipped.
+        if self.rate_limiter is None or self.rate_limiter.try_acquire():
+            return True
+        with self._lock:
+            self._metrics.hedges_throttled += 1
+        return False
+
+    def _send(self, url: str, params: dict[str, Any]) -> requests.Response:
+        # With hedging on, a page slower than the configured latency percentile gets a duplicate
+        # request; whichever response arrives first is used.
+        def _get() -> requests.Response:
+            with self._lock:
+                self._requests_sent += 1
+            started = time.perf_counter()
+            response = self.session.get(url, params=params, timeout=self.timeout_seconds)
+            response.raise_for_status()
+            self._latency.record(time.perf_counter() - started)
+            return response
+
+        if self._hedge_pool is None:
+            return _get()
+        response, hedge_won = hedged_call(
+            _get,
+            hedge_after_seconds=self._latency.percentile(self.hedge_percentile),
+            executor=self._hedge_pool,
+            on_hedge=self._record_hedge,
+            acquire_hedge=self._acquire_hedge,
+        )
+        if hedge_won:
+            with self._lock:
+                self._metrics.hedge_wins += 1
+        return response
 
     def list_entity(
         self,
@@ -42,51 +349,105 @@ class MockStripeClient:
         }
         params = {k: v for k, v in params.items() if v is not None}
         url = f"{self.base_url}/v1/{entity}"
+        cache_key: str | None = None
+        if self.page_cache is not None:
+            cache_key = self.page_cache.key(entity, created_gte, created_lte, starting_after, limit)
+            body = self.page_cache.get(cache_key)
+            with self._lock:
+                if body is None:
+                    self._metrics.cache_misses += 1
+                else:
+                    self._metrics.cache_hits += 1
+                    self._metrics.cache_bytes_saved += len(body)
+            if body is not None:
+                return ListPage.from_payload(
+                    entity,
+                    codec.loads(body),
+                    {"url": url, "status_code": 200, "cache": "hit", "limit": limit},
+                )
+        controller = self.page_size_controller(entity, limit)
+        timing = {"latency_seconds": 0.0, "throttle_seconds": 0.0}
 
         def _call() -> requests.Response:
-            response = requests.get(url, params=params, timeout=self.timeout_seconds)
-            response.raise_for_status()
+            if self.circuit is not None:
+                self.circuit.before_call()
+            if self.rate_limiter is not None:
+                timing["throttle_seconds"] += self.rate_limiter.acquire()
+            started = time.perf_counter()
+            try:
+                response = self._send(url, dict(params))
+            except requests.RequestException as exc:
+                if controller is not None and _is_overload(exc):
+                    params["limit"] = min(int(params["limit"]), controller.record_error())
+                if self.circuit is not None:
+                    # Any other error (a 4xx) still means the API answered, which also ends
+                    # a half-open probe.
+                    if _is_upstream_failure(exc):
+                        self.circuit.record_failure()
+                    else:
+                        self.circuit.record_success()
+                raise
+            if self.circuit is not None:
+                self.circuit.record_success()
+            timing["latency_seconds"] = time.perf_counter() - started
             return response
 
+        def _delay_hint(exc: Exception) -> float | None:
+            wait = _retry_after_seconds(exc, self.retry_after_max_seconds)
+            if wait is not None:
+                timing["throttle_seconds"] += wait
+            return wait
+
         metrics: dict[str, int] = {}
-        response = retry_call(
-            _call,
-            retryable_exceptions=(requests.RequestException,),
-            config=RetryConfig(),
-            logger=self.logger,
-            metrics=metrics,
-        )
-        payload = response.json()
-        data = payload.get("data", [])
-        has_more = bool(payload.get("has_more", False))
-        next_cursor = data[-1]["id"] if has_more and data else None
+        try:
+            response = retry_call(
+                _call,
+                retryable_exceptions=(requests.RequestException,),
+                config=RetryConfig(),
+                logger=self.logger,
+                metrics=metrics,
+                delay_hint=_delay_hint,
+                budget=self.retry_budget,
+                retry_if=is_transient_http_error,
+            )
+        finally:
+            with self._lock:
+                self._metrics.throttle_seconds += timing["throttle_seconds"]
+                self._metrics.api_calls += 1
+                self._metrics.retries += metrics.get("retries", 0)
+                self._metrics.failures += metrics.get("failures", 0)
+        if controller is not None:
+            controller.observe(
+                latency_seconds=timing["latency_seconds"], retries=metrics.get("retries", 0)
+            )
+        if cache_key is not None and self.page_cache is not None:
+            self.page_cache.put(cache_key, response.content)
         request_meta = {
             "url": str(response.url),
             "status_code": response.status_code,
             "retries": metrics.get("retries", 0),
             "failures": metrics.get("failures", 0),
+            "limit": params["limit"],
+            "latency_seconds": round(timing["latency_seconds"], 4),
+            "throttle_seconds": round(timing["throttle_seconds"], 4),
         }
-        return ListPage(
-            entity=entity,
-            data=data,
-            has_more=has_more,
-            next_cursor=next_cursor,
-            request_meta=request_meta,
-        )
+        if cache_key is not None:
+            request_meta["cache"] = "miss"
+        return ListPage.from_payload(entity, codec.loads(response.content), request_meta)
 
-    def iter_entity(
+    def iter_pages(
         self,
         entity: str,
         *,
         created_gte: int | None,
         created_lte: int | None,
         limit: int,
-    ) -> tuple[list[dict[str, Any]], dict[str, int]]:
-        starting_after: str | None = None
-        all_records: list[dict[str, Any]] = []
-        metrics = {"api_calls": 0, "retries": 0, "failures": 0, "pages": 0}
-
+        starting_after: str | None = None,
+    ) -> Iterator[ListPage]:
+        controller = self.page_size_controller(entity, limit)
         while True:
+            if controller is not None:
+                limit = controller.next_limit()
             page = self.list_entity(
                 entity,
                 created_gte=created_gte,
@@ -94,13 +455,26 @@ class MockStripeClient:
                 starting_after=starting_after,
                 limit=limit,
             )
-            metrics["api_calls"] += 1
-            metrics["pages"] += 1
-            metrics["retries"] += int(page.request_meta.get("retries", 0))
-            metrics["failures"] += int(page.request_meta.get("failures", 0))
-            all_records.extend(page.data)
+            yield page
             if not page.has_more or not page.next_cursor:
-                break
+                return
             starting_after = page.next_cursor
 
+    def iter_entity(
+        self,
+        entity: str,
+        *,
+        created_gte: int | None,
+        created_lte: int | None,
+        limit: int,
+    ) -> tuple[list[dict[str, Any]], dict[str, int]]:
+        all_records: list[dict[str, Any]] = []
+        metrics = new_page_metrics()
+
+        for page in self.iter_pages(
+            entity, created_gte=created_gte, created_lte=created_lte, limit=limit
+        ):
+            add_page_metrics(metrics, page)
+            all_records.extend(page.data)
+
         return all_records, metrics
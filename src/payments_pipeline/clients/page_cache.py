@@ -0,0 +1,108 @@
+"""On-disk record/replay cache for list API pages."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+from pathlib import Path
+
+from payments_pipeline.config.settings import Settings
+
+
+class PageCacheMiss(LookupError):
+    pass
+
+
+class PageCache:
+    def __init__(
+        self,
+        root: Path,
+        *,
+        ttl_seconds: float = 3600.0,
+        max_bytes: int = 256 * 1024 * 1024,
+        replay: bool = False,
+    ):
+        self.root = root
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.replay = replay
+        self._lock = threading.Lock()
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._total_bytes = sum(path.stat().st_size for path in self._entries())
+
+    @staticmethod
+    def key(
+        entity: str,
+        created_gte: int | None,
+        created_lte: int | None,
+        starting_after: str | None,
+        limit: int,
+    ) -> str:
+        raw = json.dumps([entity, created_gte, created_lte, starting_after, limit])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def _entries(self) -> list[Path]:
+        return [path for path in self.root.glob("*/*.json") if path.is_file()]
+
+    def get(self, key: str) -> bytes | None:
+        # Replay mode ignores the TTL: recorded pages are the source of truth for benchmarks and
+        # CI, and a miss is an error rather than a silent live call.
+        path = self._path(key)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            if self.replay:
+                raise PageCacheMiss(f"no recorded page for key {key}") from None
+            return None
+        if not self.replay and time.time() - stat.st_mtime > self.ttl_seconds:
+            return None
+        body = path.read_bytes()
+        os.utime(path, (time.time(), stat.st_mtime))
+        return body
+
+    def put(self, key: str, body: bytes) -> None:
+        if self.replay:
+            return
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        tmp.write_bytes(body)
+        with self._lock:
+            previous = path.stat().st_size if path.exists() else 0
+            tmp.replace(path)
+            self._total_bytes += len(body) - previous
+            if self._total_bytes > self.max_bytes:
+                self._evict_locked()
+
+    def _evict_locked(self) -> None:
+        # Least recently read first: `get` bumps atime, and entries are ordered by the newer of
+        # atime/mtime so stale recordings go before pages a replay keeps touching.
+        entries = []
+        for path in self._entries():
+            stat = path.stat()
+            entries.append((max(stat.st_atime, stat.st_mtime), stat.st_size, path))
+        entries.sort()
+        for _, size, path in entries:
+            if self._total_bytes <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            self._total_bytes -= size
+
+
+def page_cache_from_settings(settings: Settings) -> PageCache | None:
+    """The page cache configured by `PAGE_CACHE_MODE`, or None when it is off."""
+    if settings.page_cache_mode == "off":
+        return None
+    return PageCache(
+        settings.page_cache_root,
+        ttl_seconds=settings.page_cache_ttl_seconds,
+        max_bytes=settings.page_cache_max_bytes,
+        replay=settings.page_cache_mode == "replay",
+    )
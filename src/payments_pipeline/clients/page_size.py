@@ -0,0 +1,47 @@
+"""Adaptive page-size control driven by observed page latency and errors."""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True)
+class PageSizeController:
+    initial: int
+    minimum: int = 10
+    maximum: int = 500
+    target_latency_seconds: float = 1.0
+    growth_factor: float = 1.5
+    # Errors back off hard; pages that are merely slower than the target shrink gently.
+    shrink_factor: float = 0.5
+    slow_shrink_factor: float = 0.75
+    current: int = field(init=False)
+    _lock: threading.Lock = field(init=False, repr=False, default_factory=threading.Lock)
+
+    def __post_init__(self) -> None:
+        self.minimum = max(1, min(self.minimum, self.maximum))
+        self.current = self._clamp(self.initial)
+
+    def _clamp(self, value: float) -> int:
+        return max(self.minimum, min(self.maximum, int(value)))
+
+    def next_limit(self) -> int:
+        with self._lock:
+            return self.current
+
+    def record_error(self) -> int:
+        # Timeouts and 5xx responses: back off multiplicatively so the retry asks for less.
+        with self._lock:
+            self.current = self._clamp(self.current * self.shrink_factor)
+            return self.current
+
+    def observe(self, *, latency_seconds: float, retries: int) -> int:
+        # Healthy, fast pages grow the limit toward the API maximum; slow pages shrink it
+        # gently; pages in between hold the current size.
+        with self._lock:
+            if retries == 0 and latency_seconds < self.target_latency_seconds / 2:
+                self.current = self._clamp(self.current * self.growth_factor)
+            elif latency_seconds > self.target_latency_seconds:
+                self.current = self._clamp(self.current * self.slow_shrink_factor)
+            return self.current
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Iterator
 from dataclasses import dataclass
 from typing import Any, Protocol
 
@@ -14,6 +15,44 @@ class ListPage:
     next_cursor: str | None
     request_meta: dict[str, Any]
 
+    @classmethod
+    def from_payload(
+        cls, entity: str, payload: dict[str, Any], request_meta: dict[str, Any]
+    ) -> ListPage:
+        data = payload.get("data", [])
+        has_more = bool(payload.get("has_more", False))
+        next_cursor = data[-1]["id"] if has_more and data else None
+        return cls(
+            entity=entity,
+            data=data,
+            has_more=has_more,
+            next_cursor=next_cursor,
+            request_meta=request_meta,
+        )
+
+
+def new_page_metrics() -> dict[str, int]:
+    return {
+        "api_calls": 0,
+        "cache_hits": 0,
+        "retries": 0,
+        "failures": 0,
+        "pages": 0,
+        "throttle_ms": 0,
+    }
+
+
+def add_page_metrics(metrics: dict[str, int], page: ListPage) -> None:
+    # Pages served from the page cache never reached the API.
+    if page.request_meta.get("cache") == "hit":
+        metrics["cache_hits"] += 1
+    else:
+        metrics["api_calls"] += 1
+    metrics["pages"] += 1
+    metrics["retries"] += int(page.request_meta.get("retries", 0))
+    metrics["failures"] += int(page.request_meta.get("failures", 0))
+    metrics["throttle_ms"] += round(float(page.request_meta.get("throttle_seconds", 0.0)) * 1000)
+
 
 class StripeLikeClient(Protocol):
     def list_entity(
@@ -26,6 +65,16 @@ class StripeLikeClient(Protocol):
         limit: int,
     ) -> ListPage: ...
 
+    def iter_pages(
+        self,
+        entity: str,
+        *,
+        created_gte: int | None,
+        created_lte: int | None,
+        limit: int,
+        starting_after: str | None = None,
+    ) -> Iterator[ListPage]: ...
+
     def iter_entity(
         self,
         entity: str,
@@ -34,3 +83,34 @@ class StripeLikeClient(Protocol):
         created_lte: int | None,
         limit: int,
     ) -> tuple[list[dict[str, Any]], dict[str, int]]: ...
+
+
+class AsyncStripeLikeClient(Protocol):
+    async def list_entity(
+        self,
+        entity: str,
+        *,
+        created_gte: int | None,
+        created_lte: int | None,
+        starting_after: str | None,
+        limit: int,
+    ) -> ListPage: ...
+
+    def iter_pages(
+        self,
+        entity: str,
+        *,
+        created_gte: int | None,
+        created_lte: int | None,
+        limit: int,
+        starting_after: str | None = None,
+    ) -> AsyncIterator[ListPage]: ...
+
+    async def iter_entity(
+        self,
+        entity: str,
+        *,
+        created_gte: int | None,
+        created_lte: int | None,
+        limit: int,
+    ) -> tuple[list[dict[str, Any]], dict[str, int]]: ...
@@ -4,12 +4,12 @@ from __future__ import annotations
 
 import hashlib
 import hmac
-import json
 import time
 from dataclasses import dataclass
 from typing import Any
 
 from payments_pipeline.config.logging import get_logger
+from payments_pipeline.utils import codec
 from payments_pipeline.utils.ids import stable_hash_id
 
 
@@ -66,13 +66,20 @@ def verify_signature(
     return True
 
 
-def extract_event_id(payload_bytes: bytes) -> str:
+def parse_event(payload_bytes: bytes) -> tuple[str, dict[str, Any] | None]:
+    # Decodes the body once so the handler can reuse the parsed event when storing it.
     try:
-        payload: dict[str, Any] = json.loads(payload_bytes.decode("utf-8"))
-    except (UnicodeDecodeError, json.JSONDecodeError):
-        return stable_hash_id(payload_bytes)
+        payload = codec.loads(payload_bytes)
+    except codec.DecodeError:
+        return stable_hash_id(payload_bytes), None
+    if not isinstance(payload, dict):
+        return stable_hash_id(payload_bytes), None
 
     event_id = payload.get("id")
     if isinstance(event_id, str) and event_id.strip():
-        return event_id
-    return stable_hash_id(payload_bytes)
+        return event_id, payload
+    return stable_hash_id(payload_bytes), payload
+
+
+def extract_event_id(payload_bytes: bytes) -> str:
+    return parse_event(payload_bytes)[0]
@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import contextvars
-import json
 import logging
 from datetime import UTC, datetime
 from typing import Any
 
+from payments_pipeline.utils import codec
+
 _RUN_ID: contextvars.ContextVar[str | None] = contextvars.ContextVar("run_id", default=None)
 _CORR_ID: contextvars.ContextVar[str | None] = contextvars.ContextVar(
     "correlation_id", default=None
@@ -56,7 +57,7 @@ class JsonLogFormatter(logging.Formatter):
                 continue
             if key not in payload:
                 payload[key] = value
-        return json.dumps(payload, default=str)
+        return codec.dumps(payload, default=str).decode("utf-8")
 
 
 class ContextFilter(logging.Filter):
@@ -5,7 +5,7 @@ from __future__ import annotations
 from functools import lru_cache
 from pathlib import Path
 
-from pydantic import Field, field_validator
+from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -21,11 +21,69 @@ class Settings(BaseSettings):
     local_data_dir: Path = Field(default=Path("./data"), alias="LOCAL_DATA_DIR")
     s3_bucket: str | None = Field(default=None, alias="S3_BUCKET")
     aws_region: str = Field(default="us-east-1", alias="AWS_REGION")
+    # LOCAL writes: none | file (fsync every object) | batch (fsync once before the sidecar).
+    fs_fsync: str = Field(default="batch", alias="FS_FSYNC")
+    fs_write_workers: int = Field(default=8, alias="FS_WRITE_WORKERS", ge=1)
+    # Transform DAG: models run concurrently on this many workers, each on its own connection;
+    # the shared DuckDB pool gets TRANSFORM_WORKERS * TRANSFORM_THREADS_PER_MODEL threads.
+    transform_workers: int = Field(default=4, alias="TRANSFORM_WORKERS", ge=1)
+    transform_threads_per_model: int = Field(default=1, alias="TRANSFORM_THREADS_PER_MODEL", ge=1)
+    s3_max_pool_connections: int = Field(default=16, alias="S3_MAX_POOL_CONNECTIONS", ge=1)
+    s3_upload_workers: int = Field(default=8, alias="S3_UPLOAD_WORKERS", ge=1)
+    s3_multipart_threshold_bytes: int = Field(
+        default=16 * 1024 * 1024, alias="S3_MULTIPART_THRESHOLD_BYTES", ge=5 * 1024 * 1024
+    )
+    s3_multipart_part_bytes: int = Field(
+        default=8 * 1024 * 1024, alias="S3_MULTIPART_PART_BYTES", ge=5 * 1024 * 1024
+    )
     mock_api_base_url: str = Field(default="http://127.0.0.1:8001", alias="MOCK_API_BASE_URL")
 
     safety_window_seconds: int = Field(default=300, alias="SAFETY_WINDOW_SECONDS", ge=0)
     default_days: int = Field(default=1, alias="DEFAULT_DAYS", ge=1)
     max_page_size: int = Field(default=100, alias="MAX_PAGE_SIZE", ge=1, le=500)
+    adaptive_page_size: bool = Field(default=False, alias="ADAPTIVE_PAGE_SIZE")
+    adaptive_min_page_size: int = Field(default=10, alias="ADAPTIVE_MIN_PAGE_SIZE", ge=1, le=500)
+    api_max_page_size: int = Field(default=500, alias="API_MAX_PAGE_SIZE", ge=1, le=500)
+    page_latency_target_seconds: float = Field(
+        default=1.0, alias="PAGE_LATENCY_TARGET_SECONDS", gt=0
+    )
+    api_rate_limit_rps: float = Field(default=0.0, alias="API_RATE_LIMIT_RPS", ge=0)
+    api_rate_limit_burst: int = Field(default=10, alias="API_RATE_LIMIT_BURST", ge=1)
+    circuit_failure_threshold: int = Field(default=0, alias="CIRCUIT_FAILURE_THRESHOLD", ge=0)
+    circuit_reset_seconds: float = Field(default=30.0, alias="CIRCUIT_RESET_SECONDS", gt=0)
+    hedge_percentile: float = Field(default=0.0, alias="HEDGE_PERCENTILE", ge=0, le=100)
+    hedge_min_samples: int = Field(default=20, alias="HEDGE_MIN_SAMPLES", ge=1)
+    retry_budget_ratio: float = Field(default=0.1, alias="RETRY_BUDGET_RATIO", ge=0)
+    retry_budget_min_retries: int = Field(default=10, alias="RETRY_BUDGET_MIN_RETRIES", ge=0)
+    http_pool_connections: int = Field(default=10, alias="HTTP_POOL_CONNECTIONS", ge=1)
+    http_pool_maxsize: int = Field(default=10, alias="HTTP_POOL_MAXSIZE", ge=1)
+    http_keep_alive: bool = Field(default=True, alias="HTTP_KEEP_ALIVE")
+    # 1 extracts the window as one stream; "auto" slices only windows spanning several days.
+    extract_slices: int | str = Field(default=1, alias="EXTRACT_SLICES")
+    extract_slice_workers: int = Field(default=4, alias="EXTRACT_SLICE_WORKERS", ge=1)
+    async_max_in_flight: int = Field(default=100, alias="ASYNC_MAX_IN_FLIGHT", ge=1)
+    stream_extract: bool = Field(default=True, alias="STREAM_EXTRACT")
+    # Optional cap on API pages per streamed bronze part; 0 leaves part sizing to the
+    # BRONZE_TARGET_PART_BYTES policy.
+    stream_buffer_pages: int = Field(default=0, alias="STREAM_BUFFER_PAGES", ge=0)
+    prefetch_pages: int = Field(default=2, alias="PREFETCH_PAGES", ge=0)
+    bronze_envelope_version: int = Field(default=2, alias="BRONZE_ENVELOPE_VERSION", ge=1, le=2)
+    bronze_sort_memory_bytes: int = Field(
+        default=64 * 1024 * 1024, alias="BRONZE_SORT_MEMORY_BYTES", ge=1
+    )
+    bronze_target_part_bytes: int = Field(
+        default=64 * 1024 * 1024, alias="BRONZE_TARGET_PART_BYTES", ge=1
+    )
+    bronze_part_min_records: int = Field(default=100, alias="BRONZE_PART_MIN_RECORDS", ge=1)
+    bronze_part_max_records: int = Field(default=1_000_000, alias="BRONZE_PART_MAX_RECORDS", ge=1)
+    bronze_part_size_basis: str = Field(default="raw", alias="BRONZE_PART_SIZE_BASIS")
+    bronze_format: str = Field(default="jsonl", alias="BRONZE_FORMAT")
+    bronze_compression: str = Field(default="none", alias="BRONZE_COMPRESSION")
+    # 0 picks the codec default (gzip 6, zstd 3).
+    bronze_compression_level: int = Field(default=0, alias="BRONZE_COMPRESSION_LEVEL", ge=0, le=22)
+    page_cache_mode: str = Field(default="off", alias="PAGE_CACHE_MODE")
+    page_cache_ttl_seconds: float = Field(default=3600.0, alias="PAGE_CACHE_TTL_SECONDS", ge=0)
+    page_cache_max_bytes: int = Field(default=256 * 1024 * 1024, alias="PAGE_CACHE_MAX_BYTES", ge=0)
 
     log_level: str = Field(default="INFO", alias="LOG_LEVEL")
     webhook_secret: str | None = Field(default=None, alias="WEBHOOK_SECRET")
@@ -39,6 +97,60 @@ class Settings(BaseSettings):
             raise ValueError("PIPELINE_ENV must be LOCAL or AWS")
         return normalized
 
+    @field_validator("page_cache_mode")
+    @classmethod
+    def validate_page_cache_mode(cls, value: str) -> str:
+        normalized = value.lower()
+        if normalized not in {"off", "record", "replay"}:
+            raise ValueError("PAGE_CACHE_MODE must be off, record or replay")
+        return normalized
+
+    @field_validator("fs_fsync")
+    @classmethod
+    def validate_fs_fsync(cls, value: str) -> str:
+        normalized = value.lower()
+        if normalized not in {"none", "file", "batch"}:
+            raise ValueError("FS_FSYNC must be none, file or batch")
+        return normalized
+
+    @field_validator("bronze_format")
+    @classmethod
+    def validate_bronze_format(cls, value: str) -> str:
+        normalized = value.lower()
+        if normalized not in {"jsonl", "parquet", "arrow"}:
+            raise ValueError("BRONZE_FORMAT must be jsonl, parquet or arrow")
+        return normalized
+
+    @field_validator("bronze_compression")
+    @classmethod
+    def validate_bronze_compression(cls, value: str) -> str:
+        normalized = value.lower()
+        if normalized not in {"none", "gzip", "zstd"}:
+            raise ValueError("BRONZE_COMPRESSION must be none, gzip or zstd")
+        return normalized
+
+    @field_validator("extract_slices")
+    @classmethod
+    def validate_extract_slices(cls, value: int | str) -> int | str:
+        if isinstance(value, str):
+            normalized = value.strip().lower()
+            if normalized == "auto":
+                return normalized
+            if not normalized.isdigit():
+                raise ValueError("EXTRACT_SLICES must be a positive integer or auto")
+            value = int(normalized)
+        if value < 1:
+            raise ValueError("EXTRACT_SLICES must be a positive integer or auto")
+        return value
+
+    @field_validator("bronze_part_size_basis")
+    @classmethod
+    def validate_bronze_part_size_basis(cls, value: str) -> str:
+        normalized = value.lower()
+        if normalized not in {"raw", "stored"}:
+            raise ValueError("BRONZE_PART_SIZE_BASIS must be raw or stored")
+        return normalized
+
     @field_validator("log_level")
     @classmethod
     def validate_log_level(cls, value: str) -> str:
@@ -48,6 +160,21 @@ class Settings(BaseSettings):
             raise ValueError(f"LOG_LEVEL must be one of {sorted(allowed)}")
         return normalized
 
+    @model_validator(mode="after")
+    def validate_bronze_codec_options(self) -> Settings:
+        # The level ranges are the codecs' own and hold for JSONL and Parquet parts alike.
+        level, codec = self.bronze_compression_level, self.bronze_compression
+        if self.bronze_format == "arrow" and codec == "gzip":
+            raise ValueError("BRONZE_FORMAT=arrow supports BRONZE_COMPRESSION none or zstd")
+        max_level = {"gzip": 9, "zstd": 22}.get(codec)
+        if level and max_level is None:
+            raise ValueError("BRONZE_COMPRESSION_LEVEL needs BRONZE_COMPRESSION gzip or zstd")
+        if max_level is not None and level > max_level:
+            raise ValueError(
+                f"BRONZE_COMPRESSION_LEVEL for {codec} must be 0 (default) to {max_level}"
+            )
+        return self
+
     @property
     def bronze_root(self) -> Path:
         return self.local_data_dir / "bronze"
@@ -72,6 +199,14 @@ class Settings(BaseSettings):
     def manifests_root(self) -> Path:
         return self.state_root / "manifests"
 
+    @property
+    def backfills_root(self) -> Path:
+        return self.state_root / "backfills"
+
+    @property
+    def page_cache_root(self) -> Path:
+        return self.state_root / "page_cache"
+
     def validate_runtime(self) -> None:
         if self.pipeline_env == "AWS" and not self.s3_bucket:
             raise ValueError("S3_BUCKET is required when PIPELINE_ENV=AWS")
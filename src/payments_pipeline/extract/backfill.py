@@ -0,0 +1,275 @@
+"""Resumable, day-partitioned backfills with on-disk checkpoints."""
+
+from __future__ import annotations
+
+import contextvars
+import json
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from payments_pipeline.config.logging import get_logger
+from payments_pipeline.extract.base import BaseExtractor, ExtractResult, WindowProgress
+from payments_pipeline.load.writer import StreamProgress
+from payments_pipeline.state.watermarks import WatermarkStore, Window, commit
+from payments_pipeline.utils.time import dt_partition, to_iso, utc_now
+
+
+def day_windows(start: date, end: date) -> list[tuple[str, Window]]:
+    days: list[tuple[str, Window]] = []
+    day = start
+    while day <= end:
+        start_ts = int(datetime(day.year, day.month, day.day, tzinfo=UTC).timestamp())
+        days.append((day.isoformat(), Window(start_ts=start_ts, end_ts=start_ts + 86399)))
+        day += timedelta(days=1)
+    return days
+
+
+def _new_day_state() -> dict[str, Any]:
+    return {"done": False, "cursor": None, "max_created": None, **asdict(StreamProgress())}
+
+
+def _day_progress(state: dict[str, Any]) -> WindowProgress:
+    return WindowProgress(
+        cursor=state["cursor"],
+        max_created=state["max_created"],
+        stream=StreamProgress(
+            parts=state["parts"],
+            records=state["records"],
+            schema_keys=state["schema_keys"],
+            data_keys=state["data_keys"],
+            stats=state["stats"],
+        ),
+        done=state["done"],
+    )
+
+
+def day_run_id(run_id: str, day: str) -> str:
+    # Bronze `dt` stays the ingest day, as for incremental runs; the data day goes in the run
+    # path so each day is its own run partition.
+    return f"{run_id}-{day}"
+
+
+class BackfillCheckpoint:
+    # One JSON file per (entity, start, end). Each day records the `WindowProgress` of its last
+    # landed part, so a restart continues the same run partition mid-day. `dt` is the ingest day
+    # the backfill started on and is reused on resume.
+    def __init__(self, path: Path, state: dict[str, Any]):
+        self.path = path
+        self.state = state
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def path_for(root: Path, entity: str, start: date, end: date) -> Path:
+        return root / f"{entity}_{start.isoformat()}_{end.isoformat()}.json"
+
+    @classmethod
+    def load(cls, root: Path, entity: str, start: date, end: date) -> BackfillCheckpoint | None:
+        path = cls.path_for(root, entity, start, end)
+        if not path.exists():
+            return None
+        return cls(path, json.loads(path.read_text(encoding="utf-8")))
+
+    @classmethod
+    def create(
+        cls, root: Path, entity: str, start: date, end: date, run_id: str
+    ) -> BackfillCheckpoint:
+        root.mkdir(parents=True, exist_ok=True)
+        checkpoint = cls(
+            cls.path_for(root, entity, start, end),
+            {
+                "entity": entity,
+                "start": start.isoformat(),
+                "end": end.isoformat(),
+                "run_id": run_id,
+                "dt": dt_partition(utc_now()),
+                "days": {},
+            },
+        )
+        with checkpoint._lock:
+            checkpoint._save_locked()
+        return checkpoint
+
+    @property
+    def run_id(self) -> str:
+        return str(self.state["run_id"])
+
+    @property
+    def dt(self) -> str:
+        return str(self.state["dt"])
+
+    def day(self, dt: str) -> dict[str, Any]:
+        with self._lock:
+            return dict(self.state["days"].get(dt) or _new_day_state())
+
+    def update_day(self, dt: str, **fields: Any) -> None:
+        with self._lock:
+            day = self.state["days"].setdefault(dt, _new_day_state())
+            day.update(fields)
+            self._save_locked()
+
+    def _save_locked(self) -> None:
+        self.state["updated_at"] = to_iso(utc_now())
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.state, indent=2), encoding="utf-8")
+        tmp.replace(self.path)
+
+
+@dataclass(slots=True)
+class BackfillResult:
+    entity: str
+    run_id: str
+    start: str
+    end: str
+    days_total: int
+    days_done: int = 0
+    days_resumed: int = 0
+    records: int = 0
+    pages: int = 0
+    api_calls: int = 0
+    cache_hits: int = 0
+    retries: int = 0
+    failed_days: dict[str, str] = field(default_factory=dict)
+    wall_seconds: float = 0.0
+    records_per_second: float = 0.0
+    eta_seconds: float | None = None
+    watermark: int | None = None
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed_days and self.days_done == self.days_total
+
+
+def run_backfill(
+    extractor: BaseExtractor,
+    run_context: dict[str, Any],
+    *,
+    start: date,
+    end: date,
+    checkpoint: BackfillCheckpoint,
+    workers: int = 4,
+    on_progress: Callable[[BackfillResult], None] | None = None,
+) -> BackfillResult:
+    settings = run_context["settings"]
+    logger = get_logger(__name__)
+    entity = extractor.entity
+    run_id = str(run_context["run_id"])
+    days = day_windows(start, end)
+    result = BackfillResult(
+        entity=entity,
+        run_id=run_id,
+        start=start.isoformat(),
+        end=end.isoformat(),
+        days_total=len(days),
+    )
+    lock = threading.Lock()
+    started = time.perf_counter()
+
+    pending: list[tuple[str, Window]] = []
+    for dt, window in days:
+        state = checkpoint.day(dt)
+        if state["done"]:
+            result.days_done += 1
+            result.days_resumed += 1
+            _merge_watermark(result, state["max_created"])
+        else:
+            pending.append((dt, window))
+
+    def _report(dt: str, day_records: int) -> None:
+        with lock:
+            result.days_done += 1
+            elapsed = time.perf_counter() - started
+            processed = result.days_done - result.days_resumed
+            remaining = result.days_total - result.days_done
+            result.wall_seconds = round(elapsed, 3)
+            result.records_per_second = round(result.records / elapsed, 1) if elapsed else 0.0
+            result.eta_seconds = round(elapsed / processed * remaining, 1) if processed else None
+            logger.info(
+                "backfill_progress",
+                extra={
+                    "entity": entity,
+                    "dt": dt,
+                    "days_done": result.days_done,
+                    "days_total": result.days_total,
+                    "records_per_second": result.records_per_second,
+                    "eta_seconds": result.eta_seconds,
+                },
+            )
+            if on_progress is not None:
+                on_progress(result)
+
+    def _run_day(dt: str, window: Window) -> None:
+        day_context = {**run_context, "run_id": day_run_id(run_id, dt), "dt": checkpoint.dt}
+        state = checkpoint.day(dt)
+        resume = _day_progress(state) if state["cursor"] is not None else None
+
+        def _checkpoint(progress: WindowProgress) -> None:
+            checkpoint.update_day(
+                dt,
+                cursor=progress.cursor,
+                max_created=progress.max_created,
+                done=progress.done,
+                **asdict(progress.stream),
+            )
+
+        day = extractor.extract_window(
+            window.start_ts, window.end_ts, day_context, resume=resume, on_checkpoint=_checkpoint
+        )
+        with lock:
+            _add_extract(result, day)
+            _merge_watermark(result, day.watermark)
+        _report(dt, day.records)
+
+    def _guarded(dt: str, window: Window) -> None:
+        try:
+            _run_day(dt, window)
+        except Exception as exc:
+            logger.exception("backfill_day_failed", extra={"entity": entity, "dt": dt})
+            with lock:
+                result.failed_days[dt] = f"{type(exc).__name__}: {exc}"
+
+    logger.info(
+        "backfill_started",
+        extra={
+            "entity": entity,
+            "days_total": result.days_total,
+            "days_resumed": result.days_resumed,
+            "workers": workers,
+        },
+    )
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="backfill") as pool:
+        futures = [
+            pool.submit(contextvars.copy_context().run, _guarded, dt, window)
+            for dt, window in pending
+        ]
+        for future in futures:
+            future.result()
+
+    result.wall_seconds = round(time.perf_counter() - started, 3)
+    result.eta_seconds = 0.0 if result.ok else None
+
+    # Only a fully completed backfill may move the incremental watermark, and only forward.
+    if result.ok and result.watermark is not None:
+        store = WatermarkStore(settings.watermarks_root)
+        current = store.load(entity).last_success_created_ts
+        if current is None or result.watermark > current:
+            commit(entity, result.watermark, run_id, store)
+    return result
+
+
+def _merge_watermark(result: BackfillResult, max_created: int | None) -> None:
+    if max_created is not None and (result.watermark is None or max_created > result.watermark):
+        result.watermark = max_created
+
+
+def _add_extract(result: BackfillResult, day: ExtractResult) -> None:
+    result.records += day.records
+    result.pages += day.pages
+    result.api_calls += day.api_calls
+    result.cache_hits += day.cache_hits
+    result.retries += day.retries
@@ -2,13 +2,32 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import contextvars
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from typing import Any
 
-from payments_pipeline.clients.stripe_like_interface import StripeLikeClient
+from payments_pipeline.clients.stripe_like_interface import (
+    ListPage,
+    StripeLikeClient,
+    add_page_metrics,
+    new_page_metrics,
+)
 from payments_pipeline.config.logging import get_logger, set_run_context
-from payments_pipeline.load.writer import BronzeWriter
+from payments_pipeline.extract.registry import ENTITY_REGISTRY, EntitySpec
+from payments_pipeline.load.writer import BronzeStream, BronzeWriter, StreamProgress
+from payments_pipeline.state.watermarks import (
+    WatermarkStore,
+    Window,
+    commit,
+    get_window,
+    resolve_slice_count,
+    split_window,
+)
 from payments_pipeline.utils.ids import new_correlation_id
+from payments_pipeline.utils.prefetch import Prefetcher, PrefetchStats
 from payments_pipeline.utils.time import to_iso, utc_now
 
 
@@ -22,67 +41,325 @@ class ExtractResult:
     failures: int
     watermark: int | None
     bronze_paths: list[str]
+    throttle_seconds: float = 0.0
+    cache_hits: int = 0
+    overlap_ratio: float = 0.0
+    producer_stalls: int = 0
+    consumer_stalls: int = 0
+
+
+@dataclass(slots=True)
+class WindowProgress:
+    """A resumable window extract: the next page cursor and the bronze already landed."""
+
+    cursor: str | None = None
+    max_created: int | None = None
+    stream: StreamProgress = field(default_factory=StreamProgress)
+    done: bool = False
 
 
 class BaseExtractor:
     entity: str = ""
 
-    def __init__(self, client: StripeLikeClient, writer: BronzeWriter):
+    def __init__(
+        self, client: StripeLikeClient, writer: BronzeWriter, spec: EntitySpec | None = None
+    ):
+        # Subclasses only name their entity; everything else comes from the registry spec.
+        self.spec = spec or ENTITY_REGISTRY.get(self.entity)
+        if self.spec is not None:
+            self.entity = self.spec.name
         self.client = client
         self.writer = writer
         self.logger = get_logger(self.__class__.__name__)
 
+    @property
+    def watermark_field(self) -> str:
+        return self.spec.watermark_field if self.spec is not None else "created"
+
     def normalize(self, record: dict[str, Any]) -> dict[str, Any]:
-        return record
+        return self.spec.project(record) if self.spec is not None else record
+
+    def max_watermark(self, records: list[dict[str, Any]]) -> int | None:
+        column = self.watermark_field
+        return max((int(row.get(column, 0)) for row in records), default=None)
+
+    def run(self, run_context: dict[str, Any], days: int) -> ExtractResult:
+        settings = run_context["settings"]
+        store = WatermarkStore(settings.watermarks_root)
+        window = get_window(
+            self.entity,
+            now_ts=int(utc_now().timestamp()),
+            days=days,
+            safety_window=settings.safety_window_seconds,
+            store=store,
+            run_id=str(run_context["run_id"]),
+        )
+        result = self.extract_window(window.start_ts, window.end_ts, run_context)
+        if result.watermark is not None:
+            commit(self.entity, result.watermark, run_context["run_id"], store)
+        return result
+
+    def batch_meta(self, run_context: dict[str, Any], correlation_id: str) -> dict[str, Any]:
+        # Computed once per window. Version 2 stores it only in the sidecar; version 1 repeats it
+        # on every record alongside the lifted copy.
+        return {
+            "envelope_version": run_context["settings"].bronze_envelope_version,
+            "entity": self.entity,
+            "run_id": run_context["run_id"],
+            "correlation_id": correlation_id,
+            "ingested_at": to_iso(utc_now()),
+            "source": "stripe_mock",
+        }
 
     def envelope(
-        self, raw: dict[str, Any], run_context: dict[str, Any], correlation_id: str
+        self,
+        raw: dict[str, Any],
+        run_context: dict[str, Any],
+        correlation_id: str,
+        *,
+        batch_meta: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
+        meta = batch_meta or self.batch_meta(run_context, correlation_id)
+        if meta["envelope_version"] >= 2:
+            return {"data": raw}
         return {
             "data": raw,
             "meta": {
-                "entity": self.entity,
-                "run_id": run_context["run_id"],
-                "correlation_id": correlation_id,
-                "ingested_at": to_iso(utc_now()),
-                "source": "stripe_mock",
+                "entity": meta["entity"],
+                "run_id": meta["run_id"],
+                "correlation_id": meta["correlation_id"],
+                "ingested_at": meta["ingested_at"],
+                "source": meta["source"],
                 "lifted": self.normalize(raw),
             },
         }
 
     def extract_window(
-        self, start_ts: int, end_ts: int, run_context: dict[str, Any]
+        self,
+        start_ts: int,
+        end_ts: int,
+        run_context: dict[str, Any],
+        *,
+        resume: WindowProgress | None = None,
+        on_checkpoint: Callable[[WindowProgress], None] | None = None,
     ) -> ExtractResult:
+        """Extract one created window into a bronze run partition.
+
+        With `on_checkpoint` the window is streamed into page-aligned parts and the callback
+        receives a `WindowProgress` after every page that landed a part, and once more with
+        `done` set after the sidecar; passing the last one back as `resume` continues the same
+        partition from its cursor.
+        """
         correlation_id = new_correlation_id()
         set_run_context(correlation_id=correlation_id)
 
+        settings = run_context["settings"]
+        if on_checkpoint is not None:
+            return self._extract_window_streaming(
+                start_ts,
+                end_ts,
+                run_context,
+                correlation_id,
+                resume=resume,
+                on_checkpoint=on_checkpoint,
+            )
+        window = Window(start_ts=start_ts, end_ts=end_ts)
+        slices = resolve_slice_count(settings.extract_slices, window, settings.max_page_size)
+        if slices > 1:
+            return self._extract_window_sliced(window, slices, run_context, correlation_id)
+        if settings.stream_extract:
+            return self._extract_window_streaming(start_ts, end_ts, run_context, correlation_id)
+
         records, metrics = self.client.iter_entity(
             self.entity,
             created_gte=start_ts,
             created_lte=end_ts,
-            limit=run_context["settings"].max_page_size,
+            limit=settings.max_page_size,
         )
-        wrapped = [
-            self.envelope(row, run_context, correlation_id=correlation_id) for row in records
-        ]
-        write_result = self.writer.write_bronze_jsonl(self.entity, wrapped, run_context)
-        max_created = max((int(item.get("created", 0)) for item in records), default=None)
+        meta = self.batch_meta(run_context, correlation_id)
+        with self.writer.open(self.entity, run_context, sidecar_meta=meta) as stream:
+            stream.append(
+                self.envelope(row, run_context, correlation_id=correlation_id, batch_meta=meta)
+                for row in records
+            )
+            write_result = stream.close()
+        max_created = self.max_watermark(records)
+        return self.finish(len(records), metrics, max_created, write_result.paths)
+
+    def _extract_window_sliced(
+        self, window: Window, slices: int, run_context: dict[str, Any], correlation_id: str
+    ) -> ExtractResult:
+        # Contiguous created_gte/created_lte sub-windows are paginated concurrently and each page
+        # is appended to one ordered bronze stream as it arrives. Ordered streams only write
+        # parts on close, so a slice failure aborts the stream before any part or sidecar lands
+        # and the caller never commits a watermark for a partially fetched window.
+        settings = run_context["settings"]
+        sub_windows = split_window(window, slices)
         self.logger.info(
-            "extract_window_complete",
-            extra={
-                "entity": self.entity,
-                "records": len(records),
-                "pages": metrics.get("pages", 0),
-                "api_calls": metrics.get("api_calls", 0),
-            },
+            "extract_window_sliced",
+            extra={"entity": self.entity, "slices": len(sub_windows)},
         )
+        meta = self.batch_meta(run_context, correlation_id)
+        metrics = new_page_metrics()
+        record_count = 0
+        max_created: int | None = None
+        lock = threading.Lock()
+
+        def _fetch(stream: BronzeStream, sub: Window) -> None:
+            nonlocal record_count, max_created
+            pages = self.client.iter_pages(
+                self.entity,
+                created_gte=sub.start_ts,
+                created_lte=sub.end_ts,
+                limit=settings.max_page_size,
+            )
+            for page in pages:
+                wrapped = [
+                    self.envelope(row, run_context, correlation_id=correlation_id, batch_meta=meta)
+                    for row in page.data
+                ]
+                page_max = self.max_watermark(page.data)
+                with lock:
+                    add_page_metrics(metrics, page)
+                    record_count += len(page.data)
+                    if page_max is not None and (max_created is None or page_max > max_created):
+                        max_created = page_max
+                    stream.append(wrapped)
+
+        workers = min(len(sub_windows), settings.extract_slice_workers)
+        with self.writer.open(
+            self.entity, run_context, deterministic_order=True, sidecar_meta=meta
+        ) as stream:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="slice") as pool:
+                futures = [
+                    pool.submit(contextvars.copy_context().run, _fetch, stream, sub)
+                    for sub in sub_windows
+                ]
+                for future in futures:
+                    future.result()
+            write_result = stream.close()
+        return self.finish(record_count, metrics, max_created, write_result.paths)
+
+    def _extract_window_streaming(
+        self,
+        start_ts: int,
+        end_ts: int,
+        run_context: dict[str, Any],
+        correlation_id: str,
+        *,
+        resume: WindowProgress | None = None,
+        on_checkpoint: Callable[[WindowProgress], None] | None = None,
+    ) -> ExtractResult:
+        settings = run_context["settings"]
+        metrics = new_page_metrics()
+        record_count = 0
+        max_created = resume.max_created if resume is not None else None
+        meta = self.batch_meta(run_context, correlation_id)
+
+        pages: Iterator[ListPage] = self.client.iter_pages(
+            self.entity,
+            created_gte=start_ts,
+            created_lte=end_ts,
+            limit=settings.max_page_size,
+            starting_after=resume.cursor if resume is not None else None,
+        )
+        # With prefetch on, the next page is requested on a background thread while this one is
+        # enveloped and written; the bounded queue applies backpressure when writes fall behind.
+        prefetcher = (
+            Prefetcher(pages, settings.prefetch_pages, name=f"prefetch-{self.entity}")
+            if settings.prefetch_pages > 0
+            else None
+        )
+
+        def batches() -> Iterator[tuple[ListPage, list[dict[str, Any]]]]:
+            nonlocal record_count, max_created
+            for page in prefetcher if prefetcher is not None else pages:
+                add_page_metrics(metrics, page)
+                record_count += len(page.data)
+                page_max = self.max_watermark(page.data)
+                if page_max is not None and (max_created is None or page_max > max_created):
+                    max_created = page_max
+                yield (
+                    page,
+                    [
+                        self.envelope(
+                            row, run_context, correlation_id=correlation_id, batch_meta=meta
+                        )
+                        for row in page.data
+                    ],
+                )
+
+        # Parts are written as soon as they fill (or hold `stream_buffer_pages` pages), sorted
+        # within the part; across parts they follow the source's (created, id) page order.
+        # Checkpointed streams only cut parts between pages, so every part ends on a cursor.
+        try:
+            with self.writer.open(
+                self.entity,
+                run_context,
+                deterministic_order=False,
+                sort_parts=True,
+                max_buffered_pages=settings.stream_buffer_pages,
+                page_aligned=on_checkpoint is not None,
+                resume=resume.stream if resume is not None else None,
+                sidecar_meta=meta,
+            ) as stream:
+                for page, batch in batches():
+                    parts_before = len(stream.paths)
+                    stream.append(batch)
+                    landed = len(stream.paths) > parts_before
+                    if on_checkpoint is not None and landed and page.has_more and page.next_cursor:
+                        on_checkpoint(
+                            WindowProgress(page.next_cursor, max_created, stream.checkpoint())
+                        )
+                write_result = stream.close()
+        finally:
+            if prefetcher is not None:
+                prefetcher.close()
+        if on_checkpoint is not None:
+            on_checkpoint(WindowProgress(None, max_created, stream.checkpoint(), done=True))
+        return self.finish(
+            record_count,
+            metrics,
+            max_created,
+            write_result.paths,
+            prefetch=prefetcher.stats if prefetcher is not None else None,
+        )
+
+    def finish(
+        self,
+        record_count: int,
+        metrics: dict[str, int],
+        max_created: int | None,
+        bronze_paths: list[str],
+        *,
+        prefetch: PrefetchStats | None = None,
+    ) -> ExtractResult:
+        extra: dict[str, Any] = {
+            "entity": self.entity,
+            "records": record_count,
+            "pages": metrics.get("pages", 0),
+            "api_calls": metrics.get("api_calls", 0),
+            "cache_hits": metrics.get("cache_hits", 0),
+        }
+        if prefetch is not None:
+            extra.update(
+                overlap_ratio=prefetch.overlap_ratio,
+                producer_stalls=prefetch.producer_stalls,
+                consumer_stalls=prefetch.consumer_stalls,
+            )
+        self.logger.info("extract_window_complete", extra=extra)
         return ExtractResult(
             entity=self.entity,
-            records=len(records),
+            records=record_count,
             pages=metrics.get("pages", 0),
             api_calls=metrics.get("api_calls", 0),
             retries=metrics.get("retries", 0),
             failures=metrics.get("failures", 0),
             watermark=max_created,
-            bronze_paths=write_result.paths,
+            bronze_paths=bronze_paths,
+            throttle_seconds=metrics.get("throttle_ms", 0) / 1000,
+            cache_hits=metrics.get("cache_hits", 0),
+            overlap_ratio=prefetch.overlap_ratio if prefetch is not None else 0.0,
+            producer_stalls=prefetch.producer_stalls if prefetch is not None else 0,
+            consumer_stalls=prefetch.consumer_stalls if prefetch is not None else 0,
         )
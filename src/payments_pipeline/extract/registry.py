@@ -0,0 +1,176 @@
+"""Declarative entity registry driving extraction, silver SQL and schema rules."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True)
+class FieldSpec:
+    name: str
+    type: str = "VARCHAR"
+    column: str | None = None
+    # Emit an extra `<column>_ts` TIMESTAMP column for epoch-second fields.
+    timestamp: bool = False
+
+    @property
+    def column_name(self) -> str:
+        return self.column or self.name
+
+
+@dataclass(frozen=True, slots=True)
+class EntitySpec:
+    name: str
+    fields: tuple[FieldSpec, ...]
+    watermark_field: str = "created"
+    primary_key: str = "id"
+    # Payload keys deliberately left out of silver; the drift report does not flag them.
+    ignored_keys: tuple[str, ...] = ("object", "metadata")
+    field_names: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "field_names", tuple(f.name for f in self.fields))
+
+    def project(self, record: dict[str, Any]) -> dict[str, Any]:
+        """The declared fields of `record`, in declaration order; missing keys map to None."""
+        return {key: record.get(key) for key in self.field_names}
+
+    @property
+    def silver_columns(self) -> list[str]:
+        columns: list[str] = []
+        for spec in self.fields:
+            columns.append(spec.column_name)
+            if spec.timestamp:
+                columns.append(f"{spec.column_name}_ts")
+        return [*columns, "dt"]
+
+    @property
+    def bronze_json_columns(self) -> str:
+        # Explicit reader schema for JSONL bronze: DuckDB skips type sampling across files,
+        # null-only days cannot change a column's type, and undeclared keys are ignored.
+        fields = ", ".join(f'"{f.name}" {f.type}' for f in self.fields)
+        return f"{{'data': 'STRUCT({fields})'}}"
+
+    @property
+    def arrow_relation(self) -> str:
+        # Arrow IPC bronze parts are registered on the connection under this name.
+        return f"bronze_arrow_{self.name}"
+
+    def _silver_source(self, fmt: str, partition: str) -> str:
+        bronze = f"'{{{{LOCAL_DATA_DIR}}}}/bronze/source=stripe/entity={self.name}/{partition}"
+        if fmt == "jsonl":
+            return (
+                "read_json(\n"
+                f"  {bronze}/part-*.jsonl*',\n"
+                "  format = 'newline_delimited',\n"
+                f"  columns = {self.bronze_json_columns},\n"
+                "  filename = true\n"
+                ")"
+            )
+        if fmt == "parquet":
+            return (
+                "read_parquet(\n"
+                f"  {bronze}/part-*.parquet',\n"
+                "  union_by_name = true,\n"
+                "  filename = true\n"
+                ")"
+            )
+        if fmt == "arrow":
+            return self.arrow_relation
+        raise ValueError(f"unknown bronze format: {fmt}")
+
+    def _silver_select(self, fmt: str, partition: str) -> str:
+        # JSONL parts nest the record under `data`; columnar parts store the fields top-level.
+        prefix = "data." if fmt == "jsonl" else ""
+        lines: list[str] = []
+        for spec in self.fields:
+            lines.append(f"CAST({prefix}{spec.name} AS {spec.type}) AS {spec.column_name}")
+            if spec.timestamp:
+                lines.append(
+                    f"to_timestamp(CAST({prefix}{spec.name} AS BIGINT)) AS {spec.column_name}_ts"
+                )
+        lines.append(
+            "CAST(regexp_extract(filename, 'dt=([0-9]{4}-[0-9]{2}-[0-9]{2})', 1) AS DATE) AS dt"
+        )
+        select = ",\n  ".join(lines)
+        return f"SELECT\n  {select}\nFROM {self._silver_source(fmt, partition)}"
+
+    def silver_sql(
+        self,
+        formats: Sequence[str] = ("jsonl",),
+        *,
+        partition: str = "dt=*/run_id=*",
+        table: str | None = None,
+    ) -> str:
+        # `partition` narrows the bronze glob to one run partition for incremental builds.
+        body = "\nUNION ALL BY NAME\n".join(self._silver_select(fmt, partition) for fmt in formats)
+        return f"CREATE OR REPLACE TABLE {table or self.name} AS\n{body};\n"
+
+
+def _id() -> FieldSpec:
+    return FieldSpec("id")
+
+
+def _created() -> FieldSpec:
+    return FieldSpec("created", "BIGINT", timestamp=True)
+
+
+ENTITY_REGISTRY: dict[str, EntitySpec] = {
+    spec.name: spec
+    for spec in (
+        EntitySpec(
+            "payment_intents",
+            (
+                _id(),
+                _created(),
+                FieldSpec("amount", "BIGINT"),
+                FieldSpec("currency"),
+                FieldSpec("status"),
+                FieldSpec("customer", column="customer_id"),
+                FieldSpec("invoice", column="invoice_id"),
+                FieldSpec("latest_charge", column="latest_charge_id"),
+            ),
+        ),
+        EntitySpec(
+            "charges",
+            (
+                _id(),
+                _created(),
+                FieldSpec("amount", "BIGINT"),
+                FieldSpec("currency"),
+                FieldSpec("status"),
+                FieldSpec("customer", column="customer_id"),
+                FieldSpec("payment_intent", column="payment_intent_id"),
+                FieldSpec("invoice", column="invoice_id"),
+            ),
+        ),
+        EntitySpec(
+            "invoices",
+            (
+                _id(),
+                _created(),
+                FieldSpec("due_date", "BIGINT"),
+                FieldSpec("period_start", "BIGINT"),
+                FieldSpec("period_end", "BIGINT"),
+                FieldSpec("status"),
+                FieldSpec("total", "BIGINT"),
+                FieldSpec("amount_due", "BIGINT"),
+                FieldSpec("customer", column="customer_id"),
+            ),
+        ),
+        EntitySpec(
+            "customers",
+            (
+                _id(),
+                _created(),
+                FieldSpec("email"),
+                FieldSpec("name"),
+            ),
+        ),
+    )
+}
+
+# Registry order is the extraction and silver build order.
+ENTITY_ORDER: list[str] = list(ENTITY_REGISTRY)
@@ -0,0 +1,104 @@
+"""Columnar bronze parts (Parquet / Arrow IPC) with typed entity columns plus the raw JSON line."""
+
+from __future__ import annotations
+
+import importlib
+from pathlib import Path
+from typing import Any
+
+from payments_pipeline.extract.registry import EntitySpec
+
+try:
+    pa: Any = importlib.import_module("pyarrow")
+    pa_ipc: Any = importlib.import_module("pyarrow.ipc")
+    pa_json: Any = importlib.import_module("pyarrow.json")
+    pq: Any = importlib.import_module("pyarrow.parquet")
+except Exception:  # pragma: no cover
+    pa = pa_ipc = pa_json = pq = None
+
+COLUMNAR_FORMATS = ("parquet", "arrow")
+RAW_JSON_COLUMN = "raw_json"
+
+_ARROW_TYPES = {"BIGINT": "int64", "DOUBLE": "float64", "BOOLEAN": "bool_", "VARCHAR": "string"}
+# BRONZE_COMPRESSION mapped onto each format's built-in codecs; "none" writes uncompressed pages
+# so the sidecar codec always matches what is on disk.
+_PARQUET_CODECS = {"none": "none", "gzip": "gzip", "zstd": "zstd"}
+# Arrow IPC has no gzip codec; Settings rejects that combination rather than silently writing
+# uncompressed parts.
+_ARROW_CODECS: dict[str, str | None] = {"none": None, "zstd": "zstd"}
+
+
+def ensure_available() -> None:
+    if pa is None:
+        raise RuntimeError("pyarrow is required for BRONZE_FORMAT=parquet|arrow")
+
+
+def _data_schema(spec: EntitySpec) -> Any:
+    fields = [
+        pa.field(f.name, getattr(pa, _ARROW_TYPES.get(f.type, "string"))()) for f in spec.fields
+    ]
+    return pa.schema([pa.field("data", pa.struct(fields))])
+
+
+def lines_to_table(spec: EntitySpec, data: bytes) -> Any:
+    # The JSONL chunk is parsed once here by Arrow's C++ reader against the registry types; the
+    # original line is kept verbatim in `raw_json` so bronze stays an immutable copy of the source.
+    ensure_available()
+    parsed = pa_json.read_json(
+        pa.py_buffer(data),
+        parse_options=pa_json.ParseOptions(
+            explicit_schema=_data_schema(spec), unexpected_field_behavior="ignore"
+        ),
+    )
+    columns = parsed.column("data").combine_chunks().flatten()
+    raw = pa.array(data.splitlines(), type=pa.binary()).cast(pa.string())
+    names = [f.name for f in spec.fields]
+    return pa.Table.from_arrays([*columns, raw], names=[*names, RAW_JSON_COLUMN])
+
+
+def encode_part(
+    spec: EntitySpec, data: bytes, fmt: str, compression: str = "none", level: int = 0
+) -> bytes:
+    table = lines_to_table(spec, data)
+    sink = pa.BufferOutputStream()
+    if fmt == "parquet":
+        pq.write_table(
+            table,
+            sink,
+            compression=_PARQUET_CODECS[compression],
+            compression_level=level or None,
+        )
+    elif fmt == "arrow":
+        if compression not in _ARROW_CODECS:
+            raise ValueError(
+                f"BRONZE_FORMAT=arrow does not support BRONZE_COMPRESSION={compression}"
+            )
+        codec = _ARROW_CODECS[compression]
+        options = pa_ipc.IpcWriteOptions(
+            compression=pa.Codec(codec, compression_level=level or None) if codec else None
+        )
+        with pa_ipc.new_file(sink, table.schema, options=options) as writer:
+            writer.write_table(table)
+    else:
+        raise ValueError(f"unknown columnar bronze format: {fmt}")
+    return bytes(sink.getvalue())
+
+
+def read_arrow_parts(paths: list[Path]) -> Any:
+    # DuckDB has no built-in Arrow IPC file reader, so Arrow parts are loaded here and
+    # registered as a relation. `filename` mirrors the column read_json/read_parquet add.
+    ensure_available()
+    tables = []
+    for path in paths:
+        # The table's buffers keep the memory map alive; closing it here would invalidate them.
+        table = pa_ipc.open_file(pa.memory_map(str(path))).read_all()
+        tables.append(table.append_column("filename", pa.array([path.as_posix()] * table.num_rows)))
+    return pa.concat_tables(tables, promote_options="default")
+
+
+def count_rows(path: Path) -> int:
+    ensure_available()
+    if path.suffix == ".parquet":
+        return int(pq.ParquetFile(str(path)).metadata.num_rows)
+    reader = pa_ipc.open_file(pa.memory_map(str(path)))
+    return sum(reader.get_batch(i).num_rows for i in range(reader.num_record_batches))
@@ -0,0 +1,52 @@
+"""Bronze part compression codecs (gzip from the stdlib, zstd via optional `zstandard`)."""
+
+from __future__ import annotations
+
+import gzip
+import importlib
+import io
+from pathlib import Path
+from typing import Any
+
+try:
+    zstandard: Any = importlib.import_module("zstandard")
+except Exception:  # pragma: no cover
+    zstandard = None
+
+COMPRESSION_SUFFIXES: dict[str, str] = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+_DEFAULT_LEVELS: dict[str, int] = {"gzip": 6, "zstd": 3}
+
+
+def part_suffix(compression: str, fmt: str = "jsonl") -> str:
+    # Columnar formats compress internally, so only JSONL parts carry a codec suffix.
+    if fmt != "jsonl":
+        return f".{fmt}"
+    return ".jsonl" + COMPRESSION_SUFFIXES[compression]
+
+
+def ensure_available(compression: str) -> None:
+    if compression not in COMPRESSION_SUFFIXES:
+        raise ValueError(f"unknown bronze compression: {compression}")
+    if compression == "zstd" and zstandard is None:
+        raise RuntimeError("BRONZE_COMPRESSION=zstd requires the 'zstandard' package")
+
+
+def compress(data: bytes, compression: str, level: int = 0) -> bytes:
+    level = level or _DEFAULT_LEVELS.get(compression, 0)
+    if compression == "gzip":
+        # mtime=0 keeps the output byte-identical across runs for the same input.
+        return gzip.compress(data, compresslevel=level, mtime=0)
+    if compression == "zstd":
+        ensure_available(compression)
+        return bytes(zstandard.ZstdCompressor(level=level).compress(data))
+    return data
+
+
+def open_part(path: Path) -> io.BufferedIOBase:
+    if path.name.endswith(".gz"):
+        return gzip.open(path, "rb")
+    if path.name.endswith(".zst"):
+        ensure_available("zstd")
+        handle = path.open("rb")
+        return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(handle, closefd=True))
+    return path.open("rb")
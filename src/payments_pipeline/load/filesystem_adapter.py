@@ -2,33 +2,156 @@
 
 from __future__ import annotations
 
-import json
+import os
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
+from payments_pipeline.utils import codec
+
+FSYNC_POLICIES = ("none", "file", "batch")
+# Long-lived adapters (the webhook store) must not accumulate state per write: the directory
+# cache is reset once it reaches this size, and a "batch" policy syncs once this many objects
+# are pending even if nobody calls `sync()`.
+_KNOWN_DIRS_MAX = 1024
+_MAX_UNSYNCED = 256
+
+
+def _fsync_path(path: Path) -> None:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _sync_all(paths: list[Path], mapper: Callable[..., Iterable[None]]) -> None:
+    list(mapper(_fsync_path, paths))
+    for directory in {path.parent for path in paths}:
+        _fsync_path(directory)
+
 
 class FilesystemAdapter:
-    def __init__(self, root: Path):
+    """Atomic object writes under `root`.
+
+    Every write goes to a dot-prefixed temp file in the target directory and is renamed into
+    place, so readers (and `part-*` globs) never see a partial object. `fsync` controls
+    durability: "none" relies on the OS, "file" syncs each object and its directory before
+    returning, and "batch" defers syncing to `sync()` (called by `put_many` and before bronze
+    sidecars are written), which syncs every pending object and directory once.
+    """
+
+    def __init__(self, root: Path, *, fsync: str = "none", max_workers: int = 8):
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"fsync must be one of {FSYNC_POLICIES}")
         self.root = root
+        self.fsync = fsync
+        self.max_workers = max_workers
+        self._root_resolved = root.resolve()
+        self._lock = threading.Lock()
+        self._known_dirs: set[Path] = set()
+        self._unsynced: list[Path] = []
+        self._executor: ThreadPoolExecutor | None = None
 
     def _resolve(self, relative_path: str) -> Path:
-        normalized = Path(relative_path)
-        if normalized.is_absolute():
+        if Path(relative_path).is_absolute():
             raise ValueError("Path must be relative")
-        resolved = (self.root / normalized).resolve()
-        root = self.root.resolve()
-        if root not in resolved.parents and resolved != root:
+        # Resolving follows symlinks, so a link inside the root cannot escape it.
+        resolved = (self._root_resolved / relative_path).resolve()
+        if not resolved.is_relative_to(self._root_resolved):
             raise ValueError(f"Unsafe path outside root: {relative_path}")
         return resolved
 
+    def _ensure_dir(self, directory: Path) -> None:
+        # Bronze runs write thousands of parts into a handful of directories; mkdir once each.
+        if directory in self._known_dirs:
+            return
+        directory.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            if len(self._known_dirs) >= _KNOWN_DIRS_MAX:
+                self._known_dirs.clear()
+            self._known_dirs.add(directory)
+
+    def _replace_with(self, target: Path, data: bytes) -> None:
+        # Unique per writer thread; the dot prefix keeps it out of `part-*` globs.
+        tmp = target.with_name(f".{target.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+        try:
+            with open(tmp, "wb") as handle:
+                handle.write(data)
+                if self.fsync == "file":
+                    handle.flush()
+                    os.fsync(handle.fileno())
+            os.replace(tmp, target)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+
+    def _write_atomic(self, target: Path, data: bytes) -> None:
+        try:
+            self._replace_with(target, data)
+        except FileNotFoundError:
+            # The directory was removed after `_ensure_dir` cached it; recreate it once.
+            with self._lock:
+                self._known_dirs.discard(target.parent)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            self._replace_with(target, data)
+        if self.fsync == "file":
+            _fsync_path(target.parent)
+        elif self.fsync == "batch":
+            with self._lock:
+                self._unsynced.append(target)
+                if len(self._unsynced) < _MAX_UNSYNCED:
+                    return
+                pending, self._unsynced = self._unsynced, []
+            # May run on a pool thread (put_many/submit), so sync inline rather than on the pool.
+            _sync_all(pending, map)
+
     def put_bytes(self, path: str, data: bytes) -> str:
         target = self._resolve(path)
-        target.parent.mkdir(parents=True, exist_ok=True)
-        target.write_bytes(data)
+        self._ensure_dir(target.parent)
+        self._write_atomic(target, data)
         return str(target)
 
     def put_json(self, path: str, obj: Any) -> str:
-        return self.put_bytes(path, json.dumps(obj, default=str).encode("utf-8"))
+        return self.put_bytes(path, codec.dumps(obj, default=str))
+
+    def put_many(self, items: Iterable[tuple[str, bytes]]) -> list[str]:
+        """Write several objects concurrently; returns their locations in input order.
+
+        Paths are resolved and directories created up front, and a "batch" fsync policy syncs
+        the whole batch once after the last write.
+        """
+        batch = [(self._resolve(path), data) for path, data in items]
+        for directory in {target.parent for target, _ in batch}:
+            self._ensure_dir(directory)
+        list(self.executor.map(lambda item: self._write_atomic(*item), batch))
+        self.sync()
+        return [str(target) for target, _ in batch]
+
+    def sync(self) -> None:
+        with self._lock:
+            pending, self._unsynced = self._unsynced, []
+        if pending:
+            _sync_all(pending, self.executor.map)
+
+    def close(self) -> None:
+        """Sync pending writes and shut down the write pool; it is recreated on next use."""
+        self.sync()
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="fs-write"
+                )
+            return self._executor
 
     def list(self, prefix: str) -> list[str]:
         base = self._resolve(prefix)
@@ -0,0 +1,366 @@
+"""Object storage for bronze and webhook writes: local filesystem or a pooled S3 client."""
+
+from __future__ import annotations
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Protocol
+
+from payments_pipeline.config.logging import get_logger
+from payments_pipeline.config.settings import Settings
+from payments_pipeline.load.filesystem_adapter import FilesystemAdapter
+from payments_pipeline.utils.retry import RetryBudget, RetryConfig, retry_call
+
+try:
+    import boto3
+    from botocore import exceptions as botocore_exceptions
+    from botocore.config import Config as BotoConfig
+    from botocore.exceptions import ClientError
+
+    S3_RETRYABLE: tuple[type[Exception], ...] = (
+        botocore_exceptions.ConnectionError,
+        botocore_exceptions.HTTPClientError,
+        ClientError,
+        ConnectionError,
+        TimeoutError,
+    )
+except Exception:  # pragma: no cover
+    boto3 = None
+    BotoConfig = None
+    ClientError = None
+    S3_RETRYABLE = (ConnectionError, TimeoutError)
+
+# Error codes S3 uses for throttling and transient server-side failures.
+S3_RETRYABLE_CODES = frozenset(
+    {
+        "InternalError",
+        "RequestLimitExceeded",
+        "RequestTimeout",
+        "RequestTimeoutException",
+        "ServiceUnavailable",
+        "SlowDown",
+        "Throttling",
+        "ThrottlingException",
+        "TooManyRequestsException",
+    }
+)
+
+
+def is_retryable_s3_error(exc: Exception) -> bool:
+    """Connection errors and timeouts always; ClientErrors only for throttling codes or 5xx."""
+    if ClientError is None or not isinstance(exc, ClientError):
+        return True
+    response = getattr(exc, "response", None) or {}
+    code = response.get("Error", {}).get("Code", "")
+    status = response.get("ResponseMetadata", {}).get("HTTPStatusCode", 0)
+    return code in S3_RETRYABLE_CODES or int(status or 0) >= 500
+
+
+@dataclass(slots=True)
+class UploadMetrics:
+    objects: int = 0
+    bytes: int = 0
+    multipart_uploads: int = 0
+    multipart_parts: int = 0
+    # Sum of per-object upload time, and wall time from the first upload start to the last
+    # finish; their ratio is the effective upload concurrency.
+    upload_seconds: float = 0.0
+    wall_seconds: float = 0.0
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "objects": self.objects,
+            "bytes": self.bytes,
+            "multipart_uploads": self.multipart_uploads,
+            "multipart_parts": self.multipart_parts,
+            "upload_seconds": round(self.upload_seconds, 3),
+            "wall_seconds": round(self.wall_seconds, 3),
+            "throughput_mib_per_second": (
+                round(self.bytes / self.wall_seconds / 2**20, 3) if self.wall_seconds else None
+            ),
+            "concurrency": (
+                round(self.upload_seconds / self.wall_seconds, 2) if self.wall_seconds else None
+            ),
+        }
+
+
+class ObjectStore(Protocol):
+    metrics: UploadMetrics
+
+    def location(self, key: str) -> str: ...
+
+    def put(self, key: str, data: bytes) -> str: ...
+
+    def submit(self, key: str, data: bytes) -> Future[str]: ...
+
+    def put_many(self, items: list[tuple[str, bytes]]) -> list[str]: ...
+
+    def sync(self) -> None: ...
+
+    def exists(self, key: str) -> bool: ...
+
+    def close(self) -> None: ...
+
+
+class _StoreBase(ABC):
+    def __init__(self, max_in_flight: int) -> None:
+        self.metrics = UploadMetrics()
+        self._lock = threading.Lock()
+        self._first_start: float | None = None
+        # Caps queued bodies so a fast producer cannot buffer a whole run in memory.
+        self._in_flight = threading.BoundedSemaphore(max_in_flight)
+
+    @abstractmethod
+    def put(self, key: str, data: bytes) -> str: ...
+
+    def _submit(self, executor: ThreadPoolExecutor, key: str, data: bytes) -> Future[str]:
+        self._in_flight.acquire()
+        try:
+            future = executor.submit(self.put, key, data)
+        except Exception:
+            self._in_flight.release()
+            raise
+        future.add_done_callback(lambda _: self._in_flight.release())
+        return future
+
+    def _record(self, started: float, size: int, *, parts: int = 0) -> None:
+        finished = time.perf_counter()
+        with self._lock:
+            if self._first_start is None or started < self._first_start:
+                self._first_start = started
+            self.metrics.objects += 1
+            self.metrics.bytes += size
+            self.metrics.upload_seconds += finished - started
+            self.metrics.wall_seconds = finished - self._first_start
+            if parts:
+                self.metrics.multipart_uploads += 1
+                self.metrics.multipart_parts += parts
+
+
+class LocalObjectStore(_StoreBase):
+    """LOCAL mode: atomic writes under `local_data_dir` on the adapter's write pool."""
+
+    def __init__(self, fs: FilesystemAdapter):
+        super().__init__(fs.max_workers * 2)
+        self.fs = fs
+
+    def location(self, key: str) -> str:
+        return str(self.fs._resolve(key))
+
+    def put(self, key: str, data: bytes) -> str:
+        started = time.perf_counter()
+        location = self.fs.put_bytes(key, data)
+        self._record(started, len(data))
+        return location
+
+    def submit(self, key: str, data: bytes) -> Future[str]:
+        return self._submit(self.fs.executor, key, data)
+
+    def put_many(self, items: list[tuple[str, bytes]]) -> list[str]:
+        # Each write records its own start time, so the concurrency metric reflects real overlap.
+        locations = list(self.fs.executor.map(lambda item: self.put(*item), items))
+        self.fs.sync()
+        return locations
+
+    def sync(self) -> None:
+        self.fs.sync()
+
+    def exists(self, key: str) -> bool:
+        return self.fs.exists(key)
+
+    def close(self) -> None:
+        self.fs.close()
+
+
+class S3ObjectStore(_StoreBase):
+    """AWS mode: one shared client, concurrent uploads and multipart for large bodies.
+
+    `submit` queues an upload on a bounded thread pool (at most `max_in_flight` bodies held in
+    memory) and returns a future; `put` uploads on the calling thread. Bodies of at least
+    `multipart_threshold` bytes go through a multipart upload whose parts are sent concurrently
+    and aborted on failure. Every S3 call is retried through `retry_call`.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        bucket: str,
+        *,
+        max_workers: int = 8,
+        max_in_flight: int | None = None,
+        multipart_threshold: int = 16 * 1024 * 1024,
+        multipart_part_size: int = 8 * 1024 * 1024,
+        retry_config: RetryConfig | None = None,
+        retry_budget: RetryBudget | None = None,
+    ):
+        super().__init__(max_in_flight or max_workers * 2)
+        self.client = client
+        self.bucket = bucket
+        self.multipart_threshold = multipart_threshold
+        # S3 rejects non-final parts under 5 MiB; tests may go lower with a fake client.
+        self.multipart_part_size = multipart_part_size
+        self.retry_config = retry_config
+        self.retry_budget = retry_budget
+        self.logger = get_logger(__name__)
+        self._uploads = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="s3-put")
+        # Separate pool for multipart parts so an upload never waits on its own worker pool.
+        self._parts = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="s3-part")
+
+    def _call(self, func: Any, **kwargs: Any) -> Any:
+        return retry_call(
+            lambda: func(**kwargs),
+            retryable_exceptions=S3_RETRYABLE,
+            config=self.retry_config,
+            logger=self.logger,
+            budget=self.retry_budget,
+            retry_if=is_retryable_s3_error,
+        )
+
+    def location(self, key: str) -> str:
+        return f"s3://{self.bucket}/{key}"
+
+    def put(self, key: str, data: bytes) -> str:
+        started = time.perf_counter()
+        if len(data) >= self.multipart_threshold:
+            parts = self._put_multipart(key, data)
+        else:
+            self._call(self.client.put_object, Bucket=self.bucket, Key=key, Body=data)
+            parts = 0
+        self._record(started, len(data), parts=parts)
+        return self.location(key)
+
+    def _put_multipart(self, key: str, data: bytes) -> int:
+        upload_id = self._call(self.client.create_multipart_upload, Bucket=self.bucket, Key=key)[
+            "UploadId"
+        ]
+        size = self.multipart_part_size
+        chunks = [data[offset : offset + size] for offset in range(0, len(data), size)]
+
+        def _upload(number: int, body: bytes) -> dict[str, Any]:
+            response = self._call(
+                self.client.upload_part,
+                Bucket=self.bucket,
+                Key=key,
+                UploadId=upload_id,
+                PartNumber=number,
+                Body=body,
+            )
+            return {"ETag": response["ETag"], "PartNumber": number}
+
+        try:
+            futures = [
+                self._parts.submit(_upload, number, body)
+                for number, body in enumerate(chunks, start=1)
+            ]
+            completed = [future.result() for future in futures]
+            self._call(
+                self.client.complete_multipart_upload,
+                Bucket=self.bucket,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": completed},
+            )
+        except Exception:
+            # A failed abort only leaves parts for the bucket's lifecycle rule to clean up; the
+            # upload error is the one worth surfacing.
+            try:
+                self.client.abort_multipart_upload(Bucket=self.bucket, Key=key, UploadId=upload_id)
+            except Exception:
+                self.logger.warning(
+                    "s3_multipart_abort_failed",
+                    extra={"key": key, "upload_id": upload_id},
+                    exc_info=True,
+                )
+            raise
+        return len(chunks)
+
+    def submit(self, key: str, data: bytes) -> Future[str]:
+        return self._submit(self._uploads, key, data)
+
+    def put_many(self, items: list[tuple[str, bytes]]) -> list[str]:
+        futures = [self.submit(key, data) for key, data in items]
+        return [future.result() for future in futures]
+
+    def sync(self) -> None:
+        # S3 PUTs are durable once acknowledged.
+        return None
+
+    def exists(self, key: str) -> bool:
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=key)
+            return True
+        except Exception:
+            return False
+
+    def close(self) -> None:
+        """Wait for queued uploads, then shut down the upload and part pools."""
+        self._uploads.shutdown(wait=True)
+        self._parts.shutdown(wait=True)
+
+
+_SHARED_STORES: dict[tuple[str, str | None, str, str], ObjectStore] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=8)
+def s3_client(region: str, max_pool_connections: int) -> Any:
+    # boto3 clients are thread-safe; one per region keeps the connection pool warm across
+    # writers and webhook requests instead of paying client construction per call.
+    if boto3 is None:
+        raise RuntimeError("boto3 is required for PIPELINE_ENV=AWS")
+    return boto3.client(
+        "s3",
+        region_name=region,
+        config=BotoConfig(max_pool_connections=max_pool_connections),
+    )
+
+
+def open_object_store(
+    settings: Settings, *, retry_budget: RetryBudget | None = None, client: Any | None = None
+) -> ObjectStore:
+    if settings.pipeline_env != "AWS":
+        return LocalObjectStore(
+            FilesystemAdapter(
+                settings.local_data_dir,
+                fsync=settings.fs_fsync,
+                max_workers=settings.fs_write_workers,
+            )
+        )
+    if not settings.s3_bucket:
+        raise RuntimeError("S3 bucket not configured for AWS mode")
+    return S3ObjectStore(
+        client or s3_client(settings.aws_region, settings.s3_max_pool_connections),
+        settings.s3_bucket,
+        max_workers=settings.s3_upload_workers,
+        multipart_threshold=settings.s3_multipart_threshold_bytes,
+        multipart_part_size=settings.s3_multipart_part_bytes,
+        retry_budget=retry_budget,
+    )
+
+
+def shared_object_store(settings: Settings) -> ObjectStore:
+    # Long-lived store for per-request callers (webhooks), so each request reuses the client
+    # and upload pool instead of building its own.
+    key = (
+        settings.pipeline_env,
+        settings.s3_bucket,
+        settings.aws_region,
+        str(settings.local_data_dir),
+    )
+    with _SHARED_LOCK:
+        store = _SHARED_STORES.get(key)
+        if store is None:
+            store = _SHARED_STORES[key] = open_object_store(settings)
+        return store
+
+
+def close_shared_object_stores() -> None:
+    with _SHARED_LOCK:
+        stores = list(_SHARED_STORES.values())
+        _SHARED_STORES.clear()
+    for store in stores:
+        store.close()
@@ -5,14 +5,54 @@ from __future__ import annotations
 from pathlib import Path
 
 from payments_pipeline.config.settings import Settings
+from payments_pipeline.load.compression import part_suffix
 
+# Matches plain and compressed bronze parts (.jsonl, .jsonl.gz, .jsonl.zst).
+BRONZE_PART_GLOB = "part-*.jsonl*"
+BRONZE_FORMAT_GLOBS: dict[str, str] = {
+    "jsonl": BRONZE_PART_GLOB,
+    "parquet": "part-*.parquet",
+    "arrow": "part-*.arrow",
+}
+BRONZE_RUN_PARTITIONS = "dt=*/run_id=*"
+# Silver is written per consumed bronze run partition: one data.parquet, or data_N.parquet
+# files (possibly under sub-partition directories) when a model splits or partitions output.
+SILVER_PART_GLOB = f"{BRONZE_RUN_PARTITIONS}/**/*.parquet"
 
-def bronze_relative_path(entity: str, dt: str, run_id: str, part: int = 0) -> str:
-    return f"bronze/source=stripe/entity={entity}/dt={dt}/run_id={run_id}/part-{part:05d}.jsonl"
 
+def bronze_run_relative_dir(entity: str, dt: str, run_id: str) -> str:
+    return f"bronze/source=stripe/entity={entity}/dt={dt}/run_id={run_id}"
 
-def silver_relative_path(entity: str, dt: str) -> str:
-    return f"silver/source=stripe/entity={entity}/dt={dt}/data.parquet"
+
+def bronze_relative_path(
+    entity: str,
+    dt: str,
+    run_id: str,
+    part: int = 0,
+    compression: str = "none",
+    fmt: str = "jsonl",
+) -> str:
+    run_dir = bronze_run_relative_dir(entity, dt, run_id)
+    return f"{run_dir}/part-{part:05d}{part_suffix(compression, fmt)}"
+
+
+def bronze_sidecar_relative_path(entity: str, dt: str, run_id: str) -> str:
+    return f"{bronze_run_relative_dir(entity, dt, run_id)}/_metadata.json"
+
+
+def bronze_formats_present(
+    entity_dir: Path, partition: str = BRONZE_RUN_PARTITIONS
+) -> tuple[str, ...]:
+    return tuple(
+        fmt
+        for fmt, glob in BRONZE_FORMAT_GLOBS.items()
+        if next(entity_dir.glob(f"{partition}/{glob}"), None) is not None
+    )
+
+
+def silver_relative_path(entity: str, dt: str, run_id: str | None = None) -> str:
+    partition = f"dt={dt}" if run_id is None else f"dt={dt}/run_id={run_id}"
+    return f"silver/source=stripe/entity={entity}/{partition}/data.parquet"
 
 
 def gold_relative_path(model: str, dt: str) -> str:
@@ -31,6 +71,10 @@ def latest_model_relative_path(model: str) -> str:
     return f"_state/manifests/_latest/{model}.json"
 
 
+def consumed_relative_path(model: str) -> str:
+    return f"_state/manifests/_consumed/{model}.json"
+
+
 def recon_relative_path(dt: str) -> str:
     return f"_state/manifests/recon_{dt}.json"
 
@@ -3,21 +3,28 @@
 from __future__ import annotations
 
 import hashlib
+import heapq
 import json
-from dataclasses import dataclass
-from typing import Any
+import statistics
+import tempfile
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future
+from dataclasses import asdict, dataclass, field
+from operator import itemgetter
+from typing import IO, Any
 
 from payments_pipeline.config.logging import get_logger
 from payments_pipeline.config.settings import Settings
-from payments_pipeline.load.filesystem_adapter import FilesystemAdapter
-from payments_pipeline.load.paths import bronze_relative_path
+from payments_pipeline.extract.registry import ENTITY_REGISTRY
+from payments_pipeline.load import columnar, compression
+from payments_pipeline.load.object_store import ObjectStore, open_object_store
+from payments_pipeline.load.paths import bronze_relative_path, bronze_sidecar_relative_path
+from payments_pipeline.utils import codec
+from payments_pipeline.utils.retry import RetryBudget
 from payments_pipeline.utils.time import dt_partition, utc_now
 
-try:
-    import boto3
-except Exception:  # pragma: no cover
-    boto3 = None
-
 
 @dataclass(slots=True)
 class WriteResult:
@@ -26,81 +33,574 @@ class WriteResult:
     chunk_count: int
     paths: list[str]
     schema_hash: str
+    spilled_runs: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class PartSizing:
+    """When to cut a bronze part.
+
+    A part is written once it holds `target_bytes` and at least `min_records`, or as soon as it
+    reaches `max_records`. With `basis="stored"` the target applies to the compressed size,
+    estimated from the ratio observed on the partition's earlier parts.
+    """
+
+    target_bytes: int
+    min_records: int = 1
+    max_records: int = 1_000_000
+    basis: str = "raw"
+
+    @classmethod
+    def fixed(cls, records: int) -> PartSizing:
+        return cls(target_bytes=0, min_records=records, max_records=records)
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> PartSizing:
+        return cls(
+            target_bytes=settings.bronze_target_part_bytes,
+            min_records=settings.bronze_part_min_records,
+            max_records=settings.bronze_part_max_records,
+            basis=settings.bronze_part_size_basis,
+        )
+
+    def is_full(self, records: int, raw_bytes: int, ratio: float = 1.0) -> bool:
+        if records >= self.max_records:
+            return True
+        target = self.target_bytes * ratio if self.basis == "stored" else self.target_bytes
+        return records >= self.min_records and raw_bytes >= target
+
+
+@dataclass(slots=True)
+class _PartitionStats:
+    raw_bytes: int = 0
+    stored_bytes: int = 0
+    compress_seconds: float = 0.0
+    part_bytes: list[int] = field(default_factory=list)
+    part_records: list[int] = field(default_factory=list)
+
+    @property
+    def ratio(self) -> float:
+        return self.raw_bytes / self.stored_bytes if self.stored_bytes else 1.0
+
+
+@dataclass(slots=True)
+class StreamProgress:
+    """What a stream has landed in its run partition, enough for a later stream to continue it."""
+
+    parts: int = 0
+    records: int = 0
+    schema_keys: list[str] = field(default_factory=list)
+    data_keys: list[str] = field(default_factory=list)
+    stats: dict[str, Any] = field(default_factory=dict)
+
+
+def _distribution(values: list[int]) -> dict[str, Any]:
+    if not values:
+        return {"min": 0, "p50": 0, "max": 0, "mean": 0}
+    return {
+        "min": min(values),
+        "p50": int(statistics.median(values)),
+        "max": max(values),
+        "mean": int(statistics.fmean(values)),
+    }
+
+
+def _record_sort_key(record: dict[str, Any]) -> str:
+    return str(record.get("data", {}).get("id", record.get("id", "")))
+
+
+def partition_dt(run_context: dict[str, Any]) -> str:
+    # Backfills pin `dt` to the ingest day they started on, so a resumed backfill keeps
+    # writing the partitions it began.
+    if run_context.get("dt"):
+        return str(run_context["dt"])
+    return dt_partition(run_context.get("now") or utc_now())
+
+
+def compute_schema_hash(schema_keys: list[str]) -> str:
+    return hashlib.sha256("|".join(schema_keys).encode("utf-8")).hexdigest()
+
+
+# Rough per-record bookkeeping cost (tuple, key string) on top of the encoded line.
+_RUN_ENTRY_OVERHEAD_BYTES = 96
+
+
+def _read_run(handle: IO[bytes]) -> Iterator[tuple[str, bytes]]:
+    for raw in handle:
+        key, line = raw.rstrip(b"\n").split(b"\t", 1)
+        yield codec.loads(key), line
+
+
+class BronzeStream:
+    """Incremental bronze writer for one entity/run partition; use `BronzeWriter.open`.
+
+    Records are encoded as they are appended and parts are cut by `sizing`. Unordered streams
+    write a part as soon as it is full (sorted within the part when `sort_parts` is set); with
+    `max_buffered_pages` a part is also cut once that many `append` calls (one per API page)
+    are buffered, and with `page_aligned` parts are only cut between `append` calls, so
+    `checkpoint` can be taken after any append. A stream opened with `resume` continues the
+    part numbers, counts and sidecar stats of that checkpoint.
+    Ordered streams keep sorted runs within `memory_budget_bytes`, spilling each full run to a
+    temporary file, and `close` k-way merges the runs into parts.
+    """
+
+    def __init__(
+        self,
+        writer: BronzeWriter,
+        entity: str,
+        dt: str,
+        run_id: str,
+        *,
+        sizing: PartSizing,
+        deterministic_order: bool,
+        sort_parts: bool,
+        memory_budget_bytes: int,
+        max_buffered_pages: int,
+        page_aligned: bool,
+        resume: StreamProgress | None,
+        write_sidecar: bool,
+        sidecar_meta: dict[str, Any] | None,
+    ):
+        self._writer = writer
+        self.entity = entity
+        self.dt = dt
+        self.run_id = run_id
+        self.sizing = sizing
+        self.deterministic_order = deterministic_order
+        self.sort_parts = sort_parts and not deterministic_order
+        self.memory_budget_bytes = memory_budget_bytes
+        self.max_buffered_pages = max_buffered_pages
+        self.page_aligned = page_aligned and not deterministic_order
+        self.first_part = resume.parts if resume is not None else 0
+        self._write_sidecar = write_sidecar
+        self._sidecar_meta = sidecar_meta
+        self.paths: list[str] = []
+        self._resumed_records = resume.records if resume is not None else 0
+        self.record_count = self._resumed_records
+        self._pending: list[tuple[str, bytes]] = []
+        self._pending_bytes = 0
+        self._pending_pages = 0
+        self._ratio = 1.0
+        self._run: list[tuple[str, bytes]] = []
+        self._run_bytes = 0
+        self._spills: list[IO[bytes]] = []
+        self._schema_keys: set[str] = set(resume.schema_keys) if resume is not None else set()
+        self._shapes: set[tuple[str, ...]] = set()
+        self._data_keys: set[str] = set(resume.data_keys) if resume is not None else set()
+        self._data_shapes: set[tuple[str, ...]] = set()
+        self._closed = False
+        if resume is not None:
+            writer.restore_partition_stats(entity, dt, run_id, resume.stats)
+            self._ratio = writer.compression_ratio(entity, dt, run_id)
+
+    def __enter__(self) -> BronzeStream:
+        return self
+
+    def __exit__(self, exc_type: object, *exc_info: object) -> None:
+        if exc_type is not None:
+            self.abort()
+        elif not self._closed:
+            self.close()
+
+    def append(self, records: Iterable[dict[str, Any]]) -> None:
+        count_before = self.record_count
+        for record in records:
+            # Envelopes share a handful of key layouts, so the schema fingerprint only does
+            # set work when a new layout appears.
+            shape = tuple(record)
+            if shape not in self._shapes:
+                self._shapes.add(shape)
+                self._schema_keys.update(shape)
+            data = record.get("data")
+            if isinstance(data, dict):
+                data_shape = tuple(data)
+                if data_shape not in self._data_shapes:
+                    self._data_shapes.add(data_shape)
+                    self._data_keys.update(data_shape)
+            line = codec.dumps(record, sort_keys=True, default=str)
+            self.record_count += 1
+            if not self.deterministic_order:
+                self._add_pending(_record_sort_key(record) if self.sort_parts else "", line)
+                continue
+            self._run.append((_record_sort_key(record), line))
+            self._run_bytes += len(line) + _RUN_ENTRY_OVERHEAD_BYTES
+            if self._run_bytes >= self.memory_budget_bytes:
+                self._spill_run()
+        # Whatever is still pending after a size-triggered part belongs to this page.
+        if self._pending and self.record_count > count_before:
+            self._pending_pages += 1
+            if (self.max_buffered_pages and self._pending_pages >= self.max_buffered_pages) or (
+                self.page_aligned and self._is_full()
+            ):
+                self.flush()
+
+    def _add_pending(self, key: str, line: bytes) -> None:
+        self._pending.append((key, line))
+        self._pending_bytes += len(line) + 1
+        if not self.page_aligned and self._is_full():
+            self.flush()
+
+    def _is_full(self) -> bool:
+        return self.sizing.is_full(len(self._pending), self._pending_bytes, self._ratio)
+
+    def _spill_run(self) -> None:
+        self._run.sort(key=itemgetter(0))
+        handle = tempfile.TemporaryFile(prefix="bronze-run-")
+        for key, line in self._run:
+            handle.write(codec.dumps(key) + b"\t" + line + b"\n")
+        handle.seek(0)
+        self._spills.append(handle)
+        self._run = []
+        self._run_bytes = 0
+
+    def flush(self) -> None:
+        """Write buffered records as a part now, regardless of `sizing`."""
+        if not self._pending:
+            return
+        if self.sort_parts:
+            self._pending.sort(key=itemgetter(0))
+        self.paths.append(
+            self._writer.write_part_lines(
+                self.entity,
+                self.dt,
+                self.run_id,
+                self.first_part + len(self.paths),
+                [line for _, line in self._pending],
+            )
+        )
+        self._pending = []
+        self._pending_bytes = 0
+        self._pending_pages = 0
+        self._ratio = self._writer.compression_ratio(self.entity, self.dt, self.run_id)
+
+    def checkpoint(self) -> StreamProgress:
+        """Wait for written parts to land and report them; buffered records must be flushed."""
+        if self._pending or self._run or self._spills:
+            raise RuntimeError("bronze stream has buffered records; flush before a checkpoint")
+        self._writer.wait_uploads(self.entity, self.dt, self.run_id)
+        return StreamProgress(
+            parts=self.first_part + len(self.paths),
+            records=self.record_count,
+            schema_keys=sorted(self._schema_keys),
+            data_keys=sorted(self._data_keys),
+            stats=self._writer.partition_stats(self.entity, self.dt, self.run_id),
+        )
+
+    def abort(self) -> None:
+        # Drops buffered records and spill files; parts already written stay without a sidecar,
+        # like any interrupted run.
+        self._closed = True
+        self._pending = []
+        self._run = []
+        self._discard_spills()
+        self._writer.wait_uploads(self.entity, self.dt, self.run_id, raise_errors=False)
+        self._writer.discard_partition_stats(self.entity, self.dt, self.run_id)
+
+    def _discard_spills(self) -> None:
+        for handle in self._spills:
+            handle.close()
+        self._spills = []
+
+    def close(self) -> WriteResult:
+        if self._closed:
+            raise RuntimeError("bronze stream already closed")
+        self._closed = True
+        try:
+            return self._finish()
+        finally:
+            # `write_sidecar` already reported and removed the stats; this covers every other exit.
+            self._writer.discard_partition_stats(self.entity, self.dt, self.run_id)
+
+    def _finish(self) -> WriteResult:
+        spilled_runs = len(self._spills)
+        if self.deterministic_order:
+            # Runs are merged oldest first, so equal keys keep their append order exactly like
+            # a stable in-memory sort.
+            self._run.sort(key=itemgetter(0))
+            runs = [_read_run(handle) for handle in self._spills] + [iter(self._run)]
+            try:
+                for key, line in heapq.merge(*runs, key=itemgetter(0)):
+                    self._add_pending(key, line)
+            finally:
+                self._discard_spills()
+                self._run = []
+        self.flush()
+        self._writer.wait_uploads(self.entity, self.dt, self.run_id)
+
+        schema_hash = compute_schema_hash(sorted(self._schema_keys))
+        # The sidecar describes the whole partition, including parts of a resumed checkpoint;
+        # the result below only reports what this stream wrote.
+        chunk_count = self.first_part + len(self.paths)
+        if self._write_sidecar and chunk_count:
+            self._writer.write_sidecar(
+                self.entity,
+                self.dt,
+                self.run_id,
+                record_count=self.record_count,
+                chunk_count=chunk_count,
+                schema_hash=schema_hash,
+                meta=self._sidecar_meta,
+                data_keys=sorted(self._data_keys),
+            )
+        self._writer.logger.info(
+            "bronze_write_complete",
+            extra={
+                "entity": self.entity,
+                "record_count": self.record_count,
+                "chunk_count": len(self.paths),
+                "spilled_runs": spilled_runs,
+            },
+        )
+        return WriteResult(
+            entity=self.entity,
+            record_count=self.record_count - self._resumed_records,
+            chunk_count=len(self.paths),
+            paths=self.paths,
+            schema_hash=schema_hash,
+            spilled_runs=spilled_runs,
+        )
 
 
 class BronzeWriter:
-    def __init__(self, settings: Settings):
+    def __init__(
+        self,
+        settings: Settings,
+        *,
+        retry_budget: RetryBudget | None = None,
+        store: ObjectStore | None = None,
+    ):
         self.settings = settings
+        self.retry_budget = retry_budget
         self.logger = get_logger(__name__)
-        self.fs = FilesystemAdapter(settings.local_data_dir)
-        self._s3 = (
-            boto3.client("s3", region_name=settings.aws_region)
-            if boto3 and settings.pipeline_env == "AWS"
-            else None
+        # A store passed in belongs to the caller; one opened here is closed by `close`.
+        self._owns_store = store is None
+        self.store = store or open_object_store(settings, retry_budget=retry_budget)
+        # Part uploads still in flight per run partition; the sidecar waits for them.
+        self._uploads: dict[tuple[str, str, str], list[Future[str]]] = {}
+        self.format = settings.bronze_format
+        self.compression = settings.bronze_compression
+        self.compression_level = settings.bronze_compression_level
+        if self.format == "jsonl":
+            compression.ensure_available(self.compression)
+        else:
+            columnar.ensure_available()
+        self.part_sizing = PartSizing.from_settings(settings)
+        # Per run partition (entity, dt, run_id); reported and reset by `write_sidecar`.
+        self._partition_stats: dict[tuple[str, str, str], _PartitionStats] = {}
+        self._stats_lock = threading.Lock()
+
+    def __enter__(self) -> BronzeWriter:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._owns_store:
+            self.store.close()
+
+    def _part_path(self, entity: str, dt: str, run_id: str, part: int) -> str:
+        return bronze_relative_path(
+            entity=entity,
+            dt=dt,
+            run_id=run_id,
+            part=part,
+            compression=self.compression,
+            fmt=self.format,
         )
 
+    def _encode_part(self, entity: str, dt: str, run_id: str, data: bytes, records: int) -> bytes:
+        started = time.perf_counter()
+        if self.format == "jsonl":
+            stored = compression.compress(data, self.compression, self.compression_level)
+        else:
+            # Columnar parts are converted from the same JSONL chunk, so raw_bytes stays the
+            # JSONL size and the sidecar ratio compares directly against the JSONL baseline.
+            spec = ENTITY_REGISTRY.get(entity)
+            if spec is None:
+                raise ValueError(f"BRONZE_FORMAT={self.format} needs a registered entity: {entity}")
+            stored = columnar.encode_part(
+                spec, data, self.format, self.compression, self.compression_level
+            )
+        elapsed = time.perf_counter() - started
+        with self._stats_lock:
+            stats = self._partition_stats.setdefault((entity, dt, run_id), _PartitionStats())
+            stats.raw_bytes += len(data)
+            stats.stored_bytes += len(stored)
+            stats.compress_seconds += elapsed
+            stats.part_bytes.append(len(stored))
+            stats.part_records.append(records)
+        return stored
+
+    def compression_ratio(self, entity: str, dt: str, run_id: str) -> float:
+        with self._stats_lock:
+            stats = self._partition_stats.get((entity, dt, run_id))
+            return stats.ratio if stats is not None else 1.0
+
+    def partition_stats(self, entity: str, dt: str, run_id: str) -> dict[str, Any]:
+        with self._stats_lock:
+            stats = self._partition_stats.get((entity, dt, run_id)) or _PartitionStats()
+            return asdict(stats)
+
+    def restore_partition_stats(
+        self, entity: str, dt: str, run_id: str, stats: dict[str, Any]
+    ) -> None:
+        # Seeds a resumed partition so its sidecar also covers the parts of earlier attempts.
+        with self._stats_lock:
+            self._partition_stats[(entity, dt, run_id)] = _PartitionStats(**stats)
+
+    def discard_partition_stats(self, entity: str, dt: str, run_id: str) -> None:
+        # Streams that end without a sidecar (aborted, or write_sidecar=False) drop their stats.
+        with self._stats_lock:
+            self._partition_stats.pop((entity, dt, run_id), None)
+
+    def _pop_partition_stats(self, entity: str, dt: str, run_id: str) -> dict[str, Any]:
+        with self._stats_lock:
+            stats = self._partition_stats.pop((entity, dt, run_id), None) or _PartitionStats()
+        return {
+            "format": self.format,
+            "compression": {
+                "codec": self.compression,
+                "level": self.compression_level,
+                "raw_bytes": stats.raw_bytes,
+                "stored_bytes": stats.stored_bytes,
+                "ratio": round(stats.ratio, 3) if stats.stored_bytes else None,
+                "compress_seconds": round(stats.compress_seconds, 6),
+            },
+            "parts": {
+                "target_bytes": self.part_sizing.target_bytes,
+                "size_basis": self.part_sizing.basis,
+                "stored_bytes": _distribution(stats.part_bytes),
+                "records": _distribution(stats.part_records),
+            },
+        }
+
+    def _sizing(self, chunk_size: int | None) -> PartSizing:
+        return self.part_sizing if chunk_size is None else PartSizing.fixed(chunk_size)
+
     def _put_bytes(self, relative_path: str, data: bytes) -> str:
-        if self.settings.pipeline_env == "AWS":
-            if not self._s3 or not self.settings.s3_bucket:
-                raise RuntimeError("boto3 or S3 bucket not configured for AWS mode")
-            self._s3.put_object(Bucket=self.settings.s3_bucket, Key=relative_path, Body=data)
-            return f"s3://{self.settings.s3_bucket}/{relative_path}"
-        return self.fs.put_bytes(relative_path, data)
+        return self.store.put(relative_path, data)
 
-    def write_bronze_jsonl(
+    def _submit_part(
+        self, entity: str, dt: str, run_id: str, relative_path: str, data: bytes
+    ) -> str:
+        future = self.store.submit(relative_path, data)
+        with self._stats_lock:
+            self._uploads.setdefault((entity, dt, run_id), []).append(future)
+        return self.store.location(relative_path)
+
+    def wait_uploads(self, entity: str, dt: str, run_id: str, *, raise_errors: bool = True) -> None:
+        with self._stats_lock:
+            futures = self._uploads.pop((entity, dt, run_id), [])
+        error: BaseException | None = None
+        for future in futures:
+            exc = future.exception()
+            if exc is not None and error is None:
+                error = exc
+        if error is not None and raise_errors:
+            raise error
+
+    def write_part_lines(
+        self, entity: str, dt: str, run_id: str, part: int, lines: list[bytes]
+    ) -> str:
+        # Streamed parts upload concurrently; `wait_uploads` runs before the sidecar is written.
+        data = b"\n".join(lines) + b"\n" if lines else b""
+        return self._submit_part(
+            entity,
+            dt,
+            run_id,
+            self._part_path(entity, dt, run_id, part),
+            self._encode_part(entity, dt, run_id, data, len(lines)),
+        )
+
+    def open(
         self,
         entity: str,
-        records: list[dict[str, Any]],
         run_context: dict[str, Any],
         *,
-        chunk_size: int = 1000,
+        chunk_size: int | None = None,
         deterministic_order: bool = True,
+        sort_parts: bool = False,
+        memory_budget_bytes: int | None = None,
+        max_buffered_pages: int = 0,
+        page_aligned: bool = False,
+        resume: StreamProgress | None = None,
         write_sidecar: bool = True,
-    ) -> WriteResult:
-        if deterministic_order:
-            records = sorted(
-                records, key=lambda r: str(r.get("data", {}).get("id", r.get("id", "")))
-            )
-
-        dt = dt_partition(run_context.get("now") or utc_now())
-        run_id = str(run_context["run_id"])
-        paths: list[str] = []
-
-        schema_keys = sorted({k for rec in records for k in rec.keys()})
-        schema_hash = hashlib.sha256("|".join(schema_keys).encode("utf-8")).hexdigest()
-
-        for idx in range(0, len(records), chunk_size):
-            chunk = records[idx : idx + chunk_size]
-            part = idx // chunk_size
-            rel_path = bronze_relative_path(entity=entity, dt=dt, run_id=run_id, part=part)
-            body = "\n".join(json.dumps(row, default=str, sort_keys=True) for row in chunk) + (
-                "\n" if chunk else ""
-            )
-            paths.append(self._put_bytes(rel_path, body.encode("utf-8")))
-
-        if write_sidecar and paths:
-            sidecar = {
-                "entity": entity,
-                "run_id": run_id,
-                "dt": dt,
-                "record_count": len(records),
-                "chunk_count": len(paths),
-                "schema_hash": schema_hash,
-            }
-            sidecar_rel = bronze_relative_path(entity=entity, dt=dt, run_id=run_id, part=0).replace(
-                "part-00000.jsonl", "_metadata.json"
-            )
-            self._put_bytes(sidecar_rel, json.dumps(sidecar, indent=2).encode("utf-8"))
+        sidecar_meta: dict[str, Any] | None = None,
+    ) -> BronzeStream:
+        # `chunk_size` pins parts to a fixed record count; by default parts are sized by the
+        # BRONZE_TARGET_PART_BYTES / BRONZE_PART_{MIN,MAX}_RECORDS policy.
+        return BronzeStream(
+            self,
+            entity,
+            partition_dt(run_context),
+            str(run_context["run_id"]),
+            sizing=self._sizing(chunk_size),
+            deterministic_order=deterministic_order,
+            sort_parts=sort_parts,
+            memory_budget_bytes=memory_budget_bytes or self.settings.bronze_sort_memory_bytes,
+            max_buffered_pages=max_buffered_pages,
+            page_aligned=page_aligned,
+            resume=resume,
+            write_sidecar=write_sidecar,
+            sidecar_meta=sidecar_meta,
+        )
 
-        self.logger.info(
-            "bronze_write_complete",
-            extra={"entity": entity, "record_count": len(records), "chunk_count": len(paths)},
+    def write_sidecar(
+        self,
+        entity: str,
+        dt: str,
+        run_id: str,
+        *,
+        record_count: int,
+        chunk_count: int,
+        schema_hash: str,
+        meta: dict[str, Any] | None = None,
+        data_keys: list[str] | None = None,
+    ) -> None:
+        # `meta` carries the batch-level envelope fields (envelope_version, correlation_id,
+        # ingested_at, source) that compact v2 records no longer repeat per line.
+        # The sidecar marks the run complete, so its parts must be written (and, under a batch
+        # fsync policy, durable) first.
+        self.wait_uploads(entity, dt, run_id)
+        self.store.sync()
+        sidecar = {
+            **(meta or {}),
+            "entity": entity,
+            "run_id": run_id,
+            "dt": dt,
+            "record_count": record_count,
+            "chunk_count": chunk_count,
+            "schema_hash": schema_hash,
+            # Payload keys seen in the run; silver ignores undeclared ones, the drift report
+            # surfaces them.
+            "data_keys": data_keys or [],
+            **self._pop_partition_stats(entity, dt, run_id),
+        }
+        self._put_bytes(
+            bronze_sidecar_relative_path(entity, dt, run_id),
+            json.dumps(sidecar, indent=2).encode("utf-8"),
         )
 
-        return WriteResult(
-            entity=entity,
-            record_count=len(records),
-            chunk_count=len(paths),
-            paths=paths,
-            schema_hash=schema_hash,
+    def write_bronze_jsonl(
+        self,
+        entity: str,
+        records: Iterable[dict[str, Any]],
+        run_context: dict[str, Any],
+        *,
+        chunk_size: int | None = None,
+        deterministic_order: bool = True,
+        write_sidecar: bool = True,
+        sidecar_meta: dict[str, Any] | None = None,
+    ) -> WriteResult:
+        stream = self.open(
+            entity,
+            run_context,
+            chunk_size=chunk_size,
+            deterministic_order=deterministic_order,
+            write_sidecar=write_sidecar,
+            sidecar_meta=sidecar_meta,
         )
+        with stream:
+            stream.append(records)
+            return stream.close()
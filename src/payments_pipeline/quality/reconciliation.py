@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 import importlib
+import json
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from payments_pipeline.config.logging import get_logger
+from payments_pipeline.extract.registry import ENTITY_ORDER
+from payments_pipeline.load.columnar import count_rows
+from payments_pipeline.load.compression import open_part
+from payments_pipeline.load.paths import BRONZE_FORMAT_GLOBS, BRONZE_PART_GLOB, SILVER_PART_GLOB
 from payments_pipeline.state.manifests import ManifestStore
 
 try:
@@ -25,18 +30,33 @@ class ReconResult:
 def _count_jsonl_records(paths: list[Path]) -> int:
     total = 0
     for path in paths:
-        with path.open("r", encoding="utf-8") as f:
+        with open_part(path) as f:
             total += sum(1 for _ in f)
     return total
 
 
+def _count_bronze_records(entity_dir: Path) -> int:
+    # The sidecar's record_count covers every envelope version without rereading the parts; runs
+    # that never wrote a sidecar (interrupted before completion) fall back to counting lines.
+    total = 0
+    for run_dir in sorted(entity_dir.glob("dt=*/run_id=*")):
+        sidecar = run_dir / "_metadata.json"
+        if sidecar.exists():
+            total += int(json.loads(sidecar.read_text(encoding="utf-8"))["record_count"])
+        else:
+            total += _count_jsonl_records(sorted(run_dir.glob(BRONZE_PART_GLOB)))
+            for fmt in ("parquet", "arrow"):
+                total += sum(count_rows(p) for p in run_dir.glob(BRONZE_FORMAT_GLOBS[fmt]))
+    return total
+
+
 def run_reconciliation(
     base_dir: Path, manifest_store: ManifestStore, tolerance_ratio: float = 0.01
 ) -> ReconResult:
     logger = get_logger(__name__)
     checks: list[dict[str, Any]] = []
 
-    entities = ["payment_intents", "charges", "invoices", "customers"]
+    entities = ENTITY_ORDER
     dt_dirs = sorted((base_dir / "bronze").glob("source=stripe/entity=*/dt=*"))
     dt = dt_dirs[-1].name.split("dt=")[-1] if dt_dirs else "unknown"
 
@@ -45,20 +65,14 @@ def run_reconciliation(
     conn = duckdb.connect()
 
     for entity in entities:
-        bronze_files = sorted(
-            (base_dir / "bronze" / f"source=stripe/entity={entity}").glob(
-                "dt=*/run_id=*/part-*.jsonl"
-            )
-        )
-        bronze_count = _count_jsonl_records(bronze_files)
+        bronze_count = _count_bronze_records(base_dir / "bronze" / f"source=stripe/entity={entity}")
 
-        silver_files = sorted(
-            (base_dir / "silver" / f"source=stripe/entity={entity}").glob("dt=*/data.parquet")
-        )
+        # Silver holds one file per consumed bronze run partition, so compare against all of them.
+        silver_dir = base_dir / "silver" / f"source=stripe/entity={entity}"
         silver_count = 0
-        if silver_files:
+        if next(silver_dir.glob(SILVER_PART_GLOB), None) is not None:
             row = conn.execute(
-                f"SELECT COUNT(*) FROM read_parquet('{silver_files[-1].as_posix()}')"
+                f"SELECT COUNT(*) FROM read_parquet('{(silver_dir / SILVER_PART_GLOB).as_posix()}')"
             ).fetchone()
             silver_count = int(row[0]) if row is not None else 0
 
@@ -77,18 +91,14 @@ def run_reconciliation(
             }
         )
 
-    customers_latest = sorted(
-        (base_dir / "silver/source=stripe/entity=customers").glob("dt=*/data.parquet")
-    )
-    charges_latest = sorted(
-        (base_dir / "silver/source=stripe/entity=charges").glob("dt=*/data.parquet")
-    )
-    if customers_latest and charges_latest:
+    customers_dir = base_dir / "silver/source=stripe/entity=customers"
+    charges_dir = base_dir / "silver/source=stripe/entity=charges"
+    if all(next(d.glob(SILVER_PART_GLOB), None) is not None for d in (customers_dir, charges_dir)):
         missing_refs = conn.execute(
             f"""
             SELECT COUNT(*)
-            FROM read_parquet('{charges_latest[-1].as_posix()}') c
-            LEFT JOIN read_parquet('{customers_latest[-1].as_posix()}') d
+            FROM read_parquet('{(charges_dir / SILVER_PART_GLOB).as_posix()}') c
+            LEFT JOIN read_parquet('{(customers_dir / SILVER_PART_GLOB).as_posix()}') d
             ON trim(c.customer_id) = trim(d.id)
             WHERE nullif(trim(c.customer_id), '') IS NOT NULL
               AND d.id IS NULL
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import importlib
+import json
 from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any
 
 from payments_pipeline.config.logging import get_logger
+from payments_pipeline.extract.registry import ENTITY_REGISTRY
+from payments_pipeline.load.paths import SILVER_PART_GLOB
 
 try:
     duckdb: Any = importlib.import_module("duckdb")
@@ -16,12 +19,26 @@ except Exception:  # pragma: no cover
 
 
 MODEL_RULES: dict[str, dict[str, Any]] = {
+    **{
+        spec.name: {
+            "layer": "silver",
+            "required_columns": spec.silver_columns,
+            "not_null": [spec.primary_key],
+        }
+        for spec in ENTITY_REGISTRY.values()
+    },
     "dim_customers": {"required_columns": ["id"], "not_null": ["id"]},
     "fct_payments": {"required_columns": ["id"], "not_null": ["id"]},
     "fct_invoices": {"required_columns": ["id"], "not_null": ["id"]},
 }
 
 
+def _output_glob(model: str, layer: str) -> str:
+    if layer == "silver":
+        return f"silver/source=stripe/entity={model}/{SILVER_PART_GLOB}"
+    return f"gold/model={model}/**/*.parquet"
+
+
 @dataclass(slots=True)
 class CheckResult:
     model: str
@@ -29,6 +46,47 @@ class CheckResult:
     messages: list[str]
 
 
+@dataclass(slots=True)
+class DriftResult:
+    entity: str
+    # Payload keys seen in bronze that the registry neither declares nor ignores (silver drops
+    # them).
+    unknown_keys: list[str]
+    # Declared fields never seen in any scanned run; these are always NULL in silver.
+    missing_keys: list[str]
+    runs: int
+
+
+def run_schema_drift(base_dir: Path, *, run_id: str | None = None) -> list[DriftResult]:
+    """Compare the payload keys recorded in bronze run sidecars with the registry fields.
+
+    `run_id` limits the scan to that run's partitions; by default every run is read.
+    """
+    logger = get_logger(__name__)
+    results: list[DriftResult] = []
+    pattern = f"dt=*/run_id={run_id or '*'}/_metadata.json"
+    for spec in ENTITY_REGISTRY.values():
+        entity_dir = base_dir / "bronze" / "source=stripe" / f"entity={spec.name}"
+        seen: set[str] = set()
+        runs = 0
+        for sidecar in sorted(entity_dir.glob(pattern)):
+            keys = json.loads(sidecar.read_text(encoding="utf-8")).get("data_keys")
+            if keys:
+                seen.update(keys)
+                runs += 1
+        declared = {f.name for f in spec.fields}
+        result = DriftResult(
+            entity=spec.name,
+            unknown_keys=sorted(seen - declared - set(spec.ignored_keys)),
+            missing_keys=sorted(declared - seen) if runs else [],
+            runs=runs,
+        )
+        if result.unknown_keys or result.missing_keys:
+            logger.warning("schema_drift_detected", extra=asdict(result))
+        results.append(result)
+    return results
+
+
 def _columns(conn: Any, parquet_path: Path) -> list[str]:
     rows = conn.execute(
         f"DESCRIBE SELECT * FROM read_parquet('{parquet_path.as_posix()}')"
@@ -45,7 +103,7 @@ def run_schema_checks(base_dir: Path) -> list[CheckResult]:
     results: list[CheckResult] = []
 
     for model, rules in MODEL_RULES.items():
-        candidates = sorted(base_dir.glob(f"gold/model={model}/dt=*/data.parquet"))
+        candidates = sorted(base_dir.glob(_output_glob(model, rules.get("layer", "gold"))))
         if not candidates:
             results.append(
                 CheckResult(model=model, passed=False, messages=["missing parquet output"])
@@ -17,6 +17,7 @@ class ManifestStore:
     def __post_init__(self) -> None:
         self.root.mkdir(parents=True, exist_ok=True)
         (self.root / "_latest").mkdir(parents=True, exist_ok=True)
+        (self.root / "_consumed").mkdir(parents=True, exist_ok=True)
 
     def write_run_manifest(self, run_id: str, payload: dict[str, Any]) -> Path:
         path = self.root / f"run_{run_id}.json"
@@ -47,6 +48,23 @@ class ManifestStore:
         payload = json.loads(latest.read_text(encoding="utf-8"))
         return cast(dict[str, Any], payload)
 
+    def read_consumed(self, model: str) -> dict[str, dict[str, Any]]:
+        """Bronze run partitions already folded into `model`, keyed by "dt=.../run_id=..."."""
+        path = self.root / "_consumed" / f"{model}.json"
+        if not path.exists():
+            return {}
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        return cast(dict[str, dict[str, Any]], payload.get("partitions", {}))
+
+    def write_consumed(self, model: str, partitions: dict[str, dict[str, Any]]) -> Path:
+        path = self.root / "_consumed" / f"{model}.json"
+        payload = {"model": model, "updated_at": to_iso(utc_now()), "partitions": partitions}
+        # Write-then-rename so a crash mid-write never loses the consumed set.
+        tmp = path.with_name(f".{path.name}.tmp")
+        tmp.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+        tmp.replace(path)
+        return path
+
     def write_reconciliation(self, dt: str, report: dict[str, Any]) -> Path:
         path = self.root / f"recon_{dt}.json"
         payload = {"dt": dt, "written_at": to_iso(utc_now()), "report": report}
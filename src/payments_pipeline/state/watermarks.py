@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import math
 from dataclasses import dataclass
 from datetime import timedelta
 from pathlib import Path
@@ -47,6 +48,29 @@ class WatermarkStore:
             updated_at=payload.get("updated_at"),
         )
 
+    def _run_window_path(self, run_id: str, entity: str) -> Path:
+        return self.root / "_runs" / run_id / f"{entity}.json"
+
+    def load_run_window(self, run_id: str, entity: str) -> Window | None:
+        path = self._run_window_path(run_id, entity)
+        if not path.exists():
+            return None
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        return Window(start_ts=int(payload["start_ts"]), end_ts=int(payload["end_ts"]))
+
+    def pin_run_window(self, run_id: str, entity: str, window: Window) -> Path:
+        path = self._run_window_path(run_id, entity)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        payload = {
+            "start_ts": window.start_ts,
+            "end_ts": window.end_ts,
+            "pinned_at": to_iso(utc_now()),
+        }
+        tmp.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        tmp.replace(path)
+        return path
+
     def commit(self, entity: str, new_watermark: int, run_id: str) -> Path:
         path = self._path(entity)
         tmp = path.with_suffix(".tmp")
@@ -61,8 +85,24 @@ class WatermarkStore:
 
 
 def get_window(
-    entity: str, now_ts: int, days: int, safety_window: int, store: WatermarkStore
+    entity: str,
+    now_ts: int,
+    days: int,
+    safety_window: int,
+    store: WatermarkStore,
+    *,
+    run_id: str | None = None,
 ) -> Window:
+    """The next extract window for `entity`: from its watermark (less the safety overlap) to now.
+
+    With `run_id`, the first window computed for that run is pinned and reused when the run is
+    retried under the same id, so the retry requests exactly the pages the failed attempt did
+    (and a page cache can serve them) instead of a window that ends at a new `now`.
+    """
+    if run_id is not None:
+        pinned = store.load_run_window(run_id, entity)
+        if pinned is not None:
+            return pinned
     state = store.load(entity)
     if state.last_success_created_ts is None:
         start_dt = parse_ts(now_ts) - timedelta(days=days)
@@ -72,7 +112,39 @@ def get_window(
     end_ts = int(now_ts)
     if start_ts > end_ts:
         start_ts = end_ts
-    return Window(start_ts=start_ts, end_ts=end_ts)
+    window = Window(start_ts=start_ts, end_ts=end_ts)
+    if run_id is not None:
+        store.pin_run_window(run_id, entity, window)
+    return window
+
+
+def split_window(window: Window, slices: int) -> list[Window]:
+    span = window.end_ts - window.start_ts + 1
+    slices = max(1, min(slices, span))
+    step = -(-span // slices)
+    parts: list[Window] = []
+    start = window.start_ts
+    while start <= window.end_ts:
+        end = min(window.end_ts, start + step - 1)
+        parts.append(Window(start_ts=start, end_ts=end))
+        start = end + 1
+    return parts
+
+
+def auto_slice_count(window: Window, max_page_size: int, *, max_slices: int = 8) -> int:
+    # One slice per whole day of window at the default page size of 100; larger pages cover
+    # more records per request so each slice can span proportionally more time. Only whole
+    # slices count, so a daily window plus its safety overlap stays a single stream.
+    seconds_per_slice = 86400 * max(1, max_page_size) / 100
+    span = max(0, window.end_ts - window.start_ts)
+    return max(1, min(max_slices, math.floor(span / seconds_per_slice)))
+
+
+def resolve_slice_count(setting: int | str, window: Window, max_page_size: int) -> int:
+    """Slices for `window` under EXTRACT_SLICES: a fixed count, or "auto" to size by span."""
+    if setting == "auto":
+        return auto_slice_count(window, max_page_size)
+    return max(1, int(setting))
 
 
 def commit(entity: str, new_watermark: int, run_id: str, store: WatermarkStore) -> Path:
@@ -4,12 +4,22 @@ from __future__ import annotations
 
 import importlib
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import asdict, dataclass
+from pathlib import Path
 from typing import Any
 
 from payments_pipeline.config.logging import get_logger
+from payments_pipeline.extract.registry import ENTITY_REGISTRY
 from payments_pipeline.state.manifests import ManifestStore
-from payments_pipeline.transform.models import MODEL_EXECUTION_ORDER
+from payments_pipeline.transform.incremental import (
+    build_silver,
+    merge_gold,
+    replace_with_view,
+    restore_interrupted_swaps,
+    write_parquet,
+)
+from payments_pipeline.transform.models import MODEL_EXECUTION_ORDER, ModelSpec, model_dependencies
 from payments_pipeline.utils.time import dt_partition, utc_now
 
 try:
@@ -17,77 +27,197 @@ try:
 except Exception:  # pragma: no cover
     duckdb = None
 
+FAILED_STATUSES = ("failed", "upstream_failed")
+
 
 @dataclass(slots=True)
 class TransformMetric:
     model: str
     layer: str
+    # Execution time, from the model starting on a worker until it finished.
     runtime_seconds: float
     status: str
+    # Bronze part files read vs skipped as already consumed (silver models only).
+    files_scanned: int = 0
+    files_skipped: int = 0
+    # Gold partitions rewritten by the merge, and those it removed as emptied.
+    partitions_written: int = 0
+    partitions_deleted: int = 0
+    # Time between all upstream models finishing and a worker picking the model up.
+    queue_wait_seconds: float = 0.0
+
 
+@dataclass(slots=True)
+class _ModelRun:
+    conn: Any
+    settings: Any
+    manifest: ManifestStore
+    base_dir: Path
+    run_id: str
+    dt: str
+    full_refresh: bool
+
+
+def _run_model(
+    spec: ModelSpec, run: _ModelRun, touched: set[str] | None
+) -> tuple[TransformMetric, set[str] | None]:
+    """Run one model on its own cursor; returns its metric and the silver `dt`s it touched."""
+    logger = get_logger(__name__)
+    metric = TransformMetric(model=spec.name, layer=spec.layer, runtime_seconds=0.0, status="ok")
+    start = time.time()
+    conn = run.conn.cursor()
+    try:
+        if spec.layer == "silver":
+            build = build_silver(
+                conn,
+                ENTITY_REGISTRY[spec.name],
+                base_dir=run.base_dir,
+                silver_dir=run.settings.silver_root / "source=stripe" / f"entity={spec.name}",
+                manifest=run.manifest,
+                full_refresh=run.full_refresh,
+                spec=spec,
+            )
+            metric.files_scanned, metric.files_skipped = build.files_scanned, build.files_skipped
+            return metric, None if run.full_refresh else build.touched_dts
+
+        sql = spec.build_sql(conn, run.base_dir)
+        if not sql.strip():
+            logger.warning(
+                "transform_sql_missing_or_empty",
+                extra={"model": spec.name, "path": str(spec.sql_path)},
+            )
+            metric.status = "skipped"
+            return metric, touched
+
+        sql = sql.replace("{{LOCAL_DATA_DIR}}", run.base_dir.as_posix()).strip().rstrip(";")
+        model_dir = run.settings.gold_root / f"model={spec.name}"
+        if spec.unique_key:
+            merged = merge_gold(conn, spec, sql, gold_dir=model_dir, touched=touched)
+            metric.partitions_written = merged.partitions_written
+            metric.partitions_deleted = merged.partitions_deleted
+            pattern = f"{spec.partition_column}=*/**/*.parquet"
+            if next(model_dir.glob(pattern), None) is not None:
+                replace_with_view(
+                    conn,
+                    spec.name,
+                    f"SELECT * FROM read_parquet('{(model_dir / pattern).as_posix()}', "
+                    "union_by_name = true, hive_partitioning = false)",
+                )
+            out_path = model_dir
+        else:
+            # Full rewrite: hive-partitioned by the rows' own values when `partition_by` is
+            # set, otherwise a single file under the run date.
+            conn.execute(f"CREATE OR REPLACE TABLE {spec.name} AS {sql}")
+            out_path = model_dir if spec.partition_by else model_dir / f"dt={run.dt}"
+            write_parquet(
+                conn, f"SELECT * FROM {spec.name}", out_path, spec, partition_by=spec.partition_by
+            )
+            metric.partitions_written = (
+                len({p.parent for p in out_path.glob("**/*.parquet")}) if spec.partition_by else 1
+            )
 
-def run_transforms(run_context: dict[str, Any]) -> list[TransformMetric]:
+        run.manifest.write_latest_model(spec.name, run_id=run.run_id, dt=run.dt, path=str(out_path))
+        return metric, touched
+    except Exception:
+        logger.exception("transform_failed", extra={"model": spec.name, "layer": spec.layer})
+        metric.status = "failed"
+        return metric, None
+    finally:
+        conn.close()
+        metric.runtime_seconds = round(time.time() - start, 3)
+
+
+def _upstream_touched(
+    upstream: tuple[str, ...], touched: dict[str, set[str] | None], full_refresh: bool
+) -> set[str] | None:
+    # Gold recomputes the union of its upstream models' touched partitions; None rebuilds all.
+    if full_refresh:
+        return None
+    merged: set[str] = set()
+    for name in upstream:
+        dts = touched[name]
+        if dts is None:
+            return None
+        merged |= dts
+    return merged
+
+
+def run_transforms(
+    run_context: dict[str, Any],
+    *,
+    full_refresh: bool = False,
+    specs: list[ModelSpec] | None = None,
+) -> list[TransformMetric]:
+    """Run the model DAG, starting each model as soon as its upstream models have finished.
+
+    Independent models run concurrently on `TRANSFORM_WORKERS` workers, each on its own cursor
+    of one DuckDB database. A failed model marks only its downstream models `upstream_failed`;
+    every other branch still runs. Metrics are returned in declaration order.
+    """
     if duckdb is None:
         raise RuntimeError("duckdb is required for transforms")
 
     logger = get_logger(__name__)
     settings = run_context["settings"]
-    run_id = run_context["run_id"]
-    dt = dt_partition(run_context.get("now") or utc_now())
+    specs = MODEL_EXECUTION_ORDER if specs is None else specs
+    deps = model_dependencies(specs)
+    by_name = {spec.name: spec for spec in specs}
 
-    settings.state_root.mkdir(parents=True, exist_ok=True)
-    db_path = settings.state_root / "pipeline.duckdb"
-    conn = duckdb.connect(str(db_path))
-    conn.execute("PRAGMA threads=4")
-
-    metrics: list[TransformMetric] = []
-    manifest = ManifestStore(settings.manifests_root)
-
-    for spec in MODEL_EXECUTION_ORDER:
-        start = time.time()
-        status = "ok"
-        try:
-            if not spec.sql_path.exists() or not spec.sql_path.read_text(encoding="utf-8").strip():
-                logger.warning(
-                    "transform_sql_missing_or_empty",
-                    extra={"model": spec.name, "path": str(spec.sql_path)},
-                )
-                status = "skipped"
-            else:
-                sql = spec.sql_path.read_text(encoding="utf-8")
-                sql = sql.replace(
-                    "{{LOCAL_DATA_DIR}}", settings.local_data_dir.resolve().as_posix()
-                )
-                conn.execute(sql)
+    restored = sum(
+        restore_interrupted_swaps(root) for root in (settings.silver_root, settings.gold_root)
+    )
+    if restored:
+        logger.warning("transform_outputs_restored", extra={"partitions": restored})
 
-                if spec.layer == "silver":
-                    out_dir = (
-                        settings.silver_root / "source=stripe" / f"entity={spec.name}" / f"dt={dt}"
+    settings.state_root.mkdir(parents=True, exist_ok=True)
+    conn = duckdb.connect(str(settings.state_root / "pipeline.duckdb"))
+    workers = settings.transform_workers
+    conn.execute(f"PRAGMA threads={workers * settings.transform_threads_per_model}")
+
+    run = _ModelRun(
+        conn=conn,
+        settings=settings,
+        manifest=ManifestStore(settings.manifests_root),
+        base_dir=settings.local_data_dir.resolve(),
+        run_id=run_context["run_id"],
+        dt=dt_partition(run_context.get("now") or utc_now()),
+        full_refresh=full_refresh,
+    )
+    results: dict[str, TransformMetric] = {}
+    touched: dict[str, set[str] | None] = {}
+    waiting = [spec.name for spec in specs]
+    running: dict[Future[tuple[TransformMetric, set[str] | None]], str] = {}
+
+    def timed(name: str, ready_at: float) -> tuple[TransformMetric, set[str] | None]:
+        queue_wait = time.time() - ready_at
+        metric, dts = _run_model(
+            by_name[name], run, _upstream_touched(deps[name], touched, full_refresh)
+        )
+        metric.queue_wait_seconds = round(queue_wait, 3)
+        return metric, dts
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="transform") as pool:
+        while waiting or running:
+            for name in list(waiting):
+                upstream = deps[name]
+                if any(results[u].status in FAILED_STATUSES for u in upstream if u in results):
+                    spec = by_name[name]
+                    results[name] = TransformMetric(
+                        model=name, layer=spec.layer, runtime_seconds=0.0, status="upstream_failed"
                     )
-                else:
-                    out_dir = settings.gold_root / f"model={spec.name}" / f"dt={dt}"
-
-                out_dir.mkdir(parents=True, exist_ok=True)
-                out_path = out_dir / "data.parquet"
-                conn.execute(
-                    f"COPY (SELECT * FROM {spec.name}) TO '{out_path.as_posix()}' (FORMAT PARQUET)"
-                )
-
-                if spec.layer == "gold":
-                    manifest.write_latest_model(spec.name, run_id=run_id, dt=dt, path=str(out_path))
-        except Exception:
-            logger.exception("transform_failed", extra={"model": spec.name, "layer": spec.layer})
-            status = "failed"
-            raise
-        finally:
-            metrics.append(
-                TransformMetric(
-                    model=spec.name,
-                    layer=spec.layer,
-                    runtime_seconds=round(time.time() - start, 3),
-                    status=status,
-                )
-            )
-
+                    waiting.remove(name)
+                elif all(u in results for u in upstream):
+                    waiting.remove(name)
+                    running[pool.submit(timed, name, time.time())] = name
+            if not running:
+                # Everything left is blocked behind a failure marked above; loop to mark it too.
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                results[name], touched[name] = future.result()
+
+    conn.close()
+    metrics = [results[spec.name] for spec in specs]
     logger.info("transforms_completed", extra={"metrics": [asdict(m) for m in metrics]})
     return metrics
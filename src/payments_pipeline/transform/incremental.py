@@ -0,0 +1,306 @@
+"""Incremental silver builds and partition-level gold merges.
+
+Each bronze `dt=.../run_id=...` partition is transformed into its own silver file at the same
+relative location. The set of consumed partitions and a fingerprint of their part files is kept
+in the manifest store, so a rerun only reads partitions that are new or whose parts changed;
+the silver table itself is exposed as a view over every partition file.
+
+Gold models are recomputed only for the `dt` values those silver partitions touched and merged
+into their partitioned output on the model's unique key.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from payments_pipeline.extract.registry import EntitySpec
+from payments_pipeline.load.paths import (
+    BRONZE_FORMAT_GLOBS,
+    BRONZE_RUN_PARTITIONS,
+    SILVER_PART_GLOB,
+)
+from payments_pipeline.state.manifests import ManifestStore
+from payments_pipeline.transform.models import ModelSpec, silver_sql_for
+from payments_pipeline.utils.time import to_iso, utc_now
+
+
+@dataclass(slots=True)
+class SilverBuild:
+    files_scanned: int = 0
+    files_skipped: int = 0
+    partitions_built: int = 0
+    partitions_skipped: int = 0
+    # `dt` values of the partitions rebuilt by this build; gold merges recompute only these.
+    touched_dts: set[str] = field(default_factory=set)
+
+
+@dataclass(slots=True)
+class GoldMerge:
+    partitions_written: int = 0
+    # Partitions removed because every row they held moved to a later partition.
+    partitions_deleted: int = 0
+    rows_merged: int = 0
+
+
+def bronze_run_partitions(entity_dir: Path) -> dict[str, list[Path]]:
+    """Bronze part files per run partition, keyed by "dt=.../run_id=..."."""
+    partitions: dict[str, list[Path]] = {}
+    for run_dir in sorted(entity_dir.glob(BRONZE_RUN_PARTITIONS)):
+        parts = sorted(part for glob in BRONZE_FORMAT_GLOBS.values() for part in run_dir.glob(glob))
+        if parts:
+            partitions[run_dir.relative_to(entity_dir).as_posix()] = parts
+    return partitions
+
+
+def partition_fingerprint(parts: list[Path]) -> str:
+    # Name, size and mtime are enough to notice a rewritten or extended run partition
+    # without reading the parts themselves.
+    digest = hashlib.sha256()
+    for part in parts:
+        stat = part.stat()
+        digest.update(f"{part.name}:{stat.st_size}:{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def write_parquet(
+    conn: Any,
+    query: str,
+    target_dir: Path,
+    spec: ModelSpec,
+    *,
+    partition_by: tuple[str, ...] = (),
+    keep_empty: bool = True,
+) -> int:
+    """Write `query` into `target_dir` with the model's Parquet layout; returns rows written.
+
+    The output is built in a dot-prefixed sibling directory (outside every reader glob) and
+    swapped in, so readers see either the previous or the new partition. With `keep_empty`
+    False an empty result removes `target_dir` instead.
+    """
+    restore_interrupted_swap(target_dir)
+    if spec.order_by:
+        query = f"SELECT * FROM ({query}) ORDER BY {', '.join(spec.order_by)}"
+    tmp = target_dir.with_name(f".{target_dir.name}.tmp")
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+    options = spec.copy_options(partition_by)
+    single_file = "FILENAME_PATTERN" not in options
+    out = (tmp / "data.parquet") if single_file else tmp
+    row = conn.execute(f"COPY ({query}) TO '{out.as_posix()}' ({options})").fetchone()
+    written = int(row[0]) if row is not None else 0
+    if not written and not keep_empty:
+        shutil.rmtree(tmp, ignore_errors=True)
+        shutil.rmtree(target_dir, ignore_errors=True)
+        return 0
+    old = _swap_backup(target_dir)
+    # A leftover backup would make the rename below fail with "Directory not empty".
+    shutil.rmtree(old, ignore_errors=True)
+    if target_dir.exists():
+        os.replace(target_dir, old)
+    os.replace(tmp, target_dir)
+    shutil.rmtree(old, ignore_errors=True)
+    return written
+
+
+def _swap_backup(target_dir: Path) -> Path:
+    return target_dir.with_name(f".{target_dir.name}.old")
+
+
+def restore_interrupted_swap(target_dir: Path) -> bool:
+    """Put back the previous output of a swap that crashed between its two renames."""
+    old = _swap_backup(target_dir)
+    if target_dir.exists() or not old.is_dir():
+        return False
+    os.replace(old, target_dir)
+    return True
+
+
+def restore_interrupted_swaps(root: Path) -> int:
+    """Restore every interrupted `write_parquet` swap under `root`; returns how many."""
+    if not root.exists():
+        return 0
+    backups = [path for path in root.rglob(".*.old") if path.is_dir()]
+    return sum(
+        restore_interrupted_swap(path.with_name(path.name[1:].removesuffix(".old")))
+        for path in backups
+    )
+
+
+def replace_with_view(conn: Any, name: str, select_sql: str) -> None:
+    # Earlier full builds left `name` as a table; DuckDB will not replace a table with a view.
+    row = conn.execute(
+        "SELECT table_type FROM information_schema.tables "
+        "WHERE table_schema = 'main' AND table_name = ?",
+        [name],
+    ).fetchone()
+    if row is not None and row[0] == "BASE TABLE":
+        conn.execute(f"DROP TABLE {name}")
+    conn.execute(f"CREATE OR REPLACE VIEW {name} AS {select_sql}")
+
+
+def build_silver(
+    conn: Any,
+    entity: EntitySpec,
+    *,
+    base_dir: Path,
+    silver_dir: Path,
+    manifest: ManifestStore,
+    full_refresh: bool = False,
+    spec: ModelSpec | None = None,
+) -> SilverBuild:
+    """Transform new or changed bronze run partitions of `entity` into `silver_dir`.
+
+    `full_refresh` discards the consumed set and the existing silver files and rebuilds every
+    partition. Rebuilding a partition overwrites its silver file, so reruns are idempotent.
+    """
+    spec = spec or ModelSpec(name=entity.name, layer="silver")
+    entity_dir = base_dir / "bronze" / "source=stripe" / f"entity={entity.name}"
+    if full_refresh:
+        shutil.rmtree(silver_dir, ignore_errors=True)
+        consumed: dict[str, dict[str, Any]] = {}
+    else:
+        consumed = manifest.read_consumed(entity.name)
+
+    build = SilverBuild()
+    stage = f"_stage_{entity.name}"
+    for key, parts in bronze_run_partitions(entity_dir).items():
+        fingerprint = partition_fingerprint(parts)
+        out_dir = silver_dir / key
+        previous = consumed.get(key)
+        if (
+            previous
+            and previous.get("fingerprint") == fingerprint
+            and next(out_dir.glob("**/*.parquet"), None) is not None
+        ):
+            build.files_skipped += len(parts)
+            build.partitions_skipped += 1
+            continue
+
+        sql = silver_sql_for(entity, conn, base_dir, partition=key, table=stage)
+        conn.execute(sql.replace("{{LOCAL_DATA_DIR}}", base_dir.as_posix()))
+        write_parquet(
+            conn, f"SELECT * FROM {stage}", out_dir, spec, partition_by=spec.sub_partitions()
+        )
+        consumed[key] = {
+            "fingerprint": fingerprint,
+            "files": len(parts),
+            "built_at": to_iso(utc_now()),
+        }
+        build.files_scanned += len(parts)
+        build.partitions_built += 1
+        build.touched_dts.add(key.split("/", 1)[0].removeprefix("dt="))
+
+    conn.execute(f"DROP TABLE IF EXISTS {stage}")
+    if build.partitions_built or full_refresh:
+        manifest.write_consumed(entity.name, consumed)
+
+    glob = (silver_dir / SILVER_PART_GLOB).as_posix()
+    replace_with_view(
+        conn,
+        entity.name,
+        f"SELECT * FROM read_parquet('{glob}', union_by_name = true, hive_partitioning = false)",
+    )
+    return build
+
+
+def _sql_list(values: Iterable[str]) -> str:
+    return ", ".join("'" + value.replace("'", "''") + "'" for value in sorted(values))
+
+
+def merge_gold(
+    conn: Any,
+    spec: ModelSpec,
+    select_sql: str,
+    *,
+    gold_dir: Path,
+    touched: set[str] | None,
+) -> GoldMerge:
+    """Upsert the `touched` partitions of a gold model into `gold_dir/<column>=<value>/`.
+
+    Model rows are recomputed where `partition_column` is in `touched`, or where they join an
+    upstream row from a touched partition through `joined_keys`, and deduplicated on
+    `unique_key`, keeping the row from the latest partition (then `latest_by`). Partitions are
+    written with the spec's Parquet layout, sub-partitioned by any further `partition_by`
+    columns. Each touched partition is replaced by its recomputed rows; any other partition
+    holding recomputed keys is rewritten with them. Untouched partitions stay on disk as they
+    are. `touched=None`, or a model with no output yet, rebuilds every partition.
+    """
+    name, unique_key, pcol = spec.name, spec.unique_key, spec.partition_column
+    existing_glob = f"{pcol}=*/**/*.parquet"
+    if touched is None or next(gold_dir.glob(existing_glob), None) is None:
+        shutil.rmtree(gold_dir, ignore_errors=True)
+        touched = None
+    elif not touched:
+        return GoldMerge()
+
+    keys = ", ".join(unique_key)
+    where = ""
+    if touched is not None:
+        touched_list = _sql_list(touched)
+        # Upstream silver tables are partitioned by their bronze `dt`.
+        conditions = [f"CAST({pcol} AS VARCHAR) IN ({touched_list})"] + [
+            f"{column} IN (SELECT {key} FROM {upstream} "
+            f"WHERE CAST(dt AS VARCHAR) IN ({touched_list}))"
+            for upstream, key, column in spec.joined_keys
+        ]
+        where = "WHERE " + " OR ".join(conditions)
+    ranking = ", ".join([f"{pcol} DESC", *(f"{col} DESC" for col in spec.latest_by)])
+    delta = f"_delta_{name}"
+    conn.execute(
+        f"CREATE OR REPLACE TEMP TABLE {delta} AS "
+        f"SELECT * FROM ({select_sql.strip().rstrip(';')}) AS model {where} "
+        f"QUALIFY row_number() OVER (PARTITION BY {keys} "
+        f"ORDER BY {ranking}, CAST(model AS VARCHAR) DESC) = 1"
+    )
+
+    affected = set(touched or ())
+    if touched is not None:
+        existing = (
+            f"read_parquet('{(gold_dir / existing_glob).as_posix()}', "
+            "hive_partitioning = false, union_by_name = true)"
+        )
+        match = " AND ".join(f"e.{key} = {delta}.{key}" for key in unique_key)
+        # A key already stored in a later partition keeps that newer row.
+        conn.execute(
+            f"DELETE FROM {delta} WHERE EXISTS "
+            f"(SELECT 1 FROM {existing} e WHERE {match} AND e.{pcol} > {delta}.{pcol})"
+        )
+        rows = conn.execute(
+            f"SELECT DISTINCT CAST(e.{pcol} AS VARCHAR) FROM {existing} e "
+            f"WHERE EXISTS (SELECT 1 FROM {delta} WHERE {match})"
+        ).fetchall()
+        affected |= {row[0] for row in rows}
+    # Joined rows may land outside `touched`; their own partitions are rewritten too.
+    rows = conn.execute(f"SELECT DISTINCT CAST({pcol} AS VARCHAR) FROM {delta}").fetchall()
+    affected |= {row[0] for row in rows}
+
+    merge = GoldMerge()
+    for value in sorted(affected):
+        target = gold_dir / f"{pcol}={value}"
+        existed = target.exists()
+        query = f"SELECT * FROM {delta} WHERE CAST({pcol} AS VARCHAR) = {_sql_list([value])}"
+        if touched is not None and value not in touched and existed:
+            match = " AND ".join(f"e.{key} = d.{key}" for key in unique_key)
+            stored = (target / "**" / "*.parquet").as_posix()
+            query += (
+                f" UNION ALL BY NAME SELECT * FROM read_parquet('{stored}', "
+                "hive_partitioning = false, union_by_name = true) e "
+                f"WHERE NOT EXISTS (SELECT 1 FROM {delta} d WHERE {match})"
+            )
+        written = write_parquet(
+            conn, query, target, spec, partition_by=spec.sub_partitions(), keep_empty=False
+        )
+        if written:
+            merge.partitions_written += 1
+        elif existed:
+            merge.partitions_deleted += 1
+        merge.rows_merged += written
+
+    conn.execute(f"DROP TABLE IF EXISTS {delta}")
+    return merge
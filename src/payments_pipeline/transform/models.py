@@ -2,39 +2,181 @@
 
 from __future__ import annotations
 
+import functools
+import re
+from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
+
+from payments_pipeline.extract.registry import ENTITY_REGISTRY, EntitySpec
+from payments_pipeline.load.columnar import read_arrow_parts
+from payments_pipeline.load.paths import (
+    BRONZE_FORMAT_GLOBS,
+    BRONZE_RUN_PARTITIONS,
+    bronze_formats_present,
+)
 
 
 @dataclass(frozen=True, slots=True)
 class ModelSpec:
     name: str
     layer: str
-    sql_path: Path
+    sql_path: Path | None = None
+    # Inline SQL, used by silver models generated from the entity registry.
+    sql: str | None = None
+    # Builds the SQL against the current data tree, registering any relations it needs on the
+    # connection; silver models use it to read whichever bronze formats are present.
+    prepare: Callable[[Any, Path], str] | None = None
+    # Gold models with a unique key are merged per partition instead of rewritten in full; the
+    # partition column's values must be silver `dt` dates so touched partitions can be derived.
+    unique_key: tuple[str, ...] = ()
+    partition_column: str = "dt"
+    # Columns ranking rows of one key within the same partition, newest first; the full row
+    # breaks any remaining tie so repeated merges keep the same row.
+    latest_by: tuple[str, ...] = ()
+    # (upstream model, upstream key, model column) links for joined models: model rows joined
+    # to an upstream row in a touched partition are recomputed wherever their own partition is.
+    joined_keys: tuple[tuple[str, str, str], ...] = ()
+    # Upstream model names; inferred from the SQL's FROM/JOIN relations when left empty.
+    depends_on: tuple[str, ...] = ()
+    # Parquet output layout. `partition_by` columns become hive directories (the merge or
+    # bronze partition column is already a directory level and is not repeated), rows are
+    # sorted by `order_by` within each file for tighter min/max statistics, and
+    # `file_size_bytes` caps files so large partitions split into data_0.parquet, data_1...
+    partition_by: tuple[str, ...] = ()
+    order_by: tuple[str, ...] = ()
+    compression: str = "zstd"
+    compression_level: int | None = None
+    row_group_size: int | None = None
+    file_size_bytes: int | None = None
+
+    def sub_partitions(self) -> tuple[str, ...]:
+        return tuple(col for col in self.partition_by if col != self.partition_column)
+
+    def copy_options(self, partition_by: tuple[str, ...] = ()) -> str:
+        options = ["FORMAT PARQUET", f"COMPRESSION {self.compression}"]
+        if self.compression_level is not None:
+            options.append(f"COMPRESSION_LEVEL {self.compression_level}")
+        if self.row_group_size is not None:
+            options.append(f"ROW_GROUP_SIZE {self.row_group_size}")
+        if self.file_size_bytes is not None:
+            options.append(f"FILE_SIZE_BYTES {self.file_size_bytes}")
+        if partition_by:
+            # Partition columns stay in the files so readers without hive support keep them.
+            options.append(f"PARTITION_BY ({', '.join(partition_by)})")
+            options.append("WRITE_PARTITION_COLUMNS true")
+        if partition_by or self.file_size_bytes is not None:
+            options.append("FILENAME_PATTERN 'data_{i}'")
+        return ", ".join(options)
+
+    def load_sql(self) -> str:
+        if self.sql is not None:
+            return self.sql
+        if self.sql_path is None or not self.sql_path.exists():
+            return ""
+        return self.sql_path.read_text(encoding="utf-8")
+
+    def build_sql(self, conn: Any, base_dir: Path) -> str:
+        if self.prepare is not None:
+            return self.prepare(conn, base_dir)
+        return self.load_sql()
+
+
+def silver_sql_for(
+    entity: EntitySpec,
+    conn: Any,
+    base_dir: Path,
+    *,
+    partition: str = BRONZE_RUN_PARTITIONS,
+    table: str | None = None,
+) -> str:
+    entity_dir = base_dir / "bronze" / "source=stripe" / f"entity={entity.name}"
+    formats = bronze_formats_present(entity_dir, partition) or ("jsonl",)
+    if "arrow" in formats:
+        parts = sorted(entity_dir.glob(f"{partition}/{BRONZE_FORMAT_GLOBS['arrow']}"))
+        conn.register(entity.arrow_relation, read_arrow_parts(parts))
+    return entity.silver_sql(formats, partition=partition, table=table)
+
+
+_RELATION_RE = re.compile(r"\b(?:FROM|JOIN)\s+([A-Za-z_][A-Za-z0-9_]*)", re.IGNORECASE)
+
+
+def model_dependencies(specs: list[ModelSpec]) -> dict[str, tuple[str, ...]]:
+    """Upstream models of each spec, validated to name known models and form a DAG."""
+    names = {spec.name for spec in specs}
+    deps: dict[str, tuple[str, ...]] = {}
+    for spec in specs:
+        if spec.depends_on:
+            upstream = spec.depends_on
+        else:
+            referenced = _RELATION_RE.findall(spec.load_sql())
+            upstream = tuple(dict.fromkeys(n for n in referenced if n in names and n != spec.name))
+        unknown = set(upstream) - names
+        if unknown:
+            raise ValueError(f"model {spec.name} depends on unknown models: {sorted(unknown)}")
+        deps[spec.name] = upstream
+
+    visiting: set[str] = set()
+    done: set[str] = set()
+
+    def visit(name: str) -> None:
+        if name in done:
+            return
+        if name in visiting:
+            raise ValueError(f"model dependency cycle through {name}")
+        visiting.add(name)
+        for upstream_name in deps[name]:
+            visit(upstream_name)
+        visiting.discard(name)
+        done.add(name)
+
+    for name in deps:
+        visit(name)
+    return deps
 
 
 BASE_SQL_DIR = Path(__file__).resolve().parent / "sql"
 
 SILVER_MODELS: list[ModelSpec] = [
     ModelSpec(
-        name="payment_intents",
+        name=spec.name,
         layer="silver",
-        sql_path=BASE_SQL_DIR / "silver" / "payment_intents.sql",
-    ),
-    ModelSpec(name="charges", layer="silver", sql_path=BASE_SQL_DIR / "silver" / "charges.sql"),
-    ModelSpec(name="invoices", layer="silver", sql_path=BASE_SQL_DIR / "silver" / "invoices.sql"),
-    ModelSpec(name="customers", layer="silver", sql_path=BASE_SQL_DIR / "silver" / "customers.sql"),
+        sql=spec.silver_sql(),
+        prepare=functools.partial(silver_sql_for, spec),
+        order_by=(spec.primary_key,),
+    )
+    for spec in ENTITY_REGISTRY.values()
 ]
 
 GOLD_MODELS: list[ModelSpec] = [
     ModelSpec(
-        name="dim_customers", layer="gold", sql_path=BASE_SQL_DIR / "gold" / "dim_customers.sql"
+        name="dim_customers",
+        layer="gold",
+        sql_path=BASE_SQL_DIR / "gold" / "dim_customers.sql",
+        unique_key=("id",),
+        latest_by=("created_ts",),
+        partition_by=("dt",),
+        order_by=("id",),
     ),
     ModelSpec(
-        name="fct_payments", layer="gold", sql_path=BASE_SQL_DIR / "gold" / "fct_payments.sql"
+        name="fct_payments",
+        layer="gold",
+        sql_path=BASE_SQL_DIR / "gold" / "fct_payments.sql",
+        unique_key=("id",),
+        latest_by=("event_ts",),
+        joined_keys=(("payment_intents", "id", "payment_intent_id"),),
+        partition_by=("dt",),
+        order_by=("customer_id", "event_ts"),
     ),
     ModelSpec(
-        name="fct_invoices", layer="gold", sql_path=BASE_SQL_DIR / "gold" / "fct_invoices.sql"
+        name="fct_invoices",
+        layer="gold",
+        sql_path=BASE_SQL_DIR / "gold" / "fct_invoices.sql",
+        unique_key=("id",),
+        latest_by=("created_ts",),
+        partition_by=("dt",),
+        order_by=("customer_id", "created_ts"),
     ),
 ]
 
@@ -1,4 +1,3 @@
-CREATE OR REPLACE TABLE dim_customers AS
 SELECT
   id,
   max(created_ts) AS created_ts,
@@ -6,4 +5,4 @@ SELECT
   max(name) AS name,
   max(dt) AS dt
 FROM customers
-GROUP BY id;
+GROUP BY id
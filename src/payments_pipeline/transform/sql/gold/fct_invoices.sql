@@ -1,4 +1,3 @@
-CREATE OR REPLACE TABLE fct_invoices AS
 SELECT
   i.id AS id,
   i.id AS invoice_id,
@@ -10,4 +9,4 @@ SELECT
   i.period_end,
   i.created_ts,
   i.dt
-FROM invoices i;
+FROM invoices i
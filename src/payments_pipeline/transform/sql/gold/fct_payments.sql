@@ -1,4 +1,3 @@
-CREATE OR REPLACE TABLE fct_payments AS
 SELECT
   c.id AS id,
   c.id AS charge_id,
@@ -14,4 +13,4 @@ SELECT
   coalesce(c.dt, p.dt) AS dt
 FROM charges c
 LEFT JOIN payment_intents p
-  ON c.payment_intent_id = p.id;
+  ON c.payment_intent_id = p.id
@@ -0,0 +1,75 @@
+"""JSON codec that uses orjson when installed and the stdlib otherwise.
+
+Both backends emit compact UTF-8 bytes (no spaces, non-ASCII kept as-is). Strings, integers,
+booleans and null encode byte-identically either way, as do floats that need no exponent in
+either backend. Other floats keep their value but not their spelling (orjson writes `1e16` and
+`0.000025` where the stdlib writes `1e+16` and `2.5e-05`). Stripe amounts are integer minor
+units, so bronze parts do not depend on the backend in practice.
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+from collections.abc import Callable
+from typing import Any
+
+try:
+    orjson: Any = importlib.import_module("orjson")
+except Exception:  # pragma: no cover
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+# orjson's decode error and json.JSONDecodeError (and UnicodeDecodeError) are all ValueErrors.
+DecodeError = ValueError
+
+_ORJSON_OPTIONS = (
+    orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS if orjson else 0
+)
+
+
+def _stdlib_dumps(obj: Any, *, sort_keys: bool, default: Callable[[Any], Any] | None) -> bytes:
+    text = json.dumps(
+        obj, sort_keys=sort_keys, default=default, separators=(",", ":"), ensure_ascii=False
+    )
+    try:
+        return text.encode("utf-8")
+    except UnicodeEncodeError:
+        # Lone surrogates (which orjson rejects, so they always land here) have no UTF-8 form;
+        # ASCII output escapes them as \udXXX, which is still valid JSON.
+        return json.dumps(
+            obj, sort_keys=sort_keys, default=default, separators=(",", ":"), ensure_ascii=True
+        ).encode("ascii")
+
+
+def dumps(
+    obj: Any, *, sort_keys: bool = False, default: Callable[[Any], Any] | None = None
+) -> bytes:
+    if orjson is None:
+        return _stdlib_dumps(obj, sort_keys=sort_keys, default=default)
+    # Datetimes and dataclasses are passed through to `default` so they render the same as with
+    # the stdlib; values orjson rejects outright (e.g. >64-bit ints) fall back to the stdlib.
+    options = _ORJSON_OPTIONS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+    try:
+        return bytes(orjson.dumps(obj, default=default, option=options))
+    except orjson.JSONEncodeError:
+        return _stdlib_dumps(obj, sort_keys=sort_keys, default=default)
+
+
+def loads(data: bytes | str) -> Any:
+    if orjson is None:
+        return json.loads(data)
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        # orjson refuses escaped lone surrogates that the stdlib writer may have produced.
+        return json.loads(data)
+
+
+def dumps_lines(
+    rows: list[Any], *, sort_keys: bool = False, default: Callable[[Any], Any] | None = None
+) -> bytes:
+    if not rows:
+        return b""
+    return b"\n".join(dumps(row, sort_keys=sort_keys, default=default) for row in rows) + b"\n"
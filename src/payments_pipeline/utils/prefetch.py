@@ -0,0 +1,107 @@
+"""Bounded background prefetching for page iterators."""
+
+from __future__ import annotations
+
+import contextvars
+import queue
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+_DONE = object()
+_POLL_SECONDS = 0.1
+
+
+@dataclass(slots=True)
+class PrefetchStats:
+    items: int = 0
+    producer_seconds: float = 0.0
+    consumer_seconds: float = 0.0
+    wall_seconds: float = 0.0
+    # Producer stalls: the queue was full, so the consumer (enveloping and bronze writes) was
+    # the bottleneck. Consumer stalls: the queue was empty, so the API was the bottleneck.
+    producer_stalls: int = 0
+    consumer_stalls: int = 0
+
+    @property
+    def overlap_ratio(self) -> float:
+        # Share of the shorter side's busy time that ran concurrently with the other side.
+        shorter = min(self.producer_seconds, self.consumer_seconds)
+        if shorter <= 0:
+            return 0.0
+        overlap = self.producer_seconds + self.consumer_seconds - self.wall_seconds
+        return round(max(0.0, min(1.0, overlap / shorter)), 4)
+
+
+class Prefetcher(Generic[T]):
+    def __init__(self, source: Iterator[T], depth: int = 2, *, name: str = "prefetch"):
+        self._source = source
+        self._queue: queue.Queue[object] = queue.Queue(maxsize=max(1, depth))
+        self._stop = threading.Event()
+        self.stats = PrefetchStats()
+        self._started = time.perf_counter()
+        context = contextvars.copy_context()
+        self._thread = threading.Thread(
+            target=context.run, args=(self._produce,), name=name, daemon=True
+        )
+        self._thread.start()
+
+    def _put(self, item: object) -> bool:
+        if self._queue.full():
+            self.stats.producer_stalls += 1
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce(self) -> None:
+        try:
+            while not self._stop.is_set():
+                started = time.perf_counter()
+                try:
+                    item = next(self._source)
+                except StopIteration:
+                    self._put(_DONE)
+                    return
+                finally:
+                    self.stats.producer_seconds += time.perf_counter() - started
+                if not self._put(item):
+                    return
+        except BaseException as exc:
+            # Re-raised on the consumer thread.
+            self._put(exc)
+        finally:
+            close = getattr(self._source, "close", None)
+            if close is not None:
+                close()
+
+    def __iter__(self) -> Iterator[T]:
+        try:
+            while True:
+                if self._queue.empty():
+                    self.stats.consumer_stalls += 1
+                item = self._queue.get()
+                if item is _DONE:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                self.stats.items += 1
+                started = time.perf_counter()
+                yield item  # type: ignore[misc]
+                self.stats.consumer_seconds += time.perf_counter() - started
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        if self._stop.is_set():
+            return
+        self._stop.set()
+        self._thread.join()
+        self.stats.wall_seconds = time.perf_counter() - self._started
@@ -0,0 +1,128 @@
+"""Thread-safe client-side rate limiting and circuit breaking."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+
+
+class CircuitOpenError(RuntimeError):
+    pass
+
+
+class TokenBucket:
+    def __init__(
+        self,
+        rate_per_second: float,
+        burst: int = 1,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if rate_per_second <= 0:
+            raise ValueError("rate_per_second must be positive")
+        self.rate_per_second = rate_per_second
+        self.capacity = float(max(1, burst))
+        self._tokens = self.capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        # Reserve a token under the lock (the balance may go negative) and sleep outside it, so
+        # concurrent callers queue fairly behind each other instead of spinning.
+        wait = self.reserve()
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def reserve(self) -> float:
+        # Takes a token and returns how long the caller must wait before using it, without
+        # sleeping; asyncio callers await the delay themselves.
+        with self._lock:
+            now = self._clock()
+            elapsed = now - self._updated
+            self._updated = now
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate_per_second)
+            self._tokens -= 1.0
+            return -self._tokens / self.rate_per_second if self._tokens < 0 else 0.0
+
+    def try_acquire(self) -> bool:
+        # Takes a token only if one is free right now; for optional work such as hedges.
+        with self._lock:
+            now = self._clock()
+            elapsed = now - self._updated
+            self._updated = now
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate_per_second)
+            if self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+            return True
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_seconds: float = 30.0,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._consecutive_failures = 0
+        self._opened_at: float | None = None
+        # Half-open admits a single probe; the rest are rejected until it reports back. A probe
+        # that never reports (its caller died) is replaced after another `reset_seconds`.
+        self._probe_in_flight = False
+        self._probe_started_at = 0.0
+        self.open_count = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state_locked()
+
+    def _state_locked(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if self._clock() - self._opened_at >= self.reset_seconds:
+            return "half_open"
+        return "open"
+
+    def before_call(self) -> None:
+        with self._lock:
+            state = self._state_locked()
+            if state == "half_open":
+                now = self._clock()
+                if not self._probe_in_flight or now - self._probe_started_at >= self.reset_seconds:
+                    self._probe_in_flight = True
+                    self._probe_started_at = now
+                    return
+            if state != "closed":
+                self.rejected += 1
+                raise CircuitOpenError(
+                    f"circuit open after {self._consecutive_failures} consecutive failures"
+                )
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._consecutive_failures = 0
+            self._opened_at = None
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._probe_in_flight = False
+            self._consecutive_failures += 1
+            state = self._state_locked()
+            if state == "half_open" or (
+                state == "closed" and self._consecutive_failures >= self.failure_threshold
+            ):
+                self._opened_at = self._clock()
+                self.open_count += 1
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import math
 import random
+import threading
 import time
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Awaitable, Callable
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
 from dataclasses import dataclass
 from typing import Any, TypeVar
 
@@ -20,6 +25,155 @@ class RetryConfig:
     jitter_ratio: float = 0.2
 
 
+class RetryBudget:
+    # Pipeline-wide cap on retries: once retries exceed `ratio` of all calls seen (with a small
+    # floor so the first failures of a run can still retry), further retries are refused and
+    # the original error surfaces immediately instead of multiplying load on a degraded API.
+    def __init__(self, ratio: float = 0.1, min_retries: int = 10):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.retries = 0
+        self.denied = 0
+
+    def record_call(self) -> None:
+        with self._lock:
+            self.calls += 1
+
+    def try_acquire(self) -> bool:
+        with self._lock:
+            if self.retries < max(self.min_retries, self.ratio * self.calls):
+                self.retries += 1
+                return True
+            self.denied += 1
+            return False
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "ratio": self.ratio,
+                "calls": self.calls,
+                "retries": self.retries,
+                "denied": self.denied,
+                "consumed": round(self.retries / self.calls, 4) if self.calls else 0.0,
+            }
+
+
+class LatencyTracker:
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.min_samples = min_samples
+        self._samples: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, pct: float) -> float | None:
+        with self._lock:
+            if len(self._samples) < self.min_samples:
+                return None
+            ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, math.ceil(pct / 100 * len(ordered)) - 1))
+        return ordered[index]
+
+
+def hedged_call(
+    func: Callable[[], T],
+    *,
+    hedge_after_seconds: float | None,
+    executor: Executor,
+    on_hedge: Callable[[], None] | None = None,
+    acquire_hedge: Callable[[], bool] | None = None,
+) -> tuple[T, bool]:
+    # Runs `func`; if it has not finished after `hedge_after_seconds`, a duplicate is issued and
+    # whichever succeeds first wins. Returns (result, hedge_won). `acquire_hedge` gates the
+    # duplicate (e.g. on a free rate-limit token); when it returns False the primary is awaited.
+    primary = executor.submit(func)
+    if hedge_after_seconds is None:
+        return primary.result(), False
+    done, _ = wait([primary], timeout=hedge_after_seconds)
+    if done or (acquire_hedge is not None and not acquire_hedge()):
+        return primary.result(), False
+
+    if on_hedge is not None:
+        on_hedge()
+    hedge = executor.submit(func)
+    pending: set[Future[T]] = {primary, hedge}
+    error: BaseException | None = None
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            exc = future.exception()
+            if exc is None:
+                return future.result(), future is hedge
+            error = exc
+    raise error or RuntimeError("hedged call finished without a result")
+
+
+def _backoff_seconds(cfg: RetryConfig, attempt: int) -> float:
+    exp_delay = min(cfg.max_delay_seconds, cfg.base_delay_seconds * (2 ** (attempt - 1)))
+    jitter = exp_delay * cfg.jitter_ratio * random.random()
+    return float(exp_delay + jitter)
+
+
+def _sleep_seconds(
+    cfg: RetryConfig,
+    attempt: int,
+    exc: Exception,
+    delay_hint: Callable[[Exception], float | None] | None,
+) -> float:
+    # A server-provided hint (e.g. Retry-After) replaces exponential backoff for that attempt.
+    hinted = delay_hint(exc) if delay_hint else None
+    if hinted is not None:
+        return max(0.0, hinted)
+    return _backoff_seconds(cfg, attempt)
+
+
+@dataclass(slots=True)
+class _RetryPolicy:
+    # The per-attempt decision shared by `retry_call` and `async_retry_call`; the wrappers only
+    # run the attempt loop and sleep the way their caller needs.
+    retryable_exceptions: tuple[type[Exception], ...]
+    config: RetryConfig
+    logger: logging.Logger | None
+    metrics: dict[str, int] | None
+    delay_hint: Callable[[Exception], float | None] | None
+    budget: RetryBudget | None
+    retry_if: Callable[[Exception], bool] | None
+
+    def start_attempt(self) -> None:
+        if self.budget is not None:
+            self.budget.record_call()
+
+    def retry_delay(self, attempt: int, exc: Exception) -> float | None:
+        """Seconds to wait before the next attempt, or None to re-raise `exc`."""
+        # `retry_if` narrows broad exception types (e.g. an API client's single error class)
+        # to the transient cases; anything else surfaces on the first attempt.
+        if self.retry_if is not None and not self.retry_if(exc):
+            return None
+        if self.metrics is not None:
+            self.metrics["retries"] = self.metrics.get("retries", 0) + 1
+        exhausted = attempt >= self.config.max_attempts
+        if exhausted or (self.budget is not None and not self.budget.try_acquire()):
+            if self.metrics is not None:
+                self.metrics["failures"] = self.metrics.get("failures", 0) + 1
+            if self.logger:
+                self.logger.error(
+                    "retry_exhausted" if exhausted else "retry_budget_exhausted",
+                    extra={"attempt": attempt, "error": str(exc)},
+                )
+            return None
+        sleep_for = _sleep_seconds(self.config, attempt, exc, self.delay_hint)
+        if self.logger:
+            self.logger.warning(
+                "retrying",
+                extra={"attempt": attempt, "sleep_seconds": round(sleep_for, 3), "error": str(exc)},
+            )
+        return sleep_for
+
+
 def retry_call(
     func: Callable[[], T],
     *,
@@ -27,38 +181,51 @@ def retry_call(
     config: RetryConfig | None = None,
     logger: logging.Logger | None = None,
     metrics: dict[str, int] | None = None,
+    delay_hint: Callable[[Exception], float | None] | None = None,
+    budget: RetryBudget | None = None,
+    retry_if: Callable[[Exception], bool] | None = None,
 ) -> T:
-    cfg = config or RetryConfig()
+    policy = _RetryPolicy(
+        retryable_exceptions, config or RetryConfig(), logger, metrics, delay_hint, budget, retry_if
+    )
     attempt = 0
     while True:
         attempt += 1
+        policy.start_attempt()
         try:
             return func()
-        except retryable_exceptions as exc:
-            if metrics is not None:
-                metrics["retries"] = metrics.get("retries", 0) + 1
-            if attempt >= cfg.max_attempts:
-                if metrics is not None:
-                    metrics["failures"] = metrics.get("failures", 0) + 1
-                if logger:
-                    logger.error(
-                        "retry_exhausted",
-                        extra={"attempt": attempt, "error": str(exc)},
-                    )
+        except policy.retryable_exceptions as exc:
+            delay = policy.retry_delay(attempt, exc)
+            if delay is None:
                 raise
-            exp_delay = min(cfg.max_delay_seconds, cfg.base_delay_seconds * (2 ** (attempt - 1)))
-            jitter = exp_delay * cfg.jitter_ratio * random.random()
-            sleep_for = exp_delay + jitter
-            if logger:
-                logger.warning(
-                    "retrying",
-                    extra={
-                        "attempt": attempt,
-                        "sleep_seconds": round(sleep_for, 3),
-                        "error": str(exc),
-                    },
-                )
-            time.sleep(sleep_for)
+            time.sleep(delay)
+
+
+async def async_retry_call(
+    func: Callable[[], Awaitable[T]],
+    *,
+    retryable_exceptions: tuple[type[Exception], ...],
+    config: RetryConfig | None = None,
+    logger: logging.Logger | None = None,
+    metrics: dict[str, int] | None = None,
+    delay_hint: Callable[[Exception], float | None] | None = None,
+    budget: RetryBudget | None = None,
+    retry_if: Callable[[Exception], bool] | None = None,
+) -> T:
+    policy = _RetryPolicy(
+        retryable_exceptions, config or RetryConfig(), logger, metrics, delay_hint, budget, retry_if
+    )
+    attempt = 0
+    while True:
+        attempt += 1
+        policy.start_attempt()
+        try:
+            return await func()
+        except policy.retryable_exceptions as exc:
+            delay = policy.retry_delay(attempt, exc)
+            if delay is None:
+                raise
+            await asyncio.sleep(delay)
 
 
 def retry(
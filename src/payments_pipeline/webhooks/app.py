@@ -2,16 +2,27 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 
 from payments_pipeline.clients.webhook_signing import SignatureVerificationError
 from payments_pipeline.config.settings import Settings, get_settings
+from payments_pipeline.load.object_store import close_shared_object_stores
 from payments_pipeline.webhooks.handler import handle_stripe_webhook
 
 
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    yield
+    # Drain queued uploads and stop the shared stores' worker pools on shutdown.
+    close_shared_object_stores()
+
+
 def create_app(settings: Settings | None = None) -> FastAPI:
-    app = FastAPI(title="payments-pipeline-webhooks")
+    app = FastAPI(title="payments-pipeline-webhooks", lifespan=_lifespan)
     app.state.settings = settings or get_settings()
 
     @app.get("/health")
@@ -6,7 +6,7 @@ from dataclasses import dataclass
 
 from payments_pipeline.clients.webhook_signing import (
     SignatureVerificationError,
-    extract_event_id,
+    parse_event,
     verify_signature,
 )
 from payments_pipeline.config.logging import get_logger
@@ -36,14 +36,16 @@ def handle_stripe_webhook(
             tolerance_seconds=settings.safety_window_seconds,
         )
 
-    event_id = extract_event_id(payload_bytes)
+    event_id, event = parse_event(payload_bytes)
     repo = WebhookRepository(settings)
 
     if repo.exists(event_id):
         logger.info("webhook_duplicate", extra={"event_id": event_id})
         return HandlerResult(accepted=True, duplicate=True, event_id=event_id, stored_path=None)
 
-    stored = repo.write(event_id=event_id, payload=payload_bytes, headers=headers)
+    stored = repo.write(
+        event_id=event_id, payload=payload_bytes, headers=headers, parsed_payload=event
+    )
     logger.info("webhook_stored", extra={"event_id": event_id, "path": stored})
     return HandlerResult(accepted=True, duplicate=False, event_id=event_id, stored_path=stored)
 
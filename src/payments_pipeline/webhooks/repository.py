@@ -2,34 +2,20 @@
 
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass, field
 from typing import Any
 
 from payments_pipeline.config.settings import Settings
-from payments_pipeline.load.filesystem_adapter import FilesystemAdapter
+from payments_pipeline.load.object_store import ObjectStore, shared_object_store
+from payments_pipeline.utils import codec
 from payments_pipeline.utils.ids import sanitize_id_for_path
 from payments_pipeline.utils.time import to_iso, utc_now
 
-try:
-    import boto3
-except Exception:  # pragma: no cover
-    boto3 = None
 
-
-@dataclass(slots=True)
 class WebhookRepository:
-    settings: Settings
-    fs: FilesystemAdapter = field(init=False)
-    s3: Any = field(init=False, default=None)
-
-    def __post_init__(self) -> None:
-        self.fs = FilesystemAdapter(self.settings.local_data_dir)
-        self.s3 = (
-            boto3.client("s3", region_name=self.settings.aws_region)
-            if boto3 and self.settings.pipeline_env == "AWS"
-            else None
-        )
+    def __init__(self, settings: Settings, *, store: ObjectStore | None = None):
+        self.settings = settings
+        # Shared per process by default, so each webhook request reuses the pooled S3 client.
+        self.store = store or shared_object_store(settings)
 
     def _marker_key(self, event_id: str) -> str:
         safe = sanitize_id_for_path(event_id)
@@ -41,19 +27,16 @@ class WebhookRepository:
         return f"bronze/source=stripe/entity=webhook_events/dt={dt}/event_id={safe}/payload.json"
 
     def exists(self, event_id: str) -> bool:
-        key = self._marker_key(event_id)
-        if self.settings.pipeline_env == "AWS":
-            if not self.s3 or not self.settings.s3_bucket:
-                raise RuntimeError("S3 repository unavailable")
-            try:
-                self.s3.head_object(Bucket=self.settings.s3_bucket, Key=key)
-                return True
-            except Exception:
-                return False
-        return self.fs.exists(key)
+        return self.store.exists(self._marker_key(event_id))
 
     def write(
-        self, event_id: str, payload: bytes, headers: dict[str, str], received_ts: str | None = None
+        self,
+        event_id: str,
+        payload: bytes,
+        headers: dict[str, str],
+        received_ts: str | None = None,
+        *,
+        parsed_payload: dict[str, Any] | None = None,
     ) -> str:
         ts = received_ts or to_iso(utc_now())
         payload_key = self._payload_key(event_id, ts)
@@ -63,20 +46,12 @@ class WebhookRepository:
             "event_id": event_id,
             "received_ts": ts,
             "headers": headers,
-            "payload": json.loads(payload.decode("utf-8")),
+            "payload": parsed_payload if parsed_payload is not None else codec.loads(payload),
         }
 
-        if self.settings.pipeline_env == "AWS":
-            if not self.s3 or not self.settings.s3_bucket:
-                raise RuntimeError("S3 repository unavailable")
-            self.s3.put_object(
-                Bucket=self.settings.s3_bucket,
-                Key=payload_key,
-                Body=json.dumps(envelope).encode("utf-8"),
-            )
-            self.s3.put_object(Bucket=self.settings.s3_bucket, Key=marker_key, Body=b"1")
-            return f"s3://{self.settings.s3_bucket}/{payload_key}"
-
-        location = self.fs.put_json(payload_key, envelope)
-        self.fs.put_bytes(marker_key, b"1")
+        # The marker is written only after the payload, so `exists` never hides a lost event.
+        location = self.store.put(payload_key, codec.dumps(envelope, default=str))
+        self.store.put(marker_key, b"1")
+        # Each event is acknowledged individually, so make it durable before returning.
+        self.store.sync()
         return location
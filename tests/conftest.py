@@ -0,0 +1,123 @@
+"""Shared fixtures: charge payloads, a bronze writer helper and fake API clients."""
+
+import json
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pytest
+import requests
+
+from mock_api.data_generator import filter_and_paginate, generate_dataset
+from payments_pipeline.clients.mock_stripe import MockStripeClient
+from payments_pipeline.clients.stripe_like_interface import ListPage
+from payments_pipeline.config.settings import Settings
+from payments_pipeline.load.writer import BronzeWriter
+
+ChargeRows = Callable[..., list[dict[str, Any]]]
+WriteCharges = Callable[..., list[Path]]
+
+
+@pytest.fixture
+def charge_rows() -> ChargeRows:
+    """Factory for charge payloads carrying every field silver declares."""
+
+    def make(count: int, *, id_prefix: str = "ch_", **extra: Any) -> list[dict[str, Any]]:
+        return [
+            {
+                "id": f"{id_prefix}{i}",
+                "created": 1_700_000_000 + i,
+                "amount": 100 + i,
+                "currency": "usd",
+                "status": "succeeded",
+                "customer": "cus_1",
+                "payment_intent": f"pi_{i}",
+                "invoice": None,
+                **extra,
+            }
+            for i in range(count)
+        ]
+
+    return make
+
+
+@pytest.fixture
+def write_charges() -> WriteCharges:
+    """Writes charge payloads as one bronze run partition; returns the part paths."""
+
+    def write(
+        settings: Settings, rows: list[dict[str, Any]], run_id: str, dt: str, **kwargs: Any
+    ) -> list[Path]:
+        result = BronzeWriter(settings).write_bronze_jsonl(
+            "charges", [{"data": row} for row in rows], {"run_id": run_id, "dt": dt}, **kwargs
+        )
+        return [Path(path) for path in result.paths]
+
+    return write
+
+
+class FakeResponse:
+    """Stands in for `requests.Response` on a patched `client.session.get`."""
+
+    def __init__(
+        self,
+        status_code: int = 200,
+        payload: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.url = "http://mock/v1/charges"
+        self.content = json.dumps(payload or {"data": [], "has_more": False}).encode("utf-8")
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(response=self)  # type: ignore[arg-type]
+
+    def json(self) -> dict[str, Any]:
+        return json.loads(self.content)
+
+
+class InProcessClient(MockStripeClient):
+    """Paginates the generated mock dataset in process; `fail_after` fails that cursor's page."""
+
+    def __init__(self, fail_after: str | None = None) -> None:
+        super().__init__("http://unused")
+        self.dataset = generate_dataset()
+        self.fail_after = fail_after
+
+    def list_entity(
+        self,
+        entity: str,
+        *,
+        created_gte: int | None,
+        created_lte: int | None,
+        starting_after: str | None,
+        limit: int,
+    ) -> ListPage:
+        if self.fail_after is not None and starting_after == self.fail_after:
+            raise RuntimeError("upstream went away")
+        data, has_more = filter_and_paginate(
+            self.dataset[entity],
+            created_gte=created_gte,
+            created_lte=created_lte,
+            starting_after=starting_after,
+            limit=limit,
+        )
+        return ListPage(
+            entity=entity,
+            data=data,
+            has_more=has_more,
+            next_cursor=data[-1]["id"] if has_more and data else None,
+            request_meta={"retries": 0, "failures": 0},
+        )
+
+
+@pytest.fixture
+def fake_response() -> type[FakeResponse]:
+    return FakeResponse
+
+
+@pytest.fixture
+def in_process_client() -> type[InProcessClient]:
+    return InProcessClient
@@ -1,10 +1,14 @@
+import contextlib
 import os
 import subprocess
 import time
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
 
 import requests
 
+from payments_pipeline import cli
 from payments_pipeline.cli import main
 from payments_pipeline.config.settings import get_settings
 
@@ -22,8 +26,8 @@ def _wait_for_health(url: str, timeout: float = 15.0) -> None:
     raise AssertionError(f"Service did not become healthy: {url}")
 
 
-def test_local_mode_end_to_end(tmp_path: Path, monkeypatch) -> None:
-    api_port = 8011
+@contextlib.contextmanager
+def _mock_api(port: int) -> Iterator[str]:
     api_proc = subprocess.Popen(
         [
             os.environ.get("PYTHON", "python3"),
@@ -33,21 +37,33 @@ def test_local_mode_end_to_end(tmp_path: Path, monkeypatch) -> None:
             "--host",
             "127.0.0.1",
             "--port",
-            str(api_port),
+            str(port),
         ],
         stdout=subprocess.DEVNULL,
         stderr=subprocess.DEVNULL,
     )
-
     try:
-        _wait_for_health(f"http://127.0.0.1:{api_port}/health")
-
-        monkeypatch.setenv("PIPELINE_ENV", "LOCAL")
-        monkeypatch.setenv("LOCAL_DATA_DIR", str(tmp_path / "_local_data"))
-        monkeypatch.setenv("MOCK_API_BASE_URL", f"http://127.0.0.1:{api_port}")
-        monkeypatch.setenv("MAX_PAGE_SIZE", "50")
+        base_url = f"http://127.0.0.1:{port}"
+        _wait_for_health(f"{base_url}/health")
+        yield base_url
+    finally:
+        api_proc.terminate()
+        api_proc.wait(timeout=10)
         get_settings.cache_clear()
 
+
+def _local_env(monkeypatch, data_dir: Path, base_url: str) -> None:
+    monkeypatch.setenv("PIPELINE_ENV", "LOCAL")
+    monkeypatch.setenv("LOCAL_DATA_DIR", str(data_dir))
+    monkeypatch.setenv("MOCK_API_BASE_URL", base_url)
+    monkeypatch.setenv("MAX_PAGE_SIZE", "50")
+    get_settings.cache_clear()
+
+
+def test_local_mode_end_to_end(tmp_path: Path, monkeypatch) -> None:
+    with _mock_api(8011) as base_url:
+        _local_env(monkeypatch, tmp_path / "_local_data", base_url)
+
         assert main(["run-all", "--days", "1"]) == 0
         assert main(["run-transforms"]) == 0
         assert main(["run-quality"]) == 0
@@ -56,7 +72,26 @@ def test_local_mode_end_to_end(tmp_path: Path, monkeypatch) -> None:
         assert (tmp_path / "_local_data" / "silver").exists()
         assert (tmp_path / "_local_data" / "gold").exists()
         assert any((tmp_path / "_local_data" / "gold").rglob("data.parquet"))
-    finally:
-        api_proc.terminate()
-        api_proc.wait(timeout=10)
-        get_settings.cache_clear()
+
+
+def test_rerun_with_same_run_id_is_served_from_page_cache(tmp_path: Path, monkeypatch) -> None:
+    manifests: list[dict[str, Any]] = []
+    write_run_manifest = cli.write_run_manifest
+
+    def _capture(store: Any, run_id: str, payload: dict[str, Any]) -> Path:
+        manifests.append(payload)
+        return write_run_manifest(store, run_id, payload)
+
+    monkeypatch.setattr(cli, "write_run_manifest", _capture)
+    with _mock_api(8012) as base_url:
+        _local_env(monkeypatch, tmp_path / "_local_data", base_url)
+        monkeypatch.setenv("PAGE_CACHE_MODE", "record")
+
+        for _ in range(2):
+            main(["--run-id", "rerun-1", "run-pipeline", "--days", "3"])
+            get_settings.cache_clear()
+
+    first, second = [m["api"] for m in manifests if "extract" in m]
+    assert first["api_calls"] > 0
+    assert second["api_calls"] == 0
+    assert second["cache_hits"] == first["cache_misses"]
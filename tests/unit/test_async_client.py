@@ -0,0 +1,166 @@
+import asyncio
+from pathlib import Path
+
+import httpx
+import pytest
+
+from mock_api.app import create_app
+from payments_pipeline.cli import build_parser
+from payments_pipeline.clients.async_stripe import AsyncMockStripeClient
+from payments_pipeline.clients.page_cache import PageCache
+from payments_pipeline.config.settings import Settings
+from payments_pipeline.extract.async_driver import extract_entities_async
+from payments_pipeline.extract.charges import ChargesExtractor
+from payments_pipeline.extract.customers import CustomersExtractor
+from payments_pipeline.load.writer import BronzeWriter
+from payments_pipeline.state.watermarks import WatermarkStore
+from payments_pipeline.utils.rate_limit import CircuitOpenError
+
+
+def test_async_driver_extracts_against_in_process_mock_api(tmp_path: Path) -> None:
+    settings = Settings(local_data_dir=tmp_path, max_page_size=10)
+    app = create_app()
+    expected = {name: len(app.state.dataset[name]) for name in ("charges", "customers")}
+
+    async def _run():
+        client = AsyncMockStripeClient(
+            "http://mock", max_in_flight=8, transport=httpx.ASGITransport(app=app)
+        )
+        async with client:
+            writer = BronzeWriter(settings)
+            extractors = {
+                "charges": ChargesExtractor(client, writer),  # type: ignore[arg-type]
+                "customers": CustomersExtractor(client, writer),  # type: ignore[arg-type]
+            }
+            outcome = await extract_entities_async(
+                extractors,
+                ["charges", "customers"],
+                client,
+                {"run_id": "run-async", "settings": settings},
+                days=60,
+            )
+        return outcome, client.metrics
+
+    outcome, metrics = asyncio.run(_run())
+
+    assert outcome.ok
+    assert {r.entity: r.records for r in outcome.results} == expected
+    assert metrics.api_calls == sum(r.api_calls for r in outcome.results)
+    store = WatermarkStore(settings.watermarks_root)
+    assert store.load("charges").last_run_id == "run-async"
+
+
+def test_async_client_bounds_requests_in_flight() -> None:
+    state = {"active": 0, "peak": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.01)
+        state["active"] -= 1
+        return httpx.Response(200, json={"data": [], "has_more": False})
+
+    async def _run() -> None:
+        client = AsyncMockStripeClient(
+            "http://mock", max_in_flight=3, transport=httpx.MockTransport(handler)
+        )
+        async with client:
+            await asyncio.gather(
+                *(
+                    client.list_entity(
+                        "charges",
+                        created_gte=None,
+                        created_lte=None,
+                        starting_after=None,
+                        limit=10,
+                    )
+                    for _ in range(20)
+                )
+            )
+
+    asyncio.run(_run())
+    assert state["peak"] == 3
+
+
+def test_async_client_shares_rate_limiter_and_page_cache(tmp_path: Path) -> None:
+    calls: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(str(request.url))
+        return httpx.Response(200, json={"data": [{"id": "ch_1"}], "has_more": False})
+
+    async def _run() -> None:
+        client = AsyncMockStripeClient(
+            "http://mock",
+            transport=httpx.MockTransport(handler),
+            rate_limit_per_second=1000,
+            rate_limit_burst=1,
+            page_cache=PageCache(tmp_path),
+        )
+        async with client:
+            for _ in range(2):
+                await client.list_entity(
+                    "charges", created_gte=0, created_lte=10, starting_after=None, limit=10
+                )
+        assert client.rate_limiter is not None
+        assert (client.metrics.cache_misses, client.metrics.cache_hits) == (1, 1)
+
+    asyncio.run(_run())
+    assert len(calls) == 1
+
+
+def test_async_and_parallel_are_mutually_exclusive() -> None:
+    with pytest.raises(SystemExit):
+        build_parser().parse_args(["run-all", "--async", "--parallel", "4"])
+
+
+def _list_async(client: AsyncMockStripeClient):
+    return client.list_entity(
+        "charges", created_gte=None, created_lte=None, starting_after=None, limit=10
+    )
+
+
+def test_async_client_honours_retry_after(monkeypatch) -> None:
+    responses = [httpx.Response(429, headers={"Retry-After": "2"}), httpx.Response(200, json={})]
+    sleeps: list[float] = []
+
+    async def _sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+
+    monkeypatch.setattr("payments_pipeline.utils.retry.asyncio.sleep", _sleep)
+
+    async def _run():
+        client = AsyncMockStripeClient(
+            "http://mock", transport=httpx.MockTransport(lambda request: responses.pop(0))
+        )
+        async with client:
+            return await _list_async(client), client.metrics
+
+    page, metrics = asyncio.run(_run())
+
+    assert sleeps == [2.0]
+    assert page.request_meta["throttle_seconds"] == 2.0
+    assert metrics.throttle_seconds == 2.0
+
+
+def test_async_client_circuit_fails_fast_after_sustained_errors(monkeypatch) -> None:
+    async def _sleep(seconds: float) -> None:
+        return None
+
+    monkeypatch.setattr("payments_pipeline.utils.retry.asyncio.sleep", _sleep)
+
+    async def _run():
+        client = AsyncMockStripeClient(
+            "http://mock",
+            transport=httpx.MockTransport(lambda request: httpx.Response(502)),
+            circuit_failure_threshold=2,
+        )
+        async with client:
+            with pytest.raises(CircuitOpenError):
+                await _list_async(client)
+        return client.metrics
+
+    metrics = asyncio.run(_run())
+
+    assert metrics.circuit_opened == 1
+    assert metrics.circuit_rejections == 1
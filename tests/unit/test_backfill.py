@@ -0,0 +1,70 @@
+import json
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from payments_pipeline.config.settings import Settings
+from payments_pipeline.extract.backfill import BackfillCheckpoint, run_backfill
+from payments_pipeline.extract.charges import ChargesExtractor
+from payments_pipeline.load.writer import BronzeWriter
+from payments_pipeline.state.watermarks import WatermarkStore
+
+
+def _day_ids(client, day) -> list[str]:
+    start = int(datetime(day.year, day.month, day.day, tzinfo=UTC).timestamp())
+    return [r["id"] for r in client.dataset["charges"] if start <= r["created"] <= start + 86399]
+
+
+def _run_dir(root: Path, run_id: str) -> Path:
+    (run_dir,) = root.glob(f"bronze/source=stripe/entity=charges/dt=*/run_id={run_id}")
+    return run_dir
+
+
+def _bronze_ids(run_dir: Path) -> list[str]:
+    ids = []
+    for path in sorted(run_dir.glob("part-*.jsonl")):
+        ids.extend(json.loads(line)["data"]["id"] for line in path.read_text().splitlines())
+    return ids
+
+
+def test_backfill_resumes_mid_day_from_checkpoint(tmp_path: Path, in_process_client) -> None:
+    settings = Settings(local_data_dir=tmp_path, max_page_size=2, bronze_part_max_records=2)
+    end = datetime.now(tz=UTC).date() - timedelta(days=1)
+    start = end - timedelta(days=2)
+    probe = in_process_client()
+    target_ids = _day_ids(probe, end)
+    context = {"run_id": "bf-1", "settings": settings}
+
+    def _run(client):
+        checkpoint = BackfillCheckpoint.load(settings.backfills_root, "charges", start, end)
+        checkpoint = checkpoint or BackfillCheckpoint.create(
+            settings.backfills_root, "charges", start, end, "bf-1"
+        )
+        extractor = ChargesExtractor(client, BronzeWriter(settings))
+        return run_backfill(
+            extractor, context, start=start, end=end, checkpoint=checkpoint, workers=2
+        )
+
+    first = _run(in_process_client(fail_after=target_ids[3]))
+    assert not first.ok
+    assert list(first.failed_days) == [end.isoformat()]
+    assert first.days_done == 2
+    state = BackfillCheckpoint.load(settings.backfills_root, "charges", start, end)
+    assert state is not None
+    assert state.day(end.isoformat())["cursor"] == target_ids[3]
+    assert state.day(end.isoformat())["parts"] == 2
+
+    second = _run(in_process_client())
+    assert second.ok
+    assert second.days_resumed == 2
+    assert second.records == len(target_ids) - 4
+    # Days land in the ingest-day dt partition, one run partition per data day.
+    run_dir = _run_dir(tmp_path, f"bf-1-{end.isoformat()}")
+    assert run_dir.parent.name == f"dt={state.dt}"
+    assert sorted(_bronze_ids(run_dir)) == sorted(target_ids)
+    # The sidecar covers the parts written before the failure as well.
+    sidecar = json.loads((run_dir / "_metadata.json").read_text())
+    assert sidecar["record_count"] == len(target_ids)
+    part_bytes = sum(path.stat().st_size for path in run_dir.glob("part-*.jsonl"))
+    assert sidecar["compression"]["stored_bytes"] == part_bytes
+    watermark = WatermarkStore(settings.watermarks_root).load("charges")
+    assert watermark.last_success_created_ts == second.watermark
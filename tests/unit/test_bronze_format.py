@@ -0,0 +1,105 @@
+import json
+from pathlib import Path
+from typing import Any
+
+import duckdb
+import pyarrow.ipc as pa_ipc
+import pyarrow.parquet as pq
+import pytest
+from pydantic import ValidationError
+
+from payments_pipeline.config.settings import Settings
+from payments_pipeline.extract.registry import ENTITY_REGISTRY
+from payments_pipeline.load import columnar
+from payments_pipeline.quality.reconciliation import _count_bronze_records
+from payments_pipeline.quality.schema import run_schema_drift
+from payments_pipeline.transform.models import MODEL_EXECUTION_ORDER
+
+
+def _rows(charge_rows) -> list[dict[str, Any]]:
+    return charge_rows(12, metadata={"channel": "web"})
+
+
+def _write(tmp_path: Path, write_charges, rows, fmt: str, dt: str, **kwargs: Any) -> list[Path]:
+    settings = Settings(local_data_dir=tmp_path, bronze_format=fmt)
+    return write_charges(settings, rows, f"run-{fmt}", dt, chunk_size=5, **kwargs)
+
+
+def test_parquet_parts_keep_typed_columns_and_raw_json(
+    tmp_path: Path, charge_rows, write_charges
+) -> None:
+    rows = _rows(charge_rows)
+    paths = _write(tmp_path, write_charges, rows, "parquet", "2024-01-01")
+
+    assert [p.name for p in paths] == [
+        "part-00000.parquet",
+        "part-00001.parquet",
+        "part-00002.parquet",
+    ]
+    table = pq.read_table(paths[0])
+    assert str(table.schema.field("amount").type) == "int64"
+    # BRONZE_COMPRESSION=none means uncompressed column chunks, as the sidecar reports.
+    column = pq.ParquetFile(paths[0]).metadata.row_group(0).column(0)
+    assert column.compression == "UNCOMPRESSED"
+    assert json.loads(table.column("raw_json")[0].as_py()) == {"data": rows[0]}
+    sidecar = json.loads((paths[0].parent / "_metadata.json").read_text())
+    assert sidecar["format"] == "parquet"
+    assert sidecar["compression"]["codec"] == "none"
+    assert sidecar["compression"]["raw_bytes"] > 0
+
+
+def test_silver_reads_every_bronze_format(tmp_path: Path, charge_rows, write_charges) -> None:
+    charges = _rows(charge_rows)
+    _write(tmp_path, write_charges, charges, "jsonl", "2024-01-01")
+    _write(tmp_path, write_charges, charges, "parquet", "2024-01-02")
+    _write(tmp_path, write_charges, charges, "arrow", "2024-01-03", write_sidecar=False)
+    spec = next(s for s in MODEL_EXECUTION_ORDER if s.name == "charges")
+
+    conn = duckdb.connect()
+    sql = spec.build_sql(conn, tmp_path).replace("{{LOCAL_DATA_DIR}}", tmp_path.as_posix())
+    conn.execute(sql)
+    rows = conn.execute(
+        "SELECT CAST(dt AS VARCHAR), COUNT(*), SUM(amount) FROM charges GROUP BY 1 ORDER BY 1"
+    ).fetchall()
+
+    total = sum(row["amount"] for row in charges)
+    assert rows == [("2024-01-01", 12, total), ("2024-01-02", 12, total), ("2024-01-03", 12, total)]
+    assert _count_bronze_records(tmp_path / "bronze/source=stripe/entity=charges") == 36
+
+
+def test_null_only_day_keeps_declared_types_and_reports_drift(
+    tmp_path: Path, charge_rows, write_charges
+) -> None:
+    settings = Settings(local_data_dir=tmp_path)
+    rows = _rows(charge_rows)
+    write_charges(
+        settings, [{**row, "amount": None, "refunded": False} for row in rows], "r", "2024-01-01"
+    )
+    spec = next(s for s in MODEL_EXECUTION_ORDER if s.name == "charges")
+
+    conn = duckdb.connect()
+    conn.execute(spec.build_sql(conn, tmp_path).replace("{{LOCAL_DATA_DIR}}", tmp_path.as_posix()))
+    types = dict(conn.execute("SELECT column_name, column_type FROM (DESCRIBE charges)").fetchall())
+
+    assert types["amount"] == "BIGINT"
+    drift = {r.entity: r for r in run_schema_drift(tmp_path)}["charges"]
+    # `metadata` is an ignored key, not drift.
+    assert drift.unknown_keys == ["refunded"]
+    assert drift.missing_keys == []
+
+    write_charges(settings, [{**row, "dispute": None} for row in rows], "r2", "2024-01-02")
+    scoped = {r.entity: r for r in run_schema_drift(tmp_path, run_id="r2")}["charges"]
+    assert (scoped.runs, scoped.unknown_keys) == (1, ["dispute"])
+
+
+def test_arrow_parts_reject_gzip_and_compress_with_zstd(charge_rows) -> None:
+    with pytest.raises(ValidationError, match="arrow"):
+        Settings(bronze_format="arrow", bronze_compression="gzip")
+
+    spec = ENTITY_REGISTRY["charges"]
+    lines = b"\n".join(json.dumps({"data": row}).encode() for row in charge_rows(500))
+    plain = columnar.encode_part(spec, lines, "arrow")
+    packed = columnar.encode_part(spec, lines, "arrow", "zstd", 19)
+
+    assert len(packed) < len(plain)
+    assert pa_ipc.open_file(packed).read_all().num_rows == 500
@@ -0,0 +1,119 @@
+import json
+import random
+from pathlib import Path
+
+from payments_pipeline.config.settings import Settings
+from payments_pipeline.load.writer import BronzeWriter, StreamProgress
+
+
+def _records(count: int) -> list[dict]:
+    rng = random.Random(7)
+    ids = [f"ch_{rng.randrange(10_000):05d}" for _ in range(count)]
+    return [{"data": {"id": id_, "n": i}} for i, id_ in enumerate(ids)]
+
+
+def _lines(paths: list[str]) -> list[dict]:
+    return [json.loads(line) for p in paths for line in Path(p).read_text().splitlines()]
+
+
+def test_spilled_runs_merge_into_sorted_stable_parts(tmp_path: Path) -> None:
+    writer = BronzeWriter(Settings(local_data_dir=tmp_path))
+    records = _records(250)
+    context = {"run_id": "r1", "dt": "2024-01-01"}
+
+    with writer.open("charges", context, chunk_size=100, memory_budget_bytes=2_000) as stream:
+        for start in range(0, len(records), 30):
+            stream.append(records[start : start + 30])
+        result = stream.close()
+
+    assert result.spilled_runs > 1
+    assert result.record_count == 250
+    assert [len(Path(p).read_text().splitlines()) for p in result.paths] == [100, 100, 50]
+    expected = sorted(records, key=lambda r: r["data"]["id"])
+    assert _lines(result.paths) == expected
+
+    in_memory = BronzeWriter(Settings(local_data_dir=tmp_path / "mem")).write_bronze_jsonl(
+        "charges", records, context, chunk_size=100
+    )
+    assert in_memory.spilled_runs == 0
+    assert in_memory.schema_hash == result.schema_hash
+    sidecar = json.loads((Path(result.paths[0]).parent / "_metadata.json").read_text())
+    assert (sidecar["record_count"], sidecar["chunk_count"]) == (250, 3)
+
+
+def test_unordered_stream_writes_parts_as_chunks_fill(tmp_path: Path) -> None:
+    writer = BronzeWriter(Settings(local_data_dir=tmp_path))
+    stream = writer.open("charges", {"run_id": "r1"}, chunk_size=10, deterministic_order=False)
+
+    stream.append(_records(25))
+    assert len(stream.paths) == 2
+
+    result = stream.close()
+    assert result.chunk_count == 3
+    assert _lines(result.paths) == _records(25)
+
+
+def test_unordered_stream_cuts_parts_by_buffered_pages(tmp_path: Path) -> None:
+    writer = BronzeWriter(Settings(local_data_dir=tmp_path))
+    stream = writer.open(
+        "charges", {"run_id": "r1"}, chunk_size=10, deterministic_order=False, max_buffered_pages=2
+    )
+
+    # Two pages fill the first part; a size-full part cut mid-page leaves the rest pending as
+    # one page, and empty pages do not count.
+    for size in (4, 4, 0, 7, 5):
+        stream.append(_records(size))
+    result = stream.close()
+
+    assert [len(Path(p).read_text().splitlines()) for p in result.paths] == [8, 10, 2]
+
+
+def test_page_aligned_stream_cuts_parts_between_appends(tmp_path: Path) -> None:
+    writer = BronzeWriter(Settings(local_data_dir=tmp_path))
+    stream = writer.open(
+        "charges",
+        {"run_id": "r1"},
+        chunk_size=5,
+        deterministic_order=False,
+        page_aligned=True,
+        resume=StreamProgress(parts=3),
+        write_sidecar=False,
+    )
+
+    for size in (3, 4, 6):
+        stream.append(_records(size))
+    result = stream.close()
+
+    assert [len(Path(p).read_text().splitlines()) for p in result.paths] == [7, 6]
+    assert [Path(p).name for p in result.paths] == ["part-00003.jsonl", "part-00004.jsonl"]
+
+
+def test_parts_are_cut_by_target_bytes_within_record_bounds(tmp_path: Path) -> None:
+    settings = Settings(
+        local_data_dir=tmp_path,
+        bronze_target_part_bytes=1_000,
+        bronze_part_min_records=5,
+        bronze_part_max_records=40,
+    )
+    writer = BronzeWriter(settings)
+    narrow = writer.write_bronze_jsonl("charges", _records(100), {"run_id": "r1"})
+    wide_records = [{"data": {"id": f"ch_{i:03d}", "blob": "x" * 400}} for i in range(20)]
+    wide = writer.write_bronze_jsonl("invoices", wide_records, {"run_id": "r1"})
+
+    narrow_counts = [len(Path(p).read_text().splitlines()) for p in narrow.paths]
+    assert narrow_counts == [30, 30, 30, 10]
+    assert all(Path(p).stat().st_size >= 1_000 for p in narrow.paths[:-1])
+    assert [len(Path(p).read_text().splitlines()) for p in wide.paths] == [5, 5, 5, 5]
+
+    sidecar = json.loads((Path(narrow.paths[0]).parent / "_metadata.json").read_text())
+    parts = sidecar["parts"]
+    assert parts["target_bytes"] == 1_000
+    assert parts["records"] == {"min": 10, "p50": 30, "max": 30, "mean": 25}
+    assert parts["stored_bytes"]["max"] == max(Path(p).stat().st_size for p in narrow.paths)
+
+
+def test_max_records_caps_parts_below_byte_target(tmp_path: Path) -> None:
+    settings = Settings(local_data_dir=tmp_path, bronze_part_max_records=30)
+    result = BronzeWriter(settings).write_bronze_jsonl("charges", _records(70), {"run_id": "r1"})
+
+    assert [len(Path(p).read_text().splitlines()) for p in result.paths] == [30, 30, 10]
@@ -0,0 +1,61 @@
+import json
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from payments_pipeline.clients.mock_stripe import MockStripeClient
+
+
+class _ListHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        body = json.dumps({"data": [{"id": "ch_1", "created": 1}], "has_more": False}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture()
+def base_url() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ListHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _list_pages(client: MockStripeClient, n: int) -> None:
+    for _ in range(n):
+        client.list_entity(
+            "charges", created_gte=None, created_lte=None, starting_after=None, limit=10
+        )
+
+
+def test_pooled_session_reuses_connections(base_url: str) -> None:
+    with MockStripeClient(base_url) as client:
+        _list_pages(client, 5)
+        metrics = client.metrics
+
+    assert metrics.api_calls == 5
+    assert metrics.connections_opened == 1
+    assert metrics.connections_reused == 4
+
+
+def test_keep_alive_disabled_opens_connection_per_request(base_url: str) -> None:
+    with MockStripeClient(base_url, keep_alive=False) as client:
+        _list_pages(client, 3)
+        metrics = client.metrics
+
+    assert metrics.connections_opened == 3
+    assert metrics.connections_reused == 0
@@ -0,0 +1,59 @@
+from datetime import UTC, datetime
+
+import pytest
+
+from payments_pipeline.utils import codec
+
+
+def test_backends_produce_identical_bronze_bytes(monkeypatch) -> None:
+    if codec.orjson is None:
+        pytest.skip("orjson not installed")
+    rows = [
+        {
+            "meta": {"ingested_at": datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC)},
+            "data": {"id": "ch_1"},
+        },
+        {"data": {"id": "ch_2", "description": "café ☕", "amount": 10, "big": 2**70, "n": None}},
+    ]
+    fast = codec.dumps_lines(rows, sort_keys=True, default=str)
+
+    monkeypatch.setattr(codec, "orjson", None)
+    slow = codec.dumps_lines(rows, sort_keys=True, default=str)
+
+    assert fast == slow
+    assert fast.startswith(
+        b'{"data":{"id":"ch_1"},"meta":{"ingested_at":"2024-01-02 03:04:05+00:00"}}'
+    )
+    assert [codec.loads(line) for line in slow.splitlines()][1]["data"]["big"] == 2**70
+
+
+def test_backends_agree_on_float_values(monkeypatch) -> None:
+    if codec.orjson is None:
+        pytest.skip("orjson not installed")
+    plain = {"data": {"fee_rate": 0.029, "fx": 1.5, "total": 123456.789}}
+    exponent = {"data": {"huge": 1e16, "tiny": 2.5e-05}}
+    fast = [codec.dumps(row, sort_keys=True) for row in (plain, exponent)]
+
+    monkeypatch.setattr(codec, "orjson", None)
+    slow = [codec.dumps(row, sort_keys=True) for row in (plain, exponent)]
+
+    assert fast[0] == slow[0]
+    # Exponent spelling differs between backends (1e16 vs 1e+16); the values do not.
+    assert fast[1] != slow[1]
+    assert codec.loads(fast[1]) == codec.loads(slow[1]) == exponent
+
+
+def test_decode_errors_are_value_errors() -> None:
+    with pytest.raises(codec.DecodeError):
+        codec.loads(b"\xff{")
+
+
+def test_lone_surrogates_round_trip_on_both_backends(monkeypatch) -> None:
+    row = {"data": {"id": "ch_1", "description": "broken \ud800 pair"}}
+    encoded = codec.dumps(row, sort_keys=True)
+    assert b"\\ud800" in encoded
+    assert codec.loads(encoded) == row
+
+    monkeypatch.setattr(codec, "orjson", None)
+    assert codec.dumps(row, sort_keys=True) == encoded
+    assert codec.loads(encoded) == row
@@ -0,0 +1,83 @@
+import json
+from pathlib import Path
+
+import duckdb
+import pytest
+from pydantic import ValidationError
+
+from payments_pipeline.config.settings import Settings
+from payments_pipeline.load import compression
+from payments_pipeline.load.writer import BronzeWriter
+from payments_pipeline.quality.reconciliation import _count_bronze_records
+from payments_pipeline.transform.models import MODEL_EXECUTION_ORDER
+
+
+def test_gzip_parts_round_trip_and_report_ratio(tmp_path: Path, charge_rows, write_charges) -> None:
+    rows = charge_rows(50)
+    settings = Settings(local_data_dir=tmp_path, bronze_compression="gzip")
+    paths = write_charges(settings, rows, "r1", "2024-01-01", chunk_size=20)
+
+    assert [p.name for p in paths] == [
+        "part-00000.jsonl.gz",
+        "part-00001.jsonl.gz",
+        "part-00002.jsonl.gz",
+    ]
+    with compression.open_part(paths[0]) as handle:
+        assert json.loads(handle.readline()) == {"data": rows[0]}
+    sidecar = json.loads((paths[0].parent / "_metadata.json").read_text())
+    stats = sidecar["compression"]
+    assert stats["codec"] == "gzip"
+    assert stats["stored_bytes"] == sum(p.stat().st_size for p in paths)
+    assert stats["raw_bytes"] > stats["stored_bytes"]
+    assert stats["ratio"] > 1
+
+
+def test_silver_and_reconciliation_read_mixed_parts(
+    tmp_path: Path, charge_rows, write_charges
+) -> None:
+    rows = charge_rows(50)
+    for run_id, dt, codec in (("r1", "2024-01-01", "none"), ("r2", "2024-01-02", "gzip")):
+        settings = Settings(local_data_dir=tmp_path, bronze_compression=codec)
+        write_charges(settings, rows, run_id, dt, chunk_size=20, write_sidecar=False)
+    spec = next(s for s in MODEL_EXECUTION_ORDER if s.name == "charges")
+    sql = spec.load_sql().replace("{{LOCAL_DATA_DIR}}", tmp_path.as_posix())
+
+    conn = duckdb.connect()
+    conn.execute(sql)
+    rows = conn.execute("SELECT CAST(dt AS VARCHAR), COUNT(*) FROM charges GROUP BY 1 ORDER BY 1")
+
+    assert rows.fetchall() == [("2024-01-01", 50), ("2024-01-02", 50)]
+    assert _count_bronze_records(tmp_path / "bronze/source=stripe/entity=charges") == 100
+
+
+def test_zstd_requires_optional_dependency(tmp_path: Path, charge_rows, write_charges) -> None:
+    settings = Settings(local_data_dir=tmp_path, bronze_compression="zstd")
+    if compression.zstandard is None:
+        with pytest.raises(RuntimeError, match="zstandard"):
+            BronzeWriter(settings)
+        return
+    paths = write_charges(settings, charge_rows(50), "r1", "2024-01-01", chunk_size=20)
+    assert paths[0].name.endswith(".jsonl.zst")
+    assert _count_bronze_records(tmp_path / "bronze/source=stripe/entity=charges") == 50
+
+
+def test_compression_level_is_checked_against_the_codec() -> None:
+    assert Settings(bronze_compression="gzip", bronze_compression_level=9).bronze_compression_level
+    assert Settings(bronze_compression="zstd", bronze_compression_level=19)
+    for codec, level in (("gzip", 12), ("none", 3)):
+        with pytest.raises(ValidationError, match="BRONZE_COMPRESSION_LEVEL"):
+            Settings(bronze_compression=codec, bronze_compression_level=level)
+
+
+def test_streams_without_a_sidecar_release_partition_stats(tmp_path: Path, charge_rows) -> None:
+    writer = BronzeWriter(Settings(local_data_dir=tmp_path, bronze_compression="gzip"))
+    context = {"run_id": "r1", "dt": "2024-01-01"}
+    records = [{"data": row} for row in charge_rows(50)]
+    writer.write_bronze_jsonl("charges", records, context, chunk_size=20, write_sidecar=False)
+
+    with pytest.raises(RuntimeError), writer.open("charges", context, chunk_size=20) as stream:
+        stream.append(records)
+        stream.flush()
+        raise RuntimeError("source failed")
+
+    assert writer._partition_stats == {}
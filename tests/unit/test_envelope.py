@@ -0,0 +1,48 @@
+import json
+from pathlib import Path
+from typing import Any
+
+import duckdb
+
+from payments_pipeline.config.settings import Settings
+from payments_pipeline.extract.charges import ChargesExtractor
+from payments_pipeline.load.writer import BronzeWriter
+from payments_pipeline.transform.models import MODEL_EXECUTION_ORDER
+
+
+def _write(settings: Settings, rows: list[dict[str, Any]], run_id: str, dt: str) -> Path:
+    extractor = ChargesExtractor(None, BronzeWriter(settings))  # type: ignore[arg-type]
+    context = {"run_id": run_id, "settings": settings, "dt": dt}
+    meta = extractor.batch_meta(context, "corr-1")
+    records = [extractor.envelope(row, context, "corr-1", batch_meta=meta) for row in rows]
+    result = extractor.writer.write_bronze_jsonl("charges", records, context, sidecar_meta=meta)
+    return Path(result.paths[0])
+
+
+def test_compact_envelope_moves_metadata_to_sidecar(tmp_path: Path, charge_rows) -> None:
+    rows = charge_rows(5)
+    legacy = _write(
+        Settings(local_data_dir=tmp_path, bronze_envelope_version=1), rows, "r1", "2024-01-01"
+    )
+    compact = _write(Settings(local_data_dir=tmp_path), rows, "r2", "2024-01-02")
+
+    assert json.loads(compact.read_text().splitlines()[0]) == {"data": rows[0]}
+    assert compact.stat().st_size < legacy.stat().st_size / 2
+    sidecar = json.loads((compact.parent / "_metadata.json").read_text())
+    assert sidecar["envelope_version"] == 2
+    assert sidecar["correlation_id"] == "corr-1"
+    assert sidecar["record_count"] == len(rows)
+
+
+def test_silver_reads_both_envelope_versions(tmp_path: Path, charge_rows) -> None:
+    rows = charge_rows(5)
+    _write(Settings(local_data_dir=tmp_path, bronze_envelope_version=1), rows, "r1", "2024-01-01")
+    _write(Settings(local_data_dir=tmp_path), rows, "r2", "2024-01-02")
+    spec = next(s for s in MODEL_EXECUTION_ORDER if s.name == "charges")
+    sql = spec.load_sql().replace("{{LOCAL_DATA_DIR}}", tmp_path.as_posix())
+
+    conn = duckdb.connect()
+    conn.execute(sql)
+    rows = conn.execute("SELECT CAST(dt AS VARCHAR), COUNT(*) FROM charges GROUP BY 1 ORDER BY 1")
+
+    assert rows.fetchall() == [("2024-01-01", 5), ("2024-01-02", 5)]
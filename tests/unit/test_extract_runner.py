@@ -0,0 +1,55 @@
+import time
+
+from payments_pipeline.config.logging import _CORR_ID, set_run_context
+from payments_pipeline.extract.base import ExtractResult
+from payments_pipeline.extract.runner import run_extractors
+
+
+class FakeExtractor:
+    def __init__(self, entity: str, fail: bool = False) -> None:
+        self.entity = entity
+        self.fail = fail
+        self.seen_correlation_id: str | None = None
+
+    def run(self, run_context: dict, days: int) -> ExtractResult:
+        set_run_context(correlation_id=f"corr-{self.entity}")
+        time.sleep(0.2)
+        self.seen_correlation_id = _CORR_ID.get()
+        if self.fail:
+            raise RuntimeError("upstream exploded")
+        return ExtractResult(
+            entity=self.entity,
+            records=1,
+            pages=1,
+            api_calls=1,
+            retries=0,
+            failures=0,
+            watermark=1,
+            bronze_paths=[],
+        )
+
+
+def test_parallel_run_isolates_failures_and_context() -> None:
+    names = ["payment_intents", "charges", "invoices", "customers"]
+    extractors = {name: FakeExtractor(name, fail=name == "charges") for name in names}
+
+    started = time.perf_counter()
+    outcome = run_extractors(extractors, names, {}, days=1, parallel=4)
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.6
+    assert [r.entity for r in outcome.results] == ["payment_intents", "invoices", "customers"]
+    assert list(outcome.errors) == ["charges"]
+    assert not outcome.ok
+    for name, extractor in extractors.items():
+        assert extractor.seen_correlation_id == f"corr-{name}"
+
+
+def test_serial_run_continues_after_failure() -> None:
+    names = ["charges", "customers"]
+    extractors = {name: FakeExtractor(name, fail=name == "charges") for name in names}
+
+    outcome = run_extractors(extractors, names, {}, days=1, parallel=1)
+
+    assert [r.entity for r in outcome.results] == ["customers"]
+    assert "charges" in outcome.errors
@@ -0,0 +1,102 @@
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+from payments_pipeline.load.filesystem_adapter import FilesystemAdapter
+
+
+def _count_fsyncs(monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    calls: list[int] = []
+    real_fsync = os.fsync
+
+    def _fsync(fd: int) -> None:
+        calls.append(fd)
+        real_fsync(fd)
+
+    monkeypatch.setattr(os, "fsync", _fsync)
+    return calls
+
+
+def test_failed_write_leaves_no_partial_object(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    fs = FilesystemAdapter(tmp_path)
+    fs.put_bytes("bronze/part-00000.jsonl", b"old\n")
+
+    def _crash(src: str, dst: str) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", _crash)
+    with pytest.raises(OSError):
+        fs.put_bytes("bronze/part-00000.jsonl", b"new\n")
+
+    assert (tmp_path / "bronze/part-00000.jsonl").read_bytes() == b"old\n"
+    assert sorted(p.name for p in (tmp_path / "bronze").iterdir()) == ["part-00000.jsonl"]
+
+
+def test_write_recreates_a_directory_removed_after_it_was_cached(tmp_path: Path) -> None:
+    fs = FilesystemAdapter(tmp_path)
+    fs.put_bytes("bronze/run_id=r1/part-00000.jsonl", b"a\n")
+    shutil.rmtree(tmp_path / "bronze")
+
+    location = fs.put_bytes("bronze/run_id=r1/part-00001.jsonl", b"b\n")
+
+    assert Path(location).read_bytes() == b"b\n"
+    assert not list((tmp_path / "bronze/run_id=r1").glob(".*"))
+
+
+def test_put_many_writes_in_order_and_syncs_once_per_batch(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    fs = FilesystemAdapter(tmp_path, fsync="batch", max_workers=4)
+    calls = _count_fsyncs(monkeypatch)
+    items = [(f"run_id=r1/part-{i:05d}.jsonl", f"{i}\n".encode()) for i in range(20)]
+
+    locations = fs.put_many(items)
+
+    assert locations == [str((tmp_path / key).resolve()) for key, _ in items]
+    assert [Path(p).read_bytes() for p in locations] == [data for _, data in items]
+    assert len(calls) == 20 + 1
+    fs.sync()
+    assert len(calls) == 21
+    assert not list((tmp_path / "run_id=r1").glob(".*"))
+
+
+def test_file_policy_syncs_each_object_and_directory(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    fs = FilesystemAdapter(tmp_path, fsync="file")
+    calls = _count_fsyncs(monkeypatch)
+
+    fs.put_bytes("a/one.json", b"{}")
+    fs.put_bytes("a/two.json", b"{}")
+
+    assert len(calls) == 4
+
+
+def test_rejects_paths_outside_root(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        FilesystemAdapter(tmp_path).put_bytes("../escape.json", b"{}")
+
+
+def test_batch_policy_bounds_pending_state_without_explicit_sync(tmp_path: Path) -> None:
+    fs = FilesystemAdapter(tmp_path, fsync="batch")
+
+    for i in range(1500):
+        fs.put_bytes(f"events/dt=2024-01-01/event_id=e{i}/payload.json", b"{}")
+
+    assert len(fs._unsynced) < 256
+    assert len(fs._known_dirs) <= 1024
+
+
+def test_rejects_symlinks_escaping_root(tmp_path: Path) -> None:
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    root = tmp_path / "root"
+    root.mkdir()
+    (root / "link").symlink_to(outside, target_is_directory=True)
+
+    with pytest.raises(ValueError):
+        FilesystemAdapter(root).put_bytes("link/escape.json", b"{}")
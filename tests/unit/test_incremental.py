@@ -0,0 +1,212 @@
+import json
+from pathlib import Path
+
+import duckdb
+import pyarrow.parquet as pq
+
+from payments_pipeline.config.settings import Settings
+from payments_pipeline.extract.registry import ENTITY_REGISTRY
+from payments_pipeline.state.manifests import ManifestStore
+from payments_pipeline.transform.incremental import (
+    SilverBuild,
+    build_silver,
+    merge_gold,
+    restore_interrupted_swaps,
+    write_parquet,
+)
+from payments_pipeline.transform.models import ModelSpec
+
+
+def test_build_silver_only_reads_unconsumed_partitions(
+    tmp_path: Path, charge_rows, write_charges
+) -> None:
+    settings = Settings(local_data_dir=tmp_path)
+    manifest = ManifestStore(settings.manifests_root)
+    silver_dir = settings.silver_root / "source=stripe" / "entity=charges"
+    conn = duckdb.connect()
+
+    def build(full_refresh: bool = False) -> tuple[int, int, int]:
+        result = build_silver(
+            conn,
+            ENTITY_REGISTRY["charges"],
+            base_dir=tmp_path,
+            silver_dir=silver_dir,
+            manifest=manifest,
+            full_refresh=full_refresh,
+        )
+        row = conn.execute("SELECT COUNT(*) FROM charges").fetchone()
+        assert row is not None
+        return result.files_scanned, result.files_skipped, row[0]
+
+    write_charges(settings, charge_rows(6, id_prefix="ch_r1_"), "r1", "2024-01-01", chunk_size=4)
+    assert build() == (2, 0, 6)
+    assert build() == (0, 2, 6)
+
+    write_charges(settings, charge_rows(3, id_prefix="ch_r2_"), "r2", "2024-01-02", chunk_size=4)
+    assert build() == (1, 2, 9)
+    assert sorted(p.relative_to(silver_dir).as_posix() for p in silver_dir.rglob("*.parquet")) == [
+        "dt=2024-01-01/run_id=r1/data.parquet",
+        "dt=2024-01-02/run_id=r2/data.parquet",
+    ]
+
+    assert build(full_refresh=True) == (3, 0, 9)
+    consumed = json.loads((settings.manifests_root / "_consumed/charges.json").read_text())
+    assert sorted(consumed["partitions"]) == ["dt=2024-01-01/run_id=r1", "dt=2024-01-02/run_id=r2"]
+
+
+def test_build_silver_rebuilds_rewritten_partition(
+    tmp_path: Path, charge_rows, write_charges
+) -> None:
+    settings = Settings(local_data_dir=tmp_path)
+    manifest = ManifestStore(settings.manifests_root)
+    silver_dir = settings.silver_root / "source=stripe" / "entity=charges"
+    conn = duckdb.connect()
+
+    def build() -> SilverBuild:
+        return build_silver(
+            conn,
+            ENTITY_REGISTRY["charges"],
+            base_dir=tmp_path,
+            silver_dir=silver_dir,
+            manifest=manifest,
+        )
+
+    write_charges(settings, charge_rows(3, id_prefix="ch_r1_"), "r1", "2024-01-01", chunk_size=4)
+    build()
+    write_charges(settings, charge_rows(4, id_prefix="ch_r1_"), "r1", "2024-01-01", chunk_size=4)
+    result = build()
+
+    assert result.partitions_built == 1
+    assert conn.execute("SELECT COUNT(*) FROM charges").fetchone() == (4,)
+
+
+def test_merge_gold_rewrites_only_touched_and_key_holding_partitions(tmp_path: Path) -> None:
+    conn = duckdb.connect()
+    conn.execute("CREATE TABLE src (id VARCHAR, amount INTEGER, dt DATE)")
+    conn.execute(
+        "INSERT INTO src VALUES ('a', 1, '2024-01-01'), ('b', 2, '2024-01-01'), "
+        "('c', 3, '2024-01-02')"
+    )
+    gold_dir = tmp_path / "gold/model=fct"
+
+    def merge(touched: set[str] | None) -> int:
+        return merge_gold(
+            conn,
+            ModelSpec(name="fct", layer="gold", unique_key=("id",), compression="snappy"),
+            "SELECT id, amount, dt FROM src",
+            gold_dir=gold_dir,
+            touched=touched,
+        ).partitions_written
+
+    assert merge(None) == 2
+    untouched = gold_dir / "dt=2024-01-02/data.parquet"
+    before = untouched.stat().st_mtime_ns
+
+    # `b` is re-extracted on a later day alongside a new row `d`.
+    conn.execute("INSERT INTO src VALUES ('b', 20, '2024-01-03'), ('d', 4, '2024-01-03')")
+    assert merge({"2024-01-03"}) == 2
+    assert merge(set()) == 0
+
+    rows = conn.execute(
+        f"SELECT id, amount, CAST(dt AS VARCHAR) FROM read_parquet('{gold_dir}/dt=*/data.parquet') "
+        "ORDER BY id"
+    ).fetchall()
+    assert rows == [
+        ("a", 1, "2024-01-01"),
+        ("b", 20, "2024-01-03"),
+        ("c", 3, "2024-01-02"),
+        ("d", 4, "2024-01-03"),
+    ]
+    assert untouched.stat().st_mtime_ns == before
+
+
+def test_merge_gold_applies_parquet_layout(tmp_path: Path) -> None:
+    conn = duckdb.connect()
+    conn.execute(
+        "CREATE TABLE src AS SELECT 'id_' || i AS id, CASE WHEN i % 2 = 0 THEN 'usd' ELSE 'eur' "
+        "END AS currency, 100000 - i AS event_ts, DATE '2024-01-01' AS dt FROM range(10000) r(i)"
+    )
+    spec = ModelSpec(
+        name="fct",
+        layer="gold",
+        unique_key=("id",),
+        partition_by=("dt", "currency"),
+        order_by=("event_ts",),
+        compression="zstd",
+        compression_level=3,
+        row_group_size=2048,
+    )
+    gold_dir = tmp_path / "gold/model=fct"
+
+    merge_gold(conn, spec, "SELECT * FROM src", gold_dir=gold_dir, touched=None)
+
+    files = sorted(p.relative_to(gold_dir).as_posix() for p in gold_dir.rglob("*.parquet"))
+    assert files == [
+        "dt=2024-01-01/currency=eur/data_0.parquet",
+        "dt=2024-01-01/currency=usd/data_0.parquet",
+    ]
+    metadata = pq.ParquetFile(gold_dir / files[0]).metadata
+    assert metadata.num_row_groups == 3
+    assert metadata.row_group(0).column(0).compression == "ZSTD"
+    ts = pq.read_table(gold_dir / files[0]).column("event_ts").to_pylist()
+    assert ts == sorted(ts)
+
+
+def test_merge_gold_follows_joined_keys_and_reports_deleted_partitions(tmp_path: Path) -> None:
+    conn = duckdb.connect()
+    conn.execute("CREATE TABLE pay (id VARCHAR, intent_id VARCHAR, ts INTEGER, dt DATE)")
+    conn.execute("CREATE TABLE intents (id VARCHAR, status VARCHAR, dt DATE)")
+    conn.execute(
+        "INSERT INTO pay VALUES ('a', 'pi_1', 1, '2024-01-01'), ('a', 'pi_1', 2, '2024-01-01'), "
+        "('b', 'pi_2', 1, '2024-01-02')"
+    )
+    conn.execute("INSERT INTO intents VALUES ('pi_1', 'open', '2024-01-01')")
+    spec = ModelSpec(
+        name="fct",
+        layer="gold",
+        unique_key=("id",),
+        latest_by=("ts",),
+        joined_keys=(("intents", "id", "intent_id"),),
+    )
+    sql = (
+        "SELECT p.id, p.intent_id, p.ts, i.status, p.dt FROM pay p "
+        "LEFT JOIN (SELECT * FROM intents QUALIFY row_number() OVER "
+        "(PARTITION BY id ORDER BY dt DESC) = 1) i ON p.intent_id = i.id"
+    )
+    gold_dir = tmp_path / "gold/model=fct"
+    merge_gold(conn, spec, sql, gold_dir=gold_dir, touched=None)
+
+    # The intent updates on a later day: the payment row in 2024-01-01 must pick it up.
+    conn.execute("INSERT INTO intents VALUES ('pi_1', 'paid', '2024-01-05')")
+    merged = merge_gold(conn, spec, sql, gold_dir=gold_dir, touched={"2024-01-05"})
+    assert (merged.partitions_written, merged.partitions_deleted) == (1, 0)
+
+    # `b` moves to a later day, emptying its old partition.
+    conn.execute("INSERT INTO pay VALUES ('b', 'pi_2', 3, '2024-01-06')")
+    merged = merge_gold(conn, spec, sql, gold_dir=gold_dir, touched={"2024-01-06"})
+    assert (merged.partitions_written, merged.partitions_deleted) == (1, 1)
+
+    rows = conn.execute(
+        f"SELECT id, ts, status, CAST(dt AS VARCHAR) FROM read_parquet('{gold_dir}/**/*.parquet') "
+        "ORDER BY id"
+    ).fetchall()
+    assert rows == [("a", 2, "paid", "2024-01-01"), ("b", 3, None, "2024-01-06")]
+    assert not (gold_dir / "dt=2024-01-02").exists()
+
+
+def test_write_parquet_recovers_from_interrupted_swap(tmp_path: Path) -> None:
+    conn = duckdb.connect()
+    spec = ModelSpec(name="m", layer="gold", compression="snappy")
+    target = tmp_path / "dt=2024-01-01"
+    write_parquet(conn, "SELECT 1 AS id", target, spec)
+
+    # Crash after the old output was moved aside but before the new one was renamed in.
+    target.rename(tmp_path / ".dt=2024-01-01.old")
+    assert restore_interrupted_swaps(tmp_path) == 1
+    assert conn.execute(f"SELECT id FROM '{target}/data.parquet'").fetchall() == [(1,)]
+
+    # A stale backup next to a live target must not block the next swap.
+    (tmp_path / ".dt=2024-01-01.old").mkdir()
+    assert write_parquet(conn, "SELECT 2 AS id", target, spec) == 1
+    assert conn.execute(f"SELECT id FROM '{target}/data.parquet'").fetchall() == [(2,)]
+    assert not (tmp_path / ".dt=2024-01-01.old").exists()
@@ -0,0 +1,170 @@
+import gzip
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+from botocore.exceptions import ClientError
+
+from payments_pipeline.config.settings import Settings
+from payments_pipeline.load.object_store import S3ObjectStore
+from payments_pipeline.load.writer import BronzeWriter
+from payments_pipeline.utils.retry import RetryConfig
+from payments_pipeline.webhooks.repository import WebhookRepository
+
+FAST_RETRY = RetryConfig(max_attempts=3, base_delay_seconds=0.0, max_delay_seconds=0.0)
+
+
+class FakeS3:
+    """In-memory stand-in for the boto3 S3 calls the object store makes."""
+
+    def __init__(self, *, fail_first: int = 0, delay: float = 0.0):
+        self.objects: dict[str, bytes] = {}
+        self.uploads: dict[str, dict[int, bytes]] = {}
+        self.aborted: list[str] = []
+        self.fail_abort = False
+        self.active = 0
+        self.max_active = 0
+        self._fail_remaining = fail_first
+        self._delay = delay
+        self._lock = threading.Lock()
+
+    def _enter(self) -> None:
+        with self._lock:
+            if self._fail_remaining:
+                self._fail_remaining -= 1
+                raise ConnectionError("connection reset")
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self._delay)
+        with self._lock:
+            self.active -= 1
+
+    def put_object(self, *, Bucket: str, Key: str, Body: bytes) -> dict[str, Any]:
+        self._enter()
+        self.objects[Key] = bytes(Body)
+        return {"ETag": "etag"}
+
+    def head_object(self, *, Bucket: str, Key: str) -> dict[str, Any]:
+        if Key not in self.objects:
+            raise KeyError(Key)
+        return {}
+
+    def create_multipart_upload(self, *, Bucket: str, Key: str) -> dict[str, Any]:
+        upload_id = f"upload-{len(self.uploads)}"
+        self.uploads[upload_id] = {}
+        return {"UploadId": upload_id}
+
+    def upload_part(
+        self, *, Bucket: str, Key: str, UploadId: str, PartNumber: int, Body: bytes
+    ) -> dict[str, Any]:
+        self._enter()
+        self.uploads[UploadId][PartNumber] = bytes(Body)
+        return {"ETag": f"etag-{PartNumber}"}
+
+    def complete_multipart_upload(
+        self, *, Bucket: str, Key: str, UploadId: str, MultipartUpload: dict[str, Any]
+    ) -> None:
+        parts = self.uploads.pop(UploadId)
+        numbers = [p["PartNumber"] for p in MultipartUpload["Parts"]]
+        self.objects[Key] = b"".join(parts[n] for n in numbers)
+
+    def abort_multipart_upload(self, *, Bucket: str, Key: str, UploadId: str) -> None:
+        self.aborted.append(UploadId)
+        if self.fail_abort:
+            raise ConnectionError("abort failed")
+
+
+def _aws_settings(tmp_path: Path, **overrides: Any) -> Settings:
+    return Settings(pipeline_env="AWS", s3_bucket="lake", local_data_dir=tmp_path, **overrides)
+
+
+def test_multipart_upload_reassembles_and_retries(tmp_path: Path) -> None:
+    s3 = FakeS3(fail_first=1)
+    store = S3ObjectStore(
+        s3, "lake", multipart_threshold=1_000, multipart_part_size=400, retry_config=FAST_RETRY
+    )
+    body = bytes(range(256)) * 10
+
+    assert store.put("big.bin", body) == "s3://lake/big.bin"
+    assert s3.objects["big.bin"] == body
+    assert (store.metrics.multipart_uploads, store.metrics.multipart_parts) == (1, 7)
+    assert store.metrics.snapshot()["throughput_mib_per_second"] is not None
+
+
+def test_failed_multipart_upload_is_aborted() -> None:
+    s3 = FakeS3(fail_first=10)
+    store = S3ObjectStore(
+        s3, "lake", multipart_threshold=10, multipart_part_size=5, retry_config=FAST_RETRY
+    )
+
+    with pytest.raises(ConnectionError, match="connection reset"):
+        store.put("big.bin", b"x" * 20)
+    assert s3.aborted == ["upload-0"]
+    assert "big.bin" not in s3.objects
+
+    # A failing abort is logged; the upload error still surfaces.
+    s3.fail_abort = True
+    s3._fail_remaining = 100
+    with pytest.raises(ConnectionError, match="connection reset"):
+        store.put("big.bin", b"x" * 20)
+    assert s3.aborted == ["upload-0", "upload-1"]
+
+
+def test_bronze_parts_upload_concurrently_before_sidecar(tmp_path: Path) -> None:
+    s3 = FakeS3(delay=0.05)
+    store = S3ObjectStore(s3, "lake", max_workers=4, retry_config=FAST_RETRY)
+    writer = BronzeWriter(_aws_settings(tmp_path, bronze_compression="gzip"), store=store)
+    records = [{"data": {"id": f"ch_{i:03d}"}} for i in range(40)]
+
+    result = writer.write_bronze_jsonl(
+        "charges", records, {"run_id": "r1", "dt": "2024-01-01"}, chunk_size=5
+    )
+
+    assert result.chunk_count == 8
+    assert all(path.startswith("s3://lake/bronze/") for path in result.paths)
+    assert s3.max_active > 1
+    prefix = "bronze/source=stripe/entity=charges/dt=2024-01-01/run_id=r1"
+    sidecar = json.loads(s3.objects[f"{prefix}/_metadata.json"])
+    assert sidecar["record_count"] == 40
+    lines = gzip.decompress(s3.objects[f"{prefix}/part-00000.jsonl.gz"]).splitlines()
+    assert len(lines) == 5
+    assert store.metrics.objects == 9
+
+
+def test_webhook_repository_writes_through_object_store(tmp_path: Path) -> None:
+    s3 = FakeS3()
+    repo = WebhookRepository(
+        _aws_settings(tmp_path), store=S3ObjectStore(s3, "lake", retry_config=FAST_RETRY)
+    )
+
+    assert repo.exists("evt_1") is False
+    location = repo.write("evt_1", b'{"id": "evt_1"}', {}, received_ts="2024-01-01T00:00:00Z")
+
+    assert location.startswith(
+        "s3://lake/bronze/source=stripe/entity=webhook_events/dt=2024-01-01/"
+    )
+    assert repo.exists("evt_1") is True
+
+
+def test_only_transient_client_errors_are_retried() -> None:
+    calls: list[str] = []
+
+    class ErroringS3(FakeS3):
+        def put_object(self, *, Bucket: str, Key: str, Body: bytes) -> dict[str, Any]:
+            calls.append(Key)
+            code, status = ("SlowDown", 503) if Key == "slow" else ("AccessDenied", 403)
+            raise ClientError(
+                {"Error": {"Code": code}, "ResponseMetadata": {"HTTPStatusCode": status}},
+                "PutObject",
+            )
+
+    store = S3ObjectStore(ErroringS3(), "lake", retry_config=FAST_RETRY)
+    for key in ("denied", "slow"):
+        with pytest.raises(ClientError):
+            store.put(key, b"x")
+    store.close()
+
+    assert calls == ["denied", "slow", "slow", "slow"]
@@ -0,0 +1,64 @@
+import os
+import time
+
+import pytest
+
+from payments_pipeline.clients.mock_stripe import MockStripeClient
+from payments_pipeline.clients.page_cache import PageCache, PageCacheMiss
+
+
+def _pages(client: MockStripeClient) -> list[list[str]]:
+    pages = client.iter_pages("charges", created_gte=0, created_lte=100, limit=2)
+    return [[record["id"] for record in page.data] for page in pages]
+
+
+def _fake_get(calls: list[dict], fake_response):
+    def get(url: str, params: dict, timeout: int):
+        calls.append(params)
+        if params.get("starting_after") is None:
+            return fake_response(
+                payload={"data": [{"id": "ch_1"}, {"id": "ch_2"}], "has_more": True}
+            )
+        return fake_response(payload={"data": [{"id": "ch_3"}], "has_more": False})
+
+    return get
+
+
+def test_record_then_replay_skips_the_network(tmp_path, monkeypatch, fake_response) -> None:
+    calls: list[dict] = []
+    recorder = MockStripeClient("http://mock", page_cache=PageCache(tmp_path))
+    monkeypatch.setattr(recorder.session, "get", _fake_get(calls, fake_response))
+
+    assert _pages(recorder) == [["ch_1", "ch_2"], ["ch_3"]]
+    assert _pages(recorder) == [["ch_1", "ch_2"], ["ch_3"]]
+    assert len(calls) == 2
+    metrics = recorder.metrics
+    assert (metrics.cache_misses, metrics.cache_hits, metrics.api_calls) == (2, 2, 2)
+    assert metrics.cache_bytes_saved > 0
+    _, page_metrics = recorder.iter_entity("charges", created_gte=0, created_lte=100, limit=2)
+    assert (page_metrics["api_calls"], page_metrics["cache_hits"]) == (0, 2)
+
+    replayer = MockStripeClient("http://mock", page_cache=PageCache(tmp_path, replay=True))
+    monkeypatch.setattr(replayer.session, "get", lambda *a, **k: pytest.fail("network call"))
+    assert _pages(replayer) == [["ch_1", "ch_2"], ["ch_3"]]
+
+    with pytest.raises(PageCacheMiss):
+        replayer.list_entity(
+            "charges", created_gte=0, created_lte=200, starting_after=None, limit=2
+        )
+
+
+def test_expired_entries_miss_and_size_cap_evicts_oldest(tmp_path) -> None:
+    cache = PageCache(tmp_path, ttl_seconds=60, max_bytes=10)
+    first = cache.key("charges", 0, 1, None, 10)
+    second = cache.key("charges", 1, 2, None, 10)
+
+    cache.put(first, b"123456")
+    path = next(tmp_path.glob("*/*.json"))
+    stale = time.time() - 120
+    os.utime(path, (stale, stale))
+    assert cache.get(first) is None
+
+    cache.put(second, b"abcdef")
+    assert cache.get(second) == b"abcdef"
+    assert not path.exists()
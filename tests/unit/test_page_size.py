@@ -0,0 +1,45 @@
+from payments_pipeline.clients.mock_stripe import MockStripeClient
+from payments_pipeline.clients.page_size import PageSizeController
+
+
+def test_controller_grows_when_healthy_and_shrinks_on_errors() -> None:
+    controller = PageSizeController(initial=100, maximum=500, target_latency_seconds=1.0)
+
+    for _ in range(10):
+        controller.observe(latency_seconds=0.05, retries=0)
+    assert controller.next_limit() == 500
+
+    controller.record_error()
+    assert controller.next_limit() == 250
+
+    controller.observe(latency_seconds=2.0, retries=0)
+    assert controller.next_limit() == 187
+
+    controller.observe(latency_seconds=0.7, retries=0)
+    assert controller.next_limit() == 187
+
+
+def test_slow_page_shrink_factor_is_configurable() -> None:
+    controller = PageSizeController(initial=200, slow_shrink_factor=0.9)
+
+    controller.observe(latency_seconds=2.0, retries=0)
+    assert controller.next_limit() == 180
+
+
+def test_client_shrinks_limit_on_5xx_and_records_it(monkeypatch, fake_response) -> None:
+    client = MockStripeClient("http://mock", adaptive_page_size=True, max_page_size=500)
+    calls: list[int] = []
+    payload = {"data": [{"id": f"ch_{i}", "created": i} for i in range(3)], "has_more": False}
+
+    def fake_get(url: str, params: dict, timeout: int):
+        calls.append(params["limit"])
+        return fake_response(503 if len(calls) == 1 else 200, payload)
+
+    monkeypatch.setattr(client.session, "get", fake_get)
+    monkeypatch.setattr("payments_pipeline.utils.retry.time.sleep", lambda _: None)
+
+    pages = list(client.iter_pages("charges", created_gte=None, created_lte=None, limit=200))
+
+    assert calls == [200, 100]
+    assert pages[0].request_meta["limit"] == 100
+    assert pages[0].request_meta["retries"] == 1
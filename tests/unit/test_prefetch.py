@@ -0,0 +1,55 @@
+import threading
+import time
+
+import pytest
+
+from payments_pipeline.utils.prefetch import Prefetcher
+
+
+def _slow_source(count: int, delay: float):
+    for i in range(count):
+        time.sleep(delay)
+        yield i
+
+
+def test_prefetch_overlaps_fetch_with_processing() -> None:
+    prefetcher = Prefetcher(_slow_source(5, 0.03), depth=2)
+    seen = []
+    started = time.perf_counter()
+    for item in prefetcher:
+        time.sleep(0.03)
+        seen.append(item)
+    elapsed = time.perf_counter() - started
+
+    assert seen == [0, 1, 2, 3, 4]
+    assert elapsed < 0.27
+    assert prefetcher.stats.items == 5
+    assert prefetcher.stats.overlap_ratio > 0.5
+
+
+def test_full_queue_counts_producer_stalls_and_applies_backpressure() -> None:
+    produced = []
+
+    def source():
+        for i in range(10):
+            produced.append(i)
+            yield i
+
+    prefetcher = Prefetcher(source(), depth=1)
+    iterator = iter(prefetcher)
+    assert next(iterator) == 0
+    time.sleep(0.05)
+    assert len(produced) <= 3
+    assert list(iterator) == list(range(1, 10))
+    assert prefetcher.stats.producer_stalls >= 1
+
+
+def test_producer_errors_surface_on_consumer_and_thread_exits() -> None:
+    def failing():
+        yield 1
+        raise RuntimeError("boom")
+
+    prefetcher = Prefetcher(failing(), depth=2)
+    with pytest.raises(RuntimeError, match="boom"):
+        list(prefetcher)
+    assert not any(t.name == "prefetch" for t in threading.enumerate())
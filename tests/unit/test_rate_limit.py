@@ -0,0 +1,142 @@
+import threading
+
+import pytest
+import requests
+
+from payments_pipeline.clients.mock_stripe import MockStripeClient
+from payments_pipeline.utils.rate_limit import CircuitBreaker, CircuitOpenError, TokenBucket
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def test_token_bucket_allows_burst_then_paces() -> None:
+    clock = FakeClock()
+    bucket = TokenBucket(10.0, burst=2, clock=clock, sleep=clock.sleep)
+
+    waits = [bucket.acquire() for _ in range(4)]
+
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2] == pytest.approx(0.1)
+    assert waits[3] == pytest.approx(0.1)
+
+
+def test_token_bucket_try_acquire_never_waits() -> None:
+    clock = FakeClock()
+    bucket = TokenBucket(10.0, burst=1, clock=clock, sleep=clock.sleep)
+
+    assert bucket.try_acquire() is True
+    assert bucket.try_acquire() is False
+    clock.now += 0.1
+    assert bucket.try_acquire() is True
+
+
+def test_circuit_breaker_opens_and_half_opens() -> None:
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_seconds=5, clock=clock)
+
+    breaker.record_failure()
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    clock.now += 5
+    assert breaker.state == "half_open"
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.open_count == 1
+    assert breaker.rejected == 1
+
+
+def test_half_open_circuit_admits_one_probe_across_threads() -> None:
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=5, clock=clock)
+    breaker.record_failure()
+    clock.now += 5
+    barrier = threading.Barrier(8)
+    admitted: list[bool] = []
+
+    def _call() -> None:
+        barrier.wait()
+        try:
+            breaker.before_call()
+        except CircuitOpenError:
+            admitted.append(False)
+        else:
+            admitted.append(True)
+
+    threads = [threading.Thread(target=_call) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert admitted.count(True) == 1
+    assert breaker.rejected == 7
+    # A failed probe reopens the circuit; the next probe waits out another reset period.
+    breaker.record_failure()
+    assert breaker.state == "open"
+    clock.now += 5
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+def _list(client: MockStripeClient):
+    return client.list_entity(
+        "charges", created_gte=None, created_lte=None, starting_after=None, limit=10
+    )
+
+
+def test_retry_after_header_drives_sleep_and_throttle_metric(monkeypatch, fake_response) -> None:
+    client = MockStripeClient("http://mock")
+    responses = [fake_response(429, headers={"Retry-After": "2"}), fake_response()]
+    sleeps: list[float] = []
+    monkeypatch.setattr(client.session, "get", lambda *a, **k: responses.pop(0))
+    monkeypatch.setattr("payments_pipeline.utils.retry.time.sleep", sleeps.append)
+
+    page = _list(client)
+
+    assert sleeps == [2.0]
+    assert page.request_meta["throttle_seconds"] == 2.0
+    assert client.metrics.throttle_seconds == 2.0
+
+
+def test_circuit_fails_fast_after_sustained_errors(monkeypatch, fake_response) -> None:
+    client = MockStripeClient("http://mock", circuit_failure_threshold=2)
+    monkeypatch.setattr(client.session, "get", lambda *a, **k: fake_response(502))
+    monkeypatch.setattr("payments_pipeline.utils.retry.time.sleep", lambda _: None)
+
+    with pytest.raises(CircuitOpenError):
+        _list(client)
+
+    metrics = client.metrics
+    assert metrics.circuit_opened == 1
+    assert metrics.circuit_rejections == 1
+
+
+def test_client_errors_other_than_throttling_are_not_retried(monkeypatch, fake_response) -> None:
+    client = MockStripeClient("http://mock")
+    calls: list[int] = []
+
+    def _get(*args, **kwargs):
+        calls.append(1)
+        return fake_response(404)
+
+    monkeypatch.setattr(client.session, "get", _get)
+
+    with pytest.raises(requests.HTTPError):
+        _list(client)
+    assert len(calls) == 1
+    assert client.metrics.retries == 0
@@ -0,0 +1,35 @@
+from payments_pipeline.extract.base import BaseExtractor
+from payments_pipeline.extract.charges import ChargesExtractor
+from payments_pipeline.extract.registry import ENTITY_REGISTRY, EntitySpec, FieldSpec
+from payments_pipeline.quality.schema import MODEL_RULES
+
+
+def test_projection_matches_field_list() -> None:
+    spec = ENTITY_REGISTRY["charges"]
+    record = {"id": "ch_1", "created": 10, "amount": 5, "extra": "dropped"}
+
+    projected = spec.project(record)
+
+    assert list(projected) == [f.name for f in spec.fields]
+    assert projected["id"] == "ch_1"
+    assert projected["currency"] is None
+    assert "extra" not in projected
+
+
+def test_registry_drives_extractor_sql_and_rules() -> None:
+    refunds = EntitySpec(
+        "refunds",
+        (FieldSpec("id"), FieldSpec("created", "BIGINT", timestamp=True), FieldSpec("charge")),
+    )
+    extractor = BaseExtractor(None, None, spec=refunds)  # type: ignore[arg-type]
+
+    assert extractor.entity == "refunds"
+    assert extractor.max_watermark([{"created": 3}, {"created": 7}]) == 7
+    assert refunds.silver_columns == ["id", "created", "created_ts", "charge", "dt"]
+    assert "entity=refunds/dt=*/run_id=*/part-*.jsonl*'" in refunds.silver_sql()
+    assert (
+        """columns = {'data': 'STRUCT("id" VARCHAR, "created" BIGINT, "charge" VARCHAR)'}"""
+        in refunds.silver_sql()
+    )
+    assert ChargesExtractor(None, None).spec is ENTITY_REGISTRY["charges"]  # type: ignore[arg-type]
+    assert MODEL_RULES["invoices"]["required_columns"] == ENTITY_REGISTRY["invoices"].silver_columns
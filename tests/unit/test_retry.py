@@ -1,4 +1,18 @@
-from payments_pipeline.utils.retry import RetryConfig, retry_call
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from payments_pipeline.utils.retry import (
+    LatencyTracker,
+    RetryBudget,
+    RetryConfig,
+    async_retry_call,
+    hedged_call,
+    retry_call,
+)
 
 
 class TransientError(RuntimeError):
@@ -21,3 +35,119 @@ def test_retry_call_retries_then_succeeds() -> None:
     )
     assert value == "ok"
     assert state["n"] == 3
+
+
+def test_retry_budget_stops_retries_once_exhausted() -> None:
+    budget = RetryBudget(ratio=0.0, min_retries=1)
+    state = {"n": 0}
+
+    def always_fails() -> str:
+        state["n"] += 1
+        raise TransientError("down")
+
+    with pytest.raises(TransientError):
+        retry_call(
+            always_fails,
+            retryable_exceptions=(TransientError,),
+            config=RetryConfig(max_attempts=5, base_delay_seconds=0.0, max_delay_seconds=0.0),
+            budget=budget,
+        )
+
+    assert state["n"] == 2
+    assert budget.snapshot()["retries"] == 1
+    assert budget.snapshot()["denied"] == 1
+
+
+def test_sync_and_async_retry_make_the_same_decisions(monkeypatch) -> None:
+    slept: list[float] = []
+    monkeypatch.setattr(time, "sleep", slept.append)
+
+    async def _no_wait(seconds: float) -> None:
+        slept.append(seconds)
+
+    monkeypatch.setattr(asyncio, "sleep", _no_wait)
+    outcomes: list[tuple[int, dict[str, int]]] = []
+
+    def _run(run_async: bool) -> None:
+        state = {"n": 0}
+        metrics: dict[str, int] = {}
+
+        def attempt() -> str:
+            state["n"] += 1
+            raise TransientError("fatal" if state["n"] == 3 else "busy")
+
+        options = {
+            "retryable_exceptions": (TransientError,),
+            "metrics": metrics,
+            "delay_hint": lambda exc: 1.5,
+            "retry_if": lambda exc: str(exc) == "busy",
+        }
+        with pytest.raises(TransientError, match="fatal"):
+            if run_async:
+
+                async def attempt_async() -> str:
+                    return attempt()
+
+                asyncio.run(async_retry_call(attempt_async, **options))  # type: ignore[arg-type]
+            else:
+                retry_call(attempt, **options)  # type: ignore[arg-type]
+        outcomes.append((state["n"], metrics))
+
+    _run(run_async=False)
+    _run(run_async=True)
+
+    assert outcomes[0] == outcomes[1] == (3, {"retries": 2})
+    assert slept == [1.5, 1.5, 1.5, 1.5]
+
+
+def test_hedged_call_takes_the_faster_duplicate() -> None:
+    calls = {"n": 0}
+    lock = threading.Lock()
+
+    def slow_then_fast() -> str:
+        with lock:
+            calls["n"] += 1
+            n = calls["n"]
+        if n == 1:
+            time.sleep(0.5)
+            return "primary"
+        return "hedge"
+
+    hedges: list[int] = []
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        value, hedge_won = hedged_call(
+            slow_then_fast,
+            hedge_after_seconds=0.05,
+            executor=pool,
+            on_hedge=lambda: hedges.append(1),
+        )
+
+    assert (value, hedge_won) == ("hedge", True)
+    assert hedges == [1]
+
+
+def test_hedge_is_skipped_without_a_token() -> None:
+    calls: list[int] = []
+
+    def slow() -> str:
+        calls.append(1)
+        time.sleep(0.1)
+        return "primary"
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        value, hedge_won = hedged_call(
+            slow, hedge_after_seconds=0.01, executor=pool, acquire_hedge=lambda: False
+        )
+
+    assert (value, hedge_won) == ("primary", False)
+    assert calls == [1]
+
+
+def test_latency_tracker_needs_min_samples() -> None:
+    tracker = LatencyTracker(min_samples=3)
+    tracker.record(0.1)
+    tracker.record(0.2)
+    assert tracker.percentile(95) is None
+    tracker.record(0.9)
+    assert tracker.percentile(95) == 0.9
+    assert tracker.percentile(50) == 0.2
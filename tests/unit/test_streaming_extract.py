@@ -0,0 +1,54 @@
+import json
+from pathlib import Path
+
+from payments_pipeline.config.settings import Settings
+from payments_pipeline.extract.charges import ChargesExtractor
+from payments_pipeline.load.writer import BronzeWriter
+
+
+def _run(client, tmp_path: Path, stream: bool, slices: int = 1) -> tuple:
+    settings = Settings(
+        local_data_dir=tmp_path,
+        max_page_size=7,
+        stream_extract=stream,
+        stream_buffer_pages=3,
+        extract_slices=slices,
+    )
+    extractor = ChargesExtractor(client, BronzeWriter(settings))
+    rows = extractor.client.dataset["charges"]  # type: ignore[attr-defined]
+    result = extractor.extract_window(
+        rows[0]["created"], rows[-1]["created"], {"run_id": "run-1", "settings": settings}
+    )
+    return result, rows
+
+
+def test_streaming_matches_batch_result(tmp_path: Path, in_process_client) -> None:
+    batch, rows = _run(in_process_client(), tmp_path / "batch", stream=False)
+    streamed, _ = _run(in_process_client(), tmp_path / "stream", stream=True)
+
+    assert streamed.records == batch.records == len(rows)
+    assert streamed.pages == batch.pages
+    assert streamed.api_calls == batch.api_calls
+    assert streamed.watermark == batch.watermark == max(r["created"] for r in rows)
+
+
+def test_streaming_bounds_part_size_by_buffered_pages(tmp_path: Path, in_process_client) -> None:
+    streamed, rows = _run(in_process_client(), tmp_path, stream=True)
+
+    line_counts = [len(Path(p).read_text().splitlines()) for p in streamed.bronze_paths]
+    assert sum(line_counts) == len(rows)
+    assert max(line_counts) <= 3 * 7
+
+
+def test_sliced_extraction_matches_serial(tmp_path: Path, in_process_client) -> None:
+    serial, rows = _run(in_process_client(), tmp_path / "serial", stream=False)
+    sliced, _ = _run(in_process_client(), tmp_path / "sliced", stream=False, slices=4)
+
+    assert sliced.records == serial.records == len(rows)
+    assert sliced.watermark == serial.watermark
+    assert sliced.pages >= serial.pages
+    ids = [line for p in sliced.bronze_paths for line in Path(p).read_text().splitlines()]
+    expected = [line for p in serial.bronze_paths for line in Path(p).read_text().splitlines()]
+    assert [json.loads(line)["data"]["id"] for line in ids] == [
+        json.loads(line)["data"]["id"] for line in expected
+    ]
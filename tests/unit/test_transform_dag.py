@@ -0,0 +1,46 @@
+from pathlib import Path
+
+import pytest
+
+from payments_pipeline.config.settings import Settings
+from payments_pipeline.transform.duckdb_runner import run_transforms
+from payments_pipeline.transform.models import MODEL_EXECUTION_ORDER, ModelSpec, model_dependencies
+
+
+def test_dependencies_are_inferred_from_sql() -> None:
+    deps = model_dependencies(MODEL_EXECUTION_ORDER)
+
+    assert deps["charges"] == ()
+    assert deps["fct_payments"] == ("charges", "payment_intents")
+    assert deps["fct_invoices"] == ("invoices",)
+    assert deps["dim_customers"] == ("customers",)
+
+
+def test_dependency_cycles_are_rejected() -> None:
+    specs = [
+        ModelSpec(name="a", layer="gold", sql="SELECT * FROM b"),
+        ModelSpec(name="b", layer="gold", sql="SELECT * FROM a"),
+    ]
+    with pytest.raises(ValueError, match="cycle"):
+        model_dependencies(specs)
+
+
+def test_failure_only_blocks_downstream_models(tmp_path: Path) -> None:
+    specs = [
+        ModelSpec(name="base", layer="gold", sql="SELECT 1 AS id"),
+        ModelSpec(name="broken", layer="gold", sql="SELECT * FROM no_such_table"),
+        ModelSpec(name="after_broken", layer="gold", sql="SELECT 1 AS id", depends_on=("broken",)),
+        ModelSpec(name="after_base", layer="gold", sql="SELECT id + 1 AS id FROM base"),
+    ]
+    settings = Settings(local_data_dir=tmp_path, transform_workers=2)
+
+    metrics = run_transforms({"settings": settings, "run_id": "r1"}, specs=specs)
+
+    assert [(m.model, m.status) for m in metrics] == [
+        ("base", "ok"),
+        ("broken", "failed"),
+        ("after_broken", "upstream_failed"),
+        ("after_base", "ok"),
+    ]
+    assert all(m.queue_wait_seconds >= 0 for m in metrics)
+    assert list((tmp_path / "gold/model=after_base").rglob("data.parquet"))
@@ -1,6 +1,18 @@
 from pathlib import Path
 
-from payments_pipeline.state.watermarks import WatermarkStore, commit, get_window
+import pytest
+from pydantic import ValidationError
+
+from payments_pipeline.config.settings import Settings
+from payments_pipeline.state.watermarks import (
+    WatermarkStore,
+    Window,
+    auto_slice_count,
+    commit,
+    get_window,
+    resolve_slice_count,
+    split_window,
+)
 
 
 def test_watermark_window_and_commit(tmp_path: Path) -> None:
@@ -15,3 +27,52 @@ def test_watermark_window_and_commit(tmp_path: Path) -> None:
 
     window2 = get_window("charges", now_ts=1700000200, days=1, safety_window=300, store=store)
     assert window2.start_ts == 1699999700
+
+
+def test_window_is_pinned_per_run_id(tmp_path: Path) -> None:
+    store = WatermarkStore(tmp_path)
+    first = get_window(
+        "charges", now_ts=1700000000, days=1, safety_window=300, store=store, run_id="r1"
+    )
+    commit("charges", new_watermark=1700000000, run_id="r1", store=store)
+
+    retried = get_window(
+        "charges", now_ts=1700009999, days=1, safety_window=300, store=store, run_id="r1"
+    )
+    fresh = get_window(
+        "charges", now_ts=1700009999, days=1, safety_window=300, store=store, run_id="r2"
+    )
+
+    assert retried == first
+    assert fresh == Window(start_ts=1699999700, end_ts=1700009999)
+
+
+def test_split_window_is_contiguous_and_complete() -> None:
+    window = Window(start_ts=1000, end_ts=1999)
+    parts = split_window(window, 3)
+
+    assert len(parts) == 3
+    assert parts[0].start_ts == 1000
+    assert parts[-1].end_ts == 1999
+    for prev, nxt in zip(parts, parts[1:], strict=False):
+        assert nxt.start_ts == prev.end_ts + 1
+
+
+def test_auto_slice_count_scales_with_window_and_page_size() -> None:
+    day = 86400
+    assert auto_slice_count(Window(0, day), max_page_size=100) == 1
+    assert auto_slice_count(Window(0, 4 * day), max_page_size=100) == 4
+    assert auto_slice_count(Window(0, 4 * day), max_page_size=200) == 2
+    assert auto_slice_count(Window(0, 90 * day), max_page_size=100) == 8
+
+
+def test_slicing_is_opt_in_and_daily_windows_stay_whole() -> None:
+    # A one-day run window plus the safety overlap.
+    daily = Window(0, 86400 + 310)
+    assert Settings().extract_slices == 1
+    assert resolve_slice_count(Settings().extract_slices, daily, 100) == 1
+    assert resolve_slice_count(Settings(EXTRACT_SLICES="AUTO").extract_slices, daily, 100) == 1
+    assert resolve_slice_count("auto", Window(0, 5 * 86400), 100) == 5
+    assert resolve_slice_count(Settings(EXTRACT_SLICES="3").extract_slices, daily, 100) == 3
+    with pytest.raises(ValidationError):
+        Settings(EXTRACT_SLICES="0")